@@ -2,6 +2,8 @@ import os
 import sys
 import logging
 
+from src.app.models.database import app_data_path
+
 # Enhanced debug output system
 class DebugConsole:
     @staticmethod
@@ -27,7 +29,8 @@ if getattr(sys, 'frozen', False):
             root_logger.removeHandler(handler)
 
 # Configure logging to file only
-log_dir = os.path.join(os.getenv('APPDATA'), 'Game Screenshot Viewer', 'Logs')
+APP_DATA_DIR = app_data_path()
+log_dir = os.path.join(APP_DATA_DIR, 'Logs')
 os.makedirs(log_dir, exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,  # Reduced from DEBUG to minimize logs
@@ -37,20 +40,54 @@ logging.basicConfig(
 
 import sys
 import datetime
+import time
+from collections import deque
 import json
-import requests
 import subprocess
 import ctypes
-import glob
+import multiprocessing
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                            QListWidget, QLabel, QScrollArea, QListWidgetItem,
+                            QListView, QLabel, QScrollArea,
                             QPushButton, QHBoxLayout, QLineEdit, QMessageBox,
-                            QSplitter, QTabWidget, QFrame, QProgressBar, QComboBox,
-                            QSizePolicy)
+                            QSplitter, QTabWidget, QFrame, QComboBox,
+                            QSizePolicy, QDateEdit, QDoubleSpinBox)
 from PyQt6.QtGui import (QPixmap, QImage, QIcon, QPalette, QColor, QFont, 
                         QCursor, QMovie, QTransform, QGuiApplication)
 from PyQt6.QtCore import (Qt, QSize, QTimer, QPropertyAnimation, QPoint, 
-                         pyqtProperty, QEasingCurve, QRect)
+                         pyqtProperty, QEasingCurve, QRect, QThreadPool, QDate, QDateTime, QTime)
+from src.app.gui.name_resolver import GameNameResolver, unknown_game_name
+from src.app.gui.library_scan import LibraryScanSignals, LibraryScanTask
+from src.app.gui.duplicate_scan import DuplicateScanSignals, DuplicateScanTask
+from src.app.gui.duplicates_view import DuplicatesWindow
+from src.app.gui.screenshot_watcher import ScreenshotWatcher
+from src.app.gui.screenshot_model import PATH_ROLE, ScreenshotModel, ScreenshotProxyModel
+from src.app.gui.update_scheduler import FILTER, REPOPULATE, SORT_GAMES, SORT_SCREENSHOTS, UpdateScheduler
+from src.app.gui.image_cache import DEFAULT_MAX_BYTES as DEFAULT_IMAGE_CACHE_BYTES, DecodedImageCache
+from src.app.gui.tiled_viewer import TiledImageView
+from src.app.gui.thumbnail_loader import THUMBNAIL_SIZE, ThumbnailLoader, placeholder_icon
+from src.app.models.game_name_store import BASELINE, CUSTOM, FETCHED, GameNameStore
+from src.app.models.screenshot_catalog import ScreenshotCatalog
+from src.app.models.screenshot_filter import ScreenshotFilter
+from src.app.models.screenshot_index import GameStats, ScreenshotIndex
+from src.app.utils.image_probe import probe_dimensions
+from src.app.utils.screenshot_scanner import default_library_roots, unique_roots, userdata_folders
+from src.app.utils.app_list_import import update_app_list
+from src.app.utils.steam_api import default_client
+from src.app.utils.thumbnail_cache import DEFAULT_MAX_BYTES, ThumbnailCache
+
+# Rows inserted per event-loop tick, and minimum seconds between progress updates
+INSERT_BATCH_SIZE = 300
+PROGRESS_INTERVAL = 0.1
+
+# Quiet period after the last preview resize before it is re-rendered smoothly
+PREVIEW_RESIZE_DEBOUNCE_MS = 120
+
+# Screenshots decoded ahead on each side of the selection
+PREFETCH_NEIGHBORS = 3
+
+# How often staged game name changes are written to disk
+GAME_DB_FLUSH_INTERVAL_MS = 2000
+RANGE_FILTER_MIN_DATE = QDate(2000, 1, 1)  # Shown as "Any"
 
 def set_window_theme(window):
     """Set dark theme for Windows title bar"""
@@ -75,106 +112,6 @@ def set_window_theme(window):
         except Exception as e:
             print(f"Error setting window theme: {e}")
 
-class SteamProgressBar(QProgressBar):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setFixedSize(300, 6)  # Steam-like thin progress bar
-        self.setTextVisible(False)
-        self.setStyleSheet("""
-            QProgressBar {
-                background-color: #1b2838;
-                border: none;
-                border-radius: 3px;
-            }
-            QProgressBar::chunk {
-                background-color: #66c0f4;
-                border-radius: 3px;
-            }
-        """)
-
-class LoadingOverlay(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
-        
-        # Create layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Create container widget with background
-        self.container = QWidget()
-        self.container.setStyleSheet("""
-            QWidget {
-                background-color: #1b2838;
-                border: 2px solid #66c0f4;
-                border-radius: 10px;
-            }
-        """)
-        self.container.setFixedSize(400, 100)
-        container_layout = QVBoxLayout(self.container)
-        container_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Loading text
-        self.loading_text = QLabel("Loading Screenshots...")
-        self.loading_text.setStyleSheet("""
-            color: #66c0f4;
-            font-family: "Motiva Sans", Arial, Helvetica, sans-serif;
-            font-size: 14px;
-            margin-bottom: 10px;
-        """)
-        self.loading_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Progress bar
-        self.progress_bar = SteamProgressBar()
-        
-        container_layout.addWidget(self.loading_text)
-        container_layout.addWidget(self.progress_bar, 0, Qt.AlignmentFlag.AlignCenter)
-        
-        # Add container to a centered layout
-        center_layout = QHBoxLayout()
-        center_layout.addStretch()
-        center_layout.addWidget(self.container)
-        center_layout.addStretch()
-        
-        # Add vertical centering
-        layout.addStretch()
-        layout.addLayout(center_layout)
-        layout.addStretch()
-        
-        # Set semi-transparent dark background
-        self.setStyleSheet("""
-            LoadingOverlay {
-                background-color: rgba(0, 0, 0, 180);
-            }
-        """)
-    
-    def set_progress(self, value, total):
-        self.progress_bar.setMaximum(total)
-        self.progress_bar.setValue(value)
-        self.loading_text.setText(f"Loading Screenshots... ({value}/{total})")
-        QApplication.processEvents()  # Force UI update
-    
-    def center_in_parent(self):
-        if self.parentWidget():
-            parent_rect = self.parentWidget().rect()
-            self.setGeometry(parent_rect)
-            
-            # Calculate center position for container
-            container_x = (parent_rect.width() - self.container.width()) // 2
-            container_y = (parent_rect.height() - self.container.height()) // 2
-            self.container.move(container_x, container_y)
-    
-    def showEvent(self, event):
-        super().showEvent(event)
-        self.raise_()  # Ensure overlay stays on top
-        self.center_in_parent()
-    
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self.center_in_parent()
-
 class GameNameEditor(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -268,10 +205,6 @@ class SteamGameDatabase:
         # Set up logging
         self.logger = logging.getLogger('SteamGameDatabase')
         
-        self.games = {}
-        self.custom_games = {}
-        self.pending_updates = set()  # Track new game IDs for batch updates
-        
         # Determine if we're running in a bundled exe
         if getattr(sys, 'frozen', False):
             # Running in a bundle
@@ -302,179 +235,67 @@ class SteamGameDatabase:
         self.logger.debug(f"Custom cache file path: {self.custom_cache_file}")
         self.logger.debug(f"Baseline cache path: {self.baseline_cache}")
         
-        # Load baseline data first
-        self.load_baseline_cache()
-        # Then load user-specific cache which may override baseline data
-        self.load_cache()
-        self.load_custom_cache()
+        # Names are looked up in an indexed store instead of being loaded up front; it lives
+        # with the other per-user databases, never next to the sources
+        self.store = GameNameStore(app_data_path('game_names.db'))
+        self.import_json_caches()
 
-    def load_baseline_cache(self):
-        """Load the baseline cache that was included with the build"""
-        try:
-            if os.path.exists(self.baseline_cache):
-                with open(self.baseline_cache, 'r', encoding='utf-8') as f:
-                    baseline_games = json.load(f)
-                    self.games.update(baseline_games)
-                    self.logger.debug(f"Loaded {len(baseline_games)} games from baseline cache")
-            if os.path.exists(self.baseline_custom):
-                with open(self.baseline_custom, 'r', encoding='utf-8') as f:
-                    baseline_custom = json.load(f)
-                    self.custom_games.update(baseline_custom)
-                    self.logger.debug(f"Loaded {len(baseline_custom)} custom games from baseline")
-        except Exception as e:
-            self.logger.error(f"Error loading baseline cache: {e}")
+    def import_json_caches(self):
+        """Bring the shipped baseline and any legacy JSON caches into the name store"""
+        self.store.import_json(BASELINE, self.baseline_cache, replace=True)
+        # User files first: the store keeps the first name it sees for a custom ID
+        if self.custom_cache_file != self.baseline_custom:
+            self.store.import_json(CUSTOM, self.custom_cache_file)
+        self.store.import_json(CUSTOM, self.baseline_custom)
+        if self.cache_file != self.baseline_cache:
+            self.store.import_json(FETCHED, self.cache_file)
 
-    def load_cache(self):
-        """Load game data from cache file"""
-        try:
-            if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    self.games = json.load(f)
-                    self.logger.debug(f"Loaded {len(self.games)} games from cache")
-                    return True
-        except Exception as e:
-            self.logger.error(f"Error loading cache: {e}")
-            self.games = {}
-        return False
+    def flush(self):
+        """Write staged name changes to disk; called on a timer and at shutdown"""
+        self.store.flush()
 
-    def save_cache(self):
-        """Save game data to cache file"""
-        try:
-            cache_dir = os.path.dirname(self.cache_file)
-            if not os.path.exists(cache_dir):
-                os.makedirs(cache_dir)
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.games, f, ensure_ascii=False, indent=2)
-            self.logger.debug(f"Saved {len(self.games)} games to cache")
-        except Exception as e:
-            self.logger.error(f"Error saving cache: {e}")
+    def close(self):
+        self.logger.debug(f"Game name writes: {self.store.write_stats()}")
+        self.store.close()
 
-    def load_custom_cache(self):
-        """Load custom game names from cache file"""
+    def update_database(self, client=None):
+        """Apply the latest Steam app list, downloading it only if it changed"""
         try:
-            if os.path.exists(self.custom_cache_file):
-                with open(self.custom_cache_file, 'r', encoding='utf-8') as f:
-                    self.custom_games = json.load(f)
-                    self.logger.debug(f"Loaded {len(self.custom_games)} custom game names")
+            self.store.flush()
+            update_app_list(client or default_client(), self.store)
+            return True
         except Exception as e:
-            self.logger.error(f"Error loading custom cache: {e}")
-            self.custom_games = {}
-
-    def save_custom_cache(self):
-        """Save custom game names to cache file"""
-        try:
-            custom_cache_dir = os.path.dirname(self.custom_cache_file)
-            if not os.path.exists(custom_cache_dir):
-                os.makedirs(custom_cache_dir)
-            with open(self.custom_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.custom_games, f, ensure_ascii=False, indent=2)
-            self.logger.debug(f"Saved {len(self.custom_games)} custom game names")
-        except Exception as e:
-            self.logger.error(f"Error saving custom cache: {e}")
-
-    def update_database(self):
-        """Fetch latest game list from Steam API"""
-        try:
-            response = requests.get('https://api.steampowered.com/ISteamApps/GetAppList/v2/', timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                new_games = {str(app['appid']): app['name'] for app in data['applist']['apps']}
-                
-                # Update only if we have new data
-                if new_games:
-                    self.games.update(new_games)
-                    self.save_cache()
-                return True
-        except (requests.RequestException, Exception) as e:
             self.logger.error(f"Error updating database (working offline): {e}")
         return False
 
-    def queue_update_for_id(self, app_id):
-        """Queue a game ID for future update"""
-        if app_id not in self.games and app_id not in self.custom_games:
-            self.pending_updates.add(str(app_id))
-            # Try to update if we have enough pending updates
-            if len(self.pending_updates) >= 10:
-                self.process_pending_updates()
-
-    def process_pending_updates(self):
-        """Process any pending game ID updates"""
-        if not self.pending_updates:
-            return
-
-        try:
-            # Convert set to list for string joining
-            ids = list(self.pending_updates)
-            # Steam Web API for batch game details
-            url = f"https://store.steampowered.com/api/appdetails?appids={','.join(ids)}"
-            response = requests.get(url, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                updated = False
-                
-                for app_id in ids:
-                    if app_id in data and data[app_id].get('success'):
-                        name = data[app_id]['data'].get('name')
-                        if name:
-                            self.games[app_id] = name
-                            updated = True
-                
-                if updated:
-                    self.save_cache()
-                
-                # Clear processed IDs
-                self.pending_updates.clear()
-                
-        except (requests.RequestException, Exception) as e:
-            self.logger.error(f"Error processing pending updates (working offline): {e}")
+    def known_name(self, app_id):
+        """Name for the app from the store (custom, fetched or baseline), or None"""
+        return self.store.get(str(app_id))
 
     def get_game_name(self, app_id):
-        """Get game name from app ID"""
+        """Get game name from app ID; never touches the network"""
         app_id = str(app_id)
-        self.logger.debug(f"Looking up game name for ID: {app_id}")
-        
-        # Check custom names first
-        if app_id in self.custom_games:
-            self.logger.debug(f"Found custom name for {app_id}: {self.custom_games[app_id]}")
-            return self.custom_games[app_id]
-        
-        # Check main database
-        if app_id in self.games:
-            self.logger.debug(f"Found cached name for {app_id}: {self.games[app_id]}")
-            return self.games[app_id]
-        
-        # Try to get name from Steam API
-        try:
-            url = f"https://store.steampowered.com/api/appdetails?appids={app_id}"
-            response = requests.get(url, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get(app_id, {}).get('success'):
-                    name = data[app_id]['data'].get('name')
-                    if name:
-                        self.logger.debug(f"Found name from API for {app_id}: {name}")
-                        self.games[app_id] = name
-                        self.save_cache()
-                        return name
-        except Exception as e:
-            self.logger.error(f"Error fetching game name from API: {e}")
-        
-        # Queue for update if not found
-        self.queue_update_for_id(app_id)
-        
-        unknown_name = f"Unknown Game (ID: {app_id})"
-        self.logger.debug(f"Using fallback name: {unknown_name}")
-        return unknown_name
+        name = self.known_name(app_id)
+        if name:
+            return name
+        # GameNameResolver looks unknown IDs up in the background
+        self.logger.debug(f"No name known for {app_id}")
+        return unknown_game_name(app_id)
+
+    def set_fetched_name(self, app_id, name):
+        self.store.stage(FETCHED, str(app_id), name)
+
+    def lookup_retry_after(self, app_id):
+        return self.store.retry_after(app_id)
+
+    def set_lookup_failed(self, app_id, retry_after):
+        """Remember a failed lookup so it is not retried before ``retry_after``"""
+        self.store.stage_failure(app_id, retry_after)
 
     def set_custom_game_name(self, app_id, name):
         """Set a custom name for a game"""
         app_id = str(app_id)
-        self.custom_games[app_id] = name
-        self.save_custom_cache()
-        # Remove from pending updates if it was queued
-        self.pending_updates.discard(app_id)
+        self.store.stage(CUSTOM, app_id, name)
 
 class LoadingSpinner(QLabel):
     def __init__(self, parent=None):
@@ -592,10 +413,10 @@ class FullScreenPreview(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create the image label
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(self.image_label)
+        # Tiled view: decodes only the visible part of the image at the current zoom
+        self.image_view = TiledImageView()
+        self.image_view.close_requested.connect(self.close_preview)
+        layout.addWidget(self.image_view)
         
         # Style the widget
         self.setStyleSheet("""
@@ -606,22 +427,21 @@ class FullScreenPreview(QWidget):
                 background: transparent;
             }
         """)
-        
-        # Connect click event
-        self.mousePressEvent = self.close_preview
     
-    def show_image(self, image_path):
+    def show_image(self, image_path, size=QSize(), overview=QImage()):
         # Get screen geometry
         screen = QGuiApplication.primaryScreen().geometry()
         self.setGeometry(screen)
         
-        # Load and display image at original size
-        pixmap = QPixmap(image_path)
-        self.image_label.setPixmap(pixmap)
+        # Starts fitted to the screen; tiles are decoded as the user zooms in
+        self.image_view.set_image(image_path, size, overview)
         
         self.showFullScreen()
+        self.image_view.setFocus()
     
-    def close_preview(self, event):
+    def close_preview(self):
+        # Release the decoded tiles along with the window
+        self.image_view.clear()
         self.close()
 
 class Toast(QWidget):
@@ -691,8 +511,84 @@ class SteamScreenshotsViewer(QMainWindow):
         
         # Initialize attributes
         self.current_screenshot = None  # Track selected screenshot
+        
+        # Decoded preview of the selected screenshot, reused while it stays selected
+        self.preview_source = QImage()
+        self.preview_source_path = None
+        self.preview_resize_timer = QTimer(self)
+        self.preview_resize_timer.setSingleShot(True)
+        self.preview_resize_timer.setInterval(PREVIEW_RESIZE_DEBOUNCE_MS)
+        self.preview_resize_timer.timeout.connect(self.on_preview_resize_settled)
         self.game_db = SteamGameDatabase()
         self.game_tabs = {}
+        self.game_names = {}  # app_id -> name shown on its tab, for sorting without reading tab text
+        
+        # Name changes are batched in memory and written in one transaction
+        self.game_db_flush_timer = QTimer(self)
+        self.game_db_flush_timer.setInterval(GAME_DB_FLUSH_INTERVAL_MS)
+        self.game_db_flush_timer.timeout.connect(self.game_db.flush)
+        self.game_db_flush_timer.start()
+        
+        # One rate-limited, pooled client for every Steam API call
+        self.steam_client = default_client()
+        # Unknown app IDs are looked up off the GUI thread, one request per ID
+        self.name_resolver = GameNameResolver(self.game_db, self.steam_client, parent=self)
+        self.name_resolver.name_resolved.connect(self.on_game_name_resolved)
+        
+        # Thumbnails are decoded off the GUI thread, only for rows being painted
+        self.thumbnail_cache = ThumbnailCache()
+        self.thumbnail_loader = ThumbnailLoader(THUMBNAIL_SIZE, self.thumbnail_cache, self)
+        # Decoded screenshots shared by the preview, fullscreen view and clipboard
+        self.image_cache = DecodedImageCache(parent=self)
+        
+        # One shared model over the record index; the "All" tab and every game
+        # tab are proxies over it
+        self.screenshot_index = ScreenshotIndex()
+        self.screenshot_model = ScreenshotModel(self.screenshot_index, self.thumbnail_loader,
+                                                placeholder_icon(), parent=self)
+        # One search filter shared by the "All" tab and every game tab
+        self.screenshot_filter = ScreenshotFilter()
+        self.all_proxy = ScreenshotProxyModel(self.screenshot_model, row_filter=self.screenshot_filter, parent=self)
+        
+        # Records waiting to be inserted, a few hundred per event-loop tick
+        self.pending_records = deque()
+        self.inserted_count = 0
+        self.insert_total = 0
+        self.last_progress_update = 0.0
+        self.insert_timer = QTimer(self)
+        self.insert_timer.setInterval(0)
+        self.insert_timer.timeout.connect(self.insert_next_batch)
+        
+        # Sorts and rescans requested in the same tick run once, after insertion finishes
+        self.update_scheduler = UpdateScheduler(ready=lambda: not self.pending_records, parent=self)
+        self.update_scheduler.set_handler(REPOPULATE, self.start_background_scan)
+        self.update_scheduler.set_handler(FILTER, self.apply_filter)
+        self.update_scheduler.set_handler(SORT_GAMES, self.sort_game_tabs)
+        self.update_scheduler.set_handler(SORT_SCREENSHOTS, self.sort_screenshots)
+        
+        # Persistent catalog: render last session's library, then rescan in the background
+        self.screenshot_catalog = ScreenshotCatalog()
+        self.scan_in_progress = False
+        self.custom_library_roots = []  # Extra Steam folders from config.json
+        self.scan_signals = LibraryScanSignals()
+        self.scan_signals.folder_scanned.connect(self.on_folder_scanned)
+        self.scan_signals.finished.connect(self.on_background_scan_finished)
+        self.scan_signals.failed.connect(self.on_background_scan_failed)
+        
+        # Perceptual-hash duplicate finder, run on demand
+        self.duplicate_task = None
+        self.duplicates_window = None
+        self.duplicate_signals = DuplicateScanSignals()
+        self.duplicate_signals.progress.connect(self.on_duplicate_progress)
+        self.duplicate_signals.finished.connect(self.on_duplicates_found)
+        self.duplicate_signals.failed.connect(self.on_duplicate_scan_failed)
+        
+        # Folder watcher keeps the index current between scans
+        self.screenshot_watcher = ScreenshotWatcher(record_lookup=self.screenshot_index.get, parent=self)
+        self.screenshot_watcher.screenshots_added.connect(self.on_screenshots_added)
+        self.screenshot_watcher.screenshots_removed.connect(self.on_screenshots_removed)
+        self.screenshot_watcher.screenshots_renamed.connect(self.on_screenshots_renamed)
+        self.screenshot_watcher.folders_changed.connect(self.start_background_scan)
         
         # Window setup
         set_window_theme(self)
@@ -764,10 +660,28 @@ class SteamScreenshotsViewer(QMainWindow):
             }
         """)
         game_sort_layout.addWidget(self.screenshot_sort_combo)
-        self.screenshot_sort_combo.currentIndexChanged.connect(self.sort_screenshots)
-        self.game_sort_combo.currentIndexChanged.connect(self.sort_game_tabs)
+        self.screenshot_sort_combo.currentIndexChanged.connect(
+            lambda: self.update_scheduler.request(SORT_SCREENSHOTS))
+        self.game_sort_combo.currentIndexChanged.connect(
+            lambda: self.update_scheduler.request(SORT_GAMES))
         
         header_layout.addWidget(game_sort_group)
+        
+        # Search over file names, game names and app IDs
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search screenshots, games or app IDs")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setFixedWidth(240)
+        self.search_edit.setStyleSheet("""
+            QLineEdit {
+                color: #c7d5e0;
+                background-color: #2a475e;
+                border: 1px solid #66c0f4;
+                padding: 2px;
+            }
+        """)
+        self.search_edit.textChanged.connect(self.on_search_changed)
+        header_layout.addWidget(self.search_edit)
 
         # Status label
         self.status_label = QLabel("Ready")
@@ -791,6 +705,12 @@ class SteamScreenshotsViewer(QMainWindow):
         """)
         self.refresh_button.clicked.connect(self.refresh_screenshots)
         header_layout.addWidget(self.refresh_button)
+        
+        # Duplicate finder
+        self.duplicates_button = QPushButton("Duplicates")
+        self.duplicates_button.setStyleSheet(self.refresh_button.styleSheet())
+        self.duplicates_button.clicked.connect(self.find_duplicates)
+        header_layout.addWidget(self.duplicates_button)
 
         # Create main splitter
         self.main_splitter = QSplitter(Qt.Orientation.Vertical)
@@ -813,22 +733,17 @@ class SteamScreenshotsViewer(QMainWindow):
         self.tab_widget = QTabWidget()
         screenshots_layout.addWidget(self.tab_widget)
         
-        # Create the "All" tab with a list widget
-        self.list_widget = QListWidget()
-        self.list_widget.setViewMode(QListWidget.ViewMode.IconMode)
-        self.list_widget.setIconSize(QSize(200, 200))
-        self.list_widget.setSpacing(10)
-        self.list_widget.setMovement(QListWidget.Movement.Static)
-        self.list_widget.setResizeMode(QListWidget.ResizeMode.Adjust)
-        self.list_widget.setMinimumHeight(220)  # Height of one item plus padding
-        self.list_widget.itemClicked.connect(self.on_screenshot_clicked)
-        
-        # Add the list widget to a tab
+        # Create the "All" tab with a list view
+        self.list_view = self.create_screenshot_view(self.all_proxy)
+        self.list_view.setMinimumHeight(220)  # Height of one item plus padding
+        
+        # Add the list view to a tab
         all_tab = QWidget()
         all_layout = QVBoxLayout(all_tab)
         all_layout.setContentsMargins(0, 0, 0, 0)
-        all_layout.addWidget(self.list_widget)
+        all_layout.addWidget(self.list_view)
         self.tab_widget.addTab(all_tab, "All")
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         # Create preview and details container
         self.preview_container = QWidget()
@@ -998,15 +913,12 @@ class SteamScreenshotsViewer(QMainWindow):
         
         # Add splitter to main layout
         self.main_layout.addWidget(header_widget)
+        self.main_layout.addWidget(self.create_range_filter_bar())
         self.main_layout.addWidget(self.main_splitter)
         
         # Initially hide preview container
         self.preview_container.hide()
         
-        # Create loading overlay
-        self.loading_overlay = LoadingOverlay(self)
-        self.loading_overlay.hide()  # Ensure it starts hidden
-        
         # Create full screen preview window
         self.full_screen_preview = FullScreenPreview()
         
@@ -1029,15 +941,15 @@ class SteamScreenshotsViewer(QMainWindow):
                 background: #66c0f4;
                 color: #1b2838;
             }
-            QListWidget {
+            QListView {
                 background-color: #1b2838;
                 border: none;
             }
-            QListWidget::item {
+            QListView::item {
                 background-color: #2a475e;
                 border-radius: 3px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #2a475e;
                 border: 2px solid #66c0f4;
             }
@@ -1056,7 +968,7 @@ class SteamScreenshotsViewer(QMainWindow):
         """)
         
         # Schedule screenshot loading
-        QTimer.singleShot(100, lambda: self.populate_screenshots(self.load_screenshot_paths()))
+        QTimer.singleShot(100, self.load_library)
         
         # Connect resize event
         self.preview_label.resizeEvent = self.on_preview_resize
@@ -1066,8 +978,9 @@ class SteamScreenshotsViewer(QMainWindow):
         
         self.load_preferences()
         
-        # Initial sort after everything is initialized
-        self.sort_game_tabs()
+        # Initial sort after everything is initialized; merges with the
+        # requests load_preferences just made by setting the combos
+        self.update_scheduler.request(SORT_GAMES, SORT_SCREENSHOTS)
     
     def save_filename(self):
         if not self.current_screenshot:
@@ -1131,23 +1044,15 @@ class SteamScreenshotsViewer(QMainWindow):
                 return
                 
             os.rename(self.current_screenshot, new_path)
-            self.current_screenshot = new_path
             
-            # Update item data
-            current_item = self.list_widget.currentItem()
-            if current_item:
-                current_item.setData(Qt.ItemDataRole.UserRole, new_path)
-                
-                try:
-                    game_id = new_path.split("remote\\")[1].split("\\")[0]
-                    if game_id in self.game_tabs:
-                        game_list = self.game_tabs[game_id]
-                        for i in range(game_list.count()):
-                            if game_list.item(i).data(Qt.ItemDataRole.UserRole) == self.current_screenshot:
-                                game_list.item(i).setData(Qt.ItemDataRole.UserRole, new_path)
-                                break
-                except Exception:
-                    pass
+            # Update the shared model; every tab's proxy follows it
+            self.screenshot_model.rename_path(self.current_screenshot, new_path)
+            self.screenshot_catalog.rename(self.current_screenshot, new_path)
+            self.screenshot_watcher.forget(self.current_screenshot)
+            self.screenshot_watcher.remember(new_path)
+            if self.preview_source_path == self.current_screenshot:
+                self.preview_source_path = new_path
+            self.current_screenshot = new_path
             
             toast = Toast(self)
             toast.show_message("Filename saved successfully!")
@@ -1165,28 +1070,69 @@ class SteamScreenshotsViewer(QMainWindow):
             subprocess.Popen(['mspaint', self.current_screenshot])
     
     def on_preview_resize(self, event):
-        if self.current_screenshot:
-            self.update_preview(self.current_screenshot)
+        # Cheap rescale of the decoded image now, a proper render once resizing stops
+        if self.current_screenshot and not self.preview_source.isNull():
+            self.render_preview(Qt.TransformationMode.FastTransformation)
+            self.preview_resize_timer.start()
         event.accept()
     
+    def on_preview_resize_settled(self):
+        if not self.current_screenshot:
+            return
+        # A cache hit unless the label outgrew the kept decode
+        self.load_preview_source(self.current_screenshot)
+        self.render_preview()
+    
+    def preview_target_size(self):
+        """Preview label size in device pixels"""
+        ratio = self.preview_label.devicePixelRatioF()
+        size = self.preview_label.size()
+        return QSize(max(1, round(size.width() * ratio)), max(1, round(size.height() * ratio)))
+    
+    def load_preview_source(self, screenshot_path):
+        """Fetch the selected screenshot at label size from the shared image cache"""
+        image = self.image_cache.get(screenshot_path, self.preview_target_size())
+        if image.isNull():
+            raise Exception("Failed to load image")
+        self.preview_source = image
+        self.preview_source_path = screenshot_path
+    
+    def prefetch_neighbors(self, index):
+        """Decode the screenshots around ``index`` in its view's current sort order"""
+        model = index.model()
+        if model is None:
+            return
+        row = index.row()
+        paths = []
+        for distance in range(1, PREFETCH_NEIGHBORS + 1):
+            for neighbor in (row + distance, row - distance):
+                if 0 <= neighbor < model.rowCount():
+                    paths.append(model.index(neighbor, 0).data(PATH_ROLE))
+        self.image_cache.prefetch(paths, self.preview_target_size())
+    
+    def clear_preview_source(self):
+        """Drop the kept decode once nothing is selected"""
+        self.preview_resize_timer.stop()
+        self.preview_source = QImage()
+        self.preview_source_path = None
+    
+    def render_preview(self, mode=Qt.TransformationMode.SmoothTransformation):
+        """Scale the kept decode into the preview label"""
+        image = self.preview_source.scaled(self.preview_target_size(), Qt.AspectRatioMode.KeepAspectRatio, mode)
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.preview_label.devicePixelRatioF())
+        self.preview_label.setPixmap(pixmap)
+    
     def update_preview(self, screenshot_path):
         if not screenshot_path or not os.path.exists(screenshot_path):
+            self.clear_preview_source()
             self.preview_label.clear()
             return
         
         try:
-            pixmap = QPixmap(screenshot_path)
-            if pixmap.isNull():
-                raise Exception("Failed to load image")
-            
-            # Scale pixmap to fit within the frame while maintaining aspect ratio
-            scaled_pixmap = pixmap.scaled(
-                self.preview_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            
-            self.preview_label.setPixmap(scaled_pixmap)
+            # Decoded straight at the label size, or already prefetched
+            self.load_preview_source(screenshot_path)
+            self.render_preview()
             
             # Create fade-in animation
             fade_effect = QPropertyAnimation(self.preview_label, b"windowOpacity")
@@ -1199,21 +1145,36 @@ class SteamScreenshotsViewer(QMainWindow):
             self.logger.error(f"Error updating preview: {e}")
             self.preview_label.setText("Preview unavailable")
 
-    def on_screenshot_clicked(self, item):
-        screenshot_path = item.data(Qt.ItemDataRole.UserRole)
+    def on_current_changed(self, view, current):
+        """Show screenshots reached with the arrow keys"""
+        # Mouse presses also move the current index; clicked handles those
+        if not current.isValid() or not view.hasFocus() or QApplication.mouseButtons() != Qt.MouseButton.NoButton:
+            return
+        if current.data(PATH_ROLE) != self.current_screenshot:
+            self.on_screenshot_clicked(current)
+
+    def on_screenshot_clicked(self, index):
+        screenshot_path = index.data(PATH_ROLE)
         
         # If clicking the same item, unselect it
         if screenshot_path == self.current_screenshot:
-            self.list_widget.clearSelection()
+            for view in self.screenshot_views():
+                view.clearSelection()
             self.preview_container.hide()
             self.current_screenshot = None
+            self.clear_preview_source()
             return
         
-        # Check if file still exists
-        if not os.path.exists(screenshot_path):
+        # Check if file still exists (one stat, which also picks up edits)
+        known = self.screenshot_index.get(screenshot_path)
+        known_stat = (known.mtime, known.size) if known else None
+        record = self.screenshot_index.refresh(screenshot_path)
+        if record is None or (record.mtime, record.size) != known_stat:
+            self.image_cache.invalidate(screenshot_path)
+        if record is None:
             QMessageBox.warning(self, "File Not Found", 
                               "The screenshot file was not found. It may have been moved or deleted.")
-            self.remove_missing_screenshot(item)
+            self.remove_missing_screenshot(screenshot_path)
             return
         
         self.current_screenshot = screenshot_path
@@ -1227,25 +1188,29 @@ class SteamScreenshotsViewer(QMainWindow):
             
             # Update preview with animation
             self.update_preview(screenshot_path)
+            self.prefetch_neighbors(index)
             
             # Update details
             try:
                 # Get game name
-                game_id = screenshot_path.split("remote\\")[1].split("\\")[0]
-                game_name = self.game_db.get_game_name(game_id)
+                game_id = record.app_id
+                game_name = self.name_resolver.resolve(game_id)
                 self.update_game_name_display(game_id, game_name)
                 
                 # Update filename
-                self.filename_edit.setText(os.path.basename(screenshot_path))
+                self.filename_edit.setText(record.name)
                 
-                # Get file info
-                file_info = os.stat(screenshot_path)
-                date = datetime.datetime.fromtimestamp(file_info.st_mtime)
-                size = file_info.st_size / (1024 * 1024)  # Convert to MB
+                # File info comes from the index
+                date = datetime.datetime.fromtimestamp(record.mtime)
+                size = record.size / (1024 * 1024)  # Convert to MB
                 
-                # Get image resolution
-                image = QImage(screenshot_path)
-                resolution = f"{image.width()} x {image.height()}"
+                # Resolution is read from the file header, never by decoding it
+                if not record.width:
+                    width, height = probe_dimensions(screenshot_path) or (0, 0)
+                    if width:
+                        self.screenshot_index.set_dimensions(screenshot_path, width, height)
+                        self.screenshot_catalog.update_dimensions(screenshot_path, width, height)
+                resolution = f"{record.width} x {record.height}" if record.width else "Unknown"
                 
                 # Update labels
                 self.date_label.setText(f"Date: {date.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -1258,23 +1223,208 @@ class SteamScreenshotsViewer(QMainWindow):
             # Hide preview container if no screenshot is selected
             self.preview_container.hide()
 
+    def load_library(self):
+        """Show the catalogued library right away, then look for changes"""
+        records = self.screenshot_catalog.load_records()
+        if records:
+            self.populate_screenshots(records)
+        self.start_background_scan()
+
+    def start_background_scan(self):
+        """Rescan folders whose mtime changed since the catalog was written"""
+        if self.scan_in_progress:
+            return
+        roots = self.library_roots()
+        if not userdata_folders(roots):
+            self.status_label.setText("Steam userdata folder not found!")
+            return
+        self.scan_in_progress = True
+        self.status_label.setText("Checking for new screenshots...")
+        QThreadPool.globalInstance().start(
+            LibraryScanTask(roots, self.screenshot_catalog.folder_mtimes(), self.scan_signals))
+
+    def library_roots(self):
+        """Steam folders to scan: the detected installs plus any configured in config.json"""
+        return unique_roots(default_library_roots() + self.custom_library_roots)
+
+    def on_background_scan_finished(self, result):
+        self.scan_in_progress = False
+        # Changed folders were already applied as they streamed in
+        self.screenshot_catalog.apply_scan(result)
+        self.remove_scanned_folders(result.removed)
+        self.watch_screenshot_folders(result.folder_mtimes)
+        if not self.pending_records:
+            self.status_label.setText(f"Found {len(self.screenshot_index)} screenshots")
+
+    def on_background_scan_failed(self, message):
+        self.scan_in_progress = False
+        self.status_label.setText(f"Scan failed: {message}")
+
+    def find_duplicates(self):
+        """Hash every screenshot in the background and list the duplicate groups"""
+        if self.duplicate_task is not None:
+            return
+        if not len(self.screenshot_index):
+            self.status_label.setText("No screenshots to check for duplicates")
+            return
+        self.duplicates_button.setEnabled(False)
+        self.status_label.setText("Finding duplicates...")
+        self.duplicate_task = DuplicateScanTask(self.screenshot_index.records, self.duplicate_signals)
+        QThreadPool.globalInstance().start(self.duplicate_task)
+
+    def on_duplicate_progress(self, done, total):
+        self.status_label.setText(f"Finding duplicates: {done} of {total} screenshots hashed")
+
+    def on_duplicates_found(self, groups):
+        self.duplicate_task = None
+        self.duplicates_button.setEnabled(True)
+        self.status_label.setText(f"Found {len(groups)} groups of duplicate screenshots")
+        if self.duplicates_window is None:
+            self.duplicates_window = DuplicatesWindow(self)
+            self.duplicates_window.screenshot_activated.connect(self.show_screenshot)
+        self.duplicates_window.set_groups(groups, self.screenshot_index, self.name_resolver.resolve)
+        self.duplicates_window.show()
+        self.duplicates_window.raise_()
+
+    def on_duplicate_scan_failed(self, message):
+        self.duplicate_task = None
+        self.duplicates_button.setEnabled(True)
+        self.status_label.setText(f"Duplicate search failed: {message}")
+
+    def show_screenshot(self, path):
+        """Select a screenshot in the "All" tab and preview it"""
+        row = self.screenshot_index.row_for_path(path)
+        if row is None:
+            return
+        proxy_index = self.all_proxy.mapFromSource(self.screenshot_model.index(row))
+        if not proxy_index.isValid():
+            # Hidden by the search or range filters
+            self.search_edit.clear()
+            self.clear_range_filters()
+            self.update_scheduler.run()
+            proxy_index = self.all_proxy.mapFromSource(self.screenshot_model.index(row))
+        self.tab_widget.setCurrentIndex(0)
+        self.list_view.setCurrentIndex(proxy_index)
+        self.list_view.scrollTo(proxy_index)
+        if path != self.current_screenshot:
+            self.on_screenshot_clicked(proxy_index)
+        self.activateWindow()
+
+    def on_folder_scanned(self, folder, records):
+        """Apply added, removed and modified files of one rescanned folder"""
+        app_id = os.path.basename(os.path.dirname(folder))
+        existing = {record.path: record for record in self.screenshot_index.game_records(app_id)
+                    if os.path.dirname(record.path) == folder}
+        scanned = {record.path for record in records}
+        if self.pending_records:
+            # Queued catalog records for this folder are superseded by the scan
+            self.pending_records = deque(r for r in self.pending_records if os.path.dirname(r.path) != folder)
+        
+        removed = [path for path in existing if path not in scanned]
+        added, modified = [], []
+        for record in records:
+            old = existing.get(record.path)
+            if old is None:
+                added.append(record)
+            elif old.mtime != record.mtime or old.size != record.size:
+                modified.append(record)
+        
+        if removed:
+            self.remove_screenshots(removed)
+        if modified:
+            self.screenshot_model.update_records(modified)
+            for record in modified:
+                self.image_cache.invalidate(record.path)
+        if added:
+            self.populate_screenshots(added)
+        if removed or modified:
+            self.schedule_sort()
+
+    def remove_scanned_folders(self, folders):
+        """Drop everything from screenshots folders that no longer exist"""
+        if not folders:
+            return
+        removed = [record.path for record in self.screenshot_index.records
+                   if os.path.dirname(record.path) in folders]
+        self.remove_screenshots(removed)
+        self.schedule_sort()
+
+    def watch_screenshot_folders(self, folders):
+        """Point the watcher at the folders of the last scan"""
+        known_paths = {}
+        for record in self.screenshot_index.records:
+            known_paths.setdefault(os.path.dirname(record.path), []).append(record.path)
+        self.screenshot_watcher.sync(
+            {folder: os.path.basename(os.path.dirname(folder)) for folder in folders}, known_paths)
+
+    def on_screenshots_added(self, records):
+        self.screenshot_catalog.add_records(records)
+        self.populate_screenshots(records)
+
+    def on_screenshots_removed(self, paths):
+        self.remove_screenshots(paths)
+        self.schedule_sort()
+        self.status_label.setText(f"Found {len(self.screenshot_index)} screenshots")
+
+    def on_screenshots_renamed(self, renames):
+        for old_path, record in renames:
+            new_path = record.path
+            self.screenshot_model.rename_path(old_path, new_path)
+            # Take the stat, dimensions and thumbnail the watcher just read for the new name
+            self.screenshot_model.update_records([record])
+            self.screenshot_catalog.rename(old_path, new_path)
+            self.screenshot_catalog.add_records([record])
+            self.thumbnail_cache.invalidate(old_path)
+            self.image_cache.invalidate(old_path)
+            if self.preview_source_path == old_path:
+                self.preview_source_path = new_path
+            if self.current_screenshot == old_path:
+                self.current_screenshot = new_path
+                self.filename_edit.setText(os.path.basename(new_path))
+
+    def remove_screenshots(self, paths):
+        """Drop screenshots from the model, catalog and caches, and any emptied tabs"""
+        emptied = {self.screenshot_index.get(path).app_id for path in paths if path in self.screenshot_index}
+        # Removing them from the shared model drops them from every tab
+        self.screenshot_model.remove_paths(paths)
+        self.screenshot_catalog.remove_paths(paths)
+        for path in paths:
+            self.thumbnail_cache.invalidate(path)
+            self.image_cache.invalidate(path)
+        for game_id in emptied:
+            if not self.screenshot_index.game_rows.get(game_id):
+                self.remove_game_tab(game_id)
+        if self.current_screenshot in paths:
+            self.preview_container.hide()
+            self.current_screenshot = None
+            self.clear_preview_source()
+
     def refresh_screenshots(self):
-        """Refresh the screenshots list"""
-        if hasattr(self, 'loading_overlay') and self.loading_overlay:
-            try:
-                self.loading_overlay.show()
-                self.list_widget.clear()
-                # Clear game tabs except "All"
-                while self.tab_widget.count() > 1:
-                    self.tab_widget.removeTab(1)
-                self.game_tabs.clear()
-                self.populate_screenshots(self.load_screenshot_paths())
-                
-                # Apply both sorting methods after refresh
-                self.sort_game_tabs()
-                self.sort_screenshots()
-            finally:
-                self.loading_overlay.hide()
+        """Rescan changed folders and apply only the differences"""
+        # Nothing is cleared, so scroll position, selection and tab order survive
+        self.update_scheduler.request(REPOPULATE)
+
+    def create_screenshot_view(self, model):
+        """Create an icon-grid view over one of the screenshot proxies"""
+        view = QListView()
+        view.setViewMode(QListView.ViewMode.IconMode)
+        view.setIconSize(THUMBNAIL_SIZE)
+        view.setSpacing(10)
+        view.setMovement(QListView.Movement.Static)
+        view.setResizeMode(QListView.ResizeMode.Adjust)
+        # Uniform sizes and batched layout keep the view from touching every row
+        view.setUniformItemSizes(True)
+        view.setLayoutMode(QListView.LayoutMode.Batched)
+        view.setBatchSize(500)
+        view.setModel(model)
+        view.clicked.connect(self.on_screenshot_clicked)
+        view.selectionModel().currentChanged.connect(
+            lambda current, previous, view=view: self.on_current_changed(view, current))
+        return view
+
+    def screenshot_views(self):
+        """The "All" view followed by every game view"""
+        return [self.list_view, *self.game_tabs.values()]
 
     def create_game_tab(self, game_id, game_name):
         """Create a new tab for a game with proper ID association"""
@@ -1288,13 +1438,9 @@ class SteamScreenshotsViewer(QMainWindow):
             DebugConsole.log(f"Tab already exists for {game_id}")
             return self.game_tabs[game_id]
             
-        # Create new list widget for the game
-        game_list = QListWidget()
-        game_list.setViewMode(QListWidget.ViewMode.IconMode)
-        game_list.setIconSize(QSize(200, 200))
-        game_list.setSpacing(10)
-        game_list.setMovement(QListWidget.Movement.Static)
-        game_list.itemClicked.connect(self.on_screenshot_clicked)
+        # Create a filtered view of the shared model for the game
+        game_list = self.create_screenshot_view(
+            ScreenshotProxyModel(self.screenshot_model, game_id, row_filter=self.screenshot_filter, parent=self))
         
         # Create container widget to hold the list
         container = QWidget()
@@ -1305,64 +1451,223 @@ class SteamScreenshotsViewer(QMainWindow):
         # Add tab and store reference
         tab_index = self.tab_widget.addTab(container, display_name)
         self.game_tabs[game_id] = game_list
+        self.game_names[game_id] = game_name
+        self.screenshot_index.set_game_name(game_id, game_name)
         
         DebugConsole.log(f"Created tab at index {tab_index} for {game_id}")
         
         return game_list
 
+    def add_screenshot_records(self, records):
+        """Add records to the shared model, creating game tabs as needed"""
+        for record in records:
+            if record.app_id not in self.game_tabs:
+                self.create_game_tab(record.app_id, self.name_resolver.resolve(record.app_id))
+        self.screenshot_model.add_records(records)
+
+    def on_game_name_resolved(self, game_id, game_name):
+        """Relabel a game's tab (and the details panel) once its name arrives"""
+        if game_id in self.game_tabs:
+            self.game_names[game_id] = game_name
+            self.screenshot_index.set_game_name(game_id, game_name)
+            tab_index = self.tab_widget.indexOf(self.game_tabs[game_id].parent())
+            if tab_index != -1:
+                self.tab_widget.setTabText(tab_index, game_name)
+        record = self.screenshot_index.get(self.current_screenshot) if self.current_screenshot else None
+        if record is not None and record.app_id == game_id:
+            self.update_game_name_display(game_id, game_name)
+        if self.game_sort_combo.currentText() in ("A to Z", "Z to A"):
+            self.schedule_sort()
+
+    def remove_game_tab(self, game_id):
+        """Drop the tab of a game that no longer has any screenshots"""
+        game_list = self.game_tabs.pop(game_id, None)
+        self.game_names.pop(game_id, None)
+        if game_list is None:
+            return
+        tab_index = self.tab_widget.indexOf(game_list.parent())
+        if tab_index != -1:
+            self.tab_widget.removeTab(tab_index)
+        # Proxies stay connected to the shared model until deleted
+        game_list.model().deleteLater()
+        game_list.parent().deleteLater()
+
     def populate_screenshots(self, screenshots):
-        """Populate list widgets with screenshots"""
+        """Queue screenshot records for batched insertion into the shared model"""
         DebugConsole.log(f"Populating {len(screenshots)} screenshots")
+        self.pending_records.extend(screenshots)
+        self.insert_total += len(screenshots)
+        if not self.insert_timer.isActive():
+            self.insert_timer.start()
+
+    def insert_next_batch(self):
+        """Insert one batch of queued records per event-loop tick"""
+        batch = []
+        while self.pending_records and len(batch) < INSERT_BATCH_SIZE:
+            batch.append(self.pending_records.popleft())
+        try:
+            self.add_screenshot_records(batch)
+        except Exception as e:
+            self.logger.error(f"Error adding screenshots: {e}")
+        self.inserted_count += len(batch)
+        
+        # Progress text is throttled; the rows themselves show up right away
+        now = time.monotonic()
+        if self.pending_records and now - self.last_progress_update >= PROGRESS_INTERVAL:
+            self.last_progress_update = now
+            self.status_label.setText(f"Loading Screenshots... ({self.inserted_count}/{self.insert_total})")
+        
+        if not self.pending_records:
+            self.insert_timer.stop()
+            self.inserted_count = self.insert_total = 0
+            self.status_label.setText(f"Found {len(self.screenshot_index)} screenshots")
+            self.logger.debug(f"Loaded {len(self.screenshot_index)} screenshots")
+            self.thumbnail_cache.save()
+            self.schedule_sort()
+
+    def create_range_filter_bar(self):
+        """Date and size range filters; each box shows "Any" at its lowest value"""
+        filter_widget = QWidget()
+        filter_widget.setFixedHeight(34)
+        filter_layout = QHBoxLayout(filter_widget)
+        filter_layout.setContentsMargins(5, 0, 5, 0)
+        filter_layout.setSpacing(5)
+        style = """
+            QDateEdit, QDoubleSpinBox {
+                color: #c7d5e0;
+                background-color: #2a475e;
+                border: 1px solid #66c0f4;
+                padding: 2px;
+            }
+        """
         
-        # Show loading overlay with progress
-        if hasattr(self, 'loading_overlay'):
-            self.loading_overlay.show()
-            self.loading_overlay.set_progress(0, len(screenshots))
-            QApplication.processEvents()  # Force UI update
-        
-        for i, screenshot in enumerate(screenshots, 1):
-            try:
-                # Update progress
-                if hasattr(self, 'loading_overlay'):
-                    self.loading_overlay.set_progress(i, len(screenshots))
-                
-                # Extract game_id from path
-                game_id = screenshot.split("remote\\")[1].split("\\")[0]
-                
-                # Create list item
-                item = QListWidgetItem()
-                pixmap = QPixmap(screenshot)
-                icon = QIcon(pixmap)
-                item.setIcon(icon)
-                item.setData(Qt.ItemDataRole.UserRole, screenshot)
-                self.list_widget.addItem(item)
-                
-                # Add to game tab
-                game_list = self.create_game_tab(game_id, self.game_db.get_game_name(game_id))
-                
-                # Create item for game tab
-                game_item = QListWidgetItem()
-                game_item.setIcon(icon)
-                game_item.setData(Qt.ItemDataRole.UserRole, screenshot)
-                game_list.addItem(game_item)
-            except Exception as e:
-                self.logger.error(f"Error adding to game tab: {e}")
-        
-        self.status_label.setText(f"Found {len(screenshots)} screenshots")
-        self.logger.debug(f"Loaded {len(screenshots)} screenshots")
-        
-        if hasattr(self, 'loading_overlay'):
-            self.loading_overlay.close()
-            
-        # Trigger sorting after population is complete
-        self.sort_game_tabs()
-        self.sort_screenshots()
+        def add_label(text):
+            label = QLabel(text)
+            label.setStyleSheet("color: #c7d5e0; font-size: 12px;")
+            filter_layout.addWidget(label)
+        
+        def date_edit():
+            edit = QDateEdit()
+            edit.setCalendarPopup(True)
+            edit.setDisplayFormat("yyyy-MM-dd")
+            edit.setMinimumDate(RANGE_FILTER_MIN_DATE)
+            edit.setSpecialValueText("Any")
+            edit.setDate(RANGE_FILTER_MIN_DATE)
+            edit.setFixedWidth(110)
+            edit.setStyleSheet(style)
+            edit.dateChanged.connect(self.on_range_filter_changed)
+            filter_layout.addWidget(edit)
+            return edit
+        
+        def size_edit():
+            edit = QDoubleSpinBox()
+            edit.setRange(0, 100000)
+            edit.setDecimals(1)
+            edit.setSuffix(" MB")
+            edit.setSpecialValueText("Any")
+            edit.setFixedWidth(100)
+            edit.setStyleSheet(style)
+            edit.valueChanged.connect(self.on_range_filter_changed)
+            filter_layout.addWidget(edit)
+            return edit
+        
+        add_label("Taken from:")
+        self.date_from_edit = date_edit()
+        add_label("to:")
+        self.date_to_edit = date_edit()
+        add_label("Size from:")
+        self.size_min_edit = size_edit()
+        add_label("to:")
+        self.size_max_edit = size_edit()
+        
+        clear_button = QPushButton("Clear")
+        clear_button.setStyleSheet("""
+            QPushButton {
+                color: #c7d5e0;
+                background-color: #2a475e;
+                border: 1px solid #66c0f4;
+                padding: 2px 8px;
+            }
+            QPushButton:hover {
+                background-color: #66c0f4;
+                color: #1b2838;
+            }
+        """)
+        clear_button.clicked.connect(self.clear_range_filters)
+        filter_layout.addWidget(clear_button)
+        filter_layout.addStretch(1)
+        return filter_widget
+
+    def on_range_filter_changed(self, *args):
+        def day_start(edit, days=0):
+            date = edit.date()
+            if date == edit.minimumDate():
+                return None
+            return QDateTime(date.addDays(days), QTime(0, 0)).toSecsSinceEpoch()
+        
+        def megabytes(edit):
+            return int(edit.value() * 1024 * 1024) if edit.value() > 0 else None
+        
+        # The end date is inclusive: anything before the following midnight
+        end = day_start(self.date_to_edit, 1)
+        self.set_range_filters((day_start(self.date_from_edit), None if end is None else end - 0.001),
+                               (megabytes(self.size_min_edit), megabytes(self.size_max_edit)))
+
+    def set_range_filters(self, date_range=(None, None), size_range=(None, None)):
+        """
+        Show only screenshots whose mtime and size fall in the given ranges.
+
+        Bounds are inclusive; None leaves that side open. Dates are seconds
+        since the epoch, sizes are bytes.
+        """
+        date_changed = self.screenshot_filter.set_date_range(*date_range)
+        size_changed = self.screenshot_filter.set_size_range(*size_range)
+        if date_changed or size_changed:
+            self.update_scheduler.request(FILTER)
+
+    def clear_range_filters(self):
+        for edit in (self.date_from_edit, self.date_to_edit):
+            edit.setDate(edit.minimumDate())
+        for edit in (self.size_min_edit, self.size_max_edit):
+            edit.setValue(edit.minimum())
+
+    def on_search_changed(self, text):
+        if self.screenshot_filter.set_query(text):
+            self.update_scheduler.request(FILTER)
+
+    def apply_filter(self):
+        """Re-filter the "All" tab and the visible game tab; hidden tabs catch up when shown"""
+        started = time.perf_counter()
+        current = self.tab_widget.currentWidget()
+        self.all_proxy.refilter()
+        for game_list in self.game_tabs.values():
+            if game_list.parent() is current:
+                game_list.model().refilter()
+            else:
+                game_list.model().filter_stale = True
+        if self.screenshot_filter.active:
+            matches = self.all_proxy.rowCount()
+            self.status_label.setText(f"{matches} of {len(self.screenshot_index)} screenshots match")
+        else:
+            self.status_label.setText(f"Found {len(self.screenshot_index)} screenshots")
+        DebugConsole.log(f"Filtered screenshots in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    def on_tab_changed(self, index):
+        widget = self.tab_widget.widget(index)
+        for game_list in self.game_tabs.values():
+            if game_list.parent() is widget:
+                if game_list.model().filter_stale:
+                    game_list.model().refilter()
+                break
+
+    def schedule_sort(self):
+        """Sort tabs and screenshots once nothing is left to insert"""
+        self.update_scheduler.request(SORT_GAMES, SORT_SCREENSHOTS)
 
     def copy_image(self):
         if self.current_screenshot:
             clipboard = QGuiApplication.clipboard()
-            pixmap = QPixmap(self.current_screenshot)
-            clipboard.setPixmap(pixmap)
+            clipboard.setImage(self.image_cache.get(self.current_screenshot))
             
             # Show toast notification
             toast = Toast(self)
@@ -1370,14 +1675,23 @@ class SteamScreenshotsViewer(QMainWindow):
 
     def on_preview_clicked(self, event):
         if self.current_screenshot:
-            self.full_screen_preview.show_image(self.current_screenshot)
+            record = self.screenshot_index.get(self.current_screenshot)
+            size = QSize(record.width, record.height) if record and record.width else QSize()
+            # A screen-sized decode from the shared cache shows instantly; tiles add detail
+            screen = QGuiApplication.primaryScreen()
+            overview_size = screen.geometry().size() * screen.devicePixelRatio()
+            overview = self.image_cache.get(self.current_screenshot, overview_size)
+            self.full_screen_preview.show_image(self.current_screenshot, size, overview)
 
     def edit_game_name(self):
         if not self.current_screenshot:
             return
             
         try:
-            game_id = self.current_screenshot.split("remote\\")[1].split("\\")[0]
+            record = self.screenshot_index.get(self.current_screenshot)
+            if record is None:
+                return
+            game_id = record.app_id
             current_name = self.game_db.get_game_name(game_id)
             
             editor = GameNameEditor(self)
@@ -1390,6 +1704,8 @@ class SteamScreenshotsViewer(QMainWindow):
                     self.game_name_label.setText(new_name)
                     # Update tab name if it exists
                     if game_id in self.game_tabs:
+                        self.game_names[game_id] = new_name
+                        self.screenshot_index.set_game_name(game_id, new_name)
                         tab_index = self.tab_widget.indexOf(self.game_tabs[game_id].parent())
                         if tab_index != -1:
                             self.tab_widget.setTabText(tab_index, new_name)
@@ -1409,13 +1725,14 @@ class SteamScreenshotsViewer(QMainWindow):
     def save_preferences(self):
         """Save game data to cache file"""
         try:
-            cache_dir = os.path.join(os.getenv('APPDATA'), 'Game Screenshot Viewer')
-            if not os.path.exists(cache_dir):
-                os.makedirs(cache_dir)
-            with open(os.path.join(cache_dir, 'config.json'), 'w') as f:
+            os.makedirs(APP_DATA_DIR, exist_ok=True)
+            with open(os.path.join(APP_DATA_DIR, 'config.json'), 'w') as f:
                 json.dump({
                     "game_sort_order": self.game_sort_combo.currentText(),
-                    "screenshot_sort_order": self.screenshot_sort_combo.currentText()
+                    "screenshot_sort_order": self.screenshot_sort_combo.currentText(),
+                    "thumbnail_cache_mb": self.thumbnail_cache.max_bytes // (1024 * 1024),
+                    "image_cache_mb": self.image_cache.max_bytes // (1024 * 1024),
+                    "library_roots": self.custom_library_roots
                 }, f)
         except Exception as e:
             self.logger.error(f"Error saving preferences: {e}")
@@ -1423,7 +1740,7 @@ class SteamScreenshotsViewer(QMainWindow):
     def load_preferences(self):
         """Load game data from cache file"""
         try:
-            config_path = os.path.join(os.getenv('APPDATA'), 'Game Screenshot Viewer', 'config.json')
+            config_path = os.path.join(APP_DATA_DIR, 'config.json')
             if os.path.exists(config_path):
                 with open(config_path, 'r') as f:
                     config = json.load(f)
@@ -1443,6 +1760,16 @@ class SteamScreenshotsViewer(QMainWindow):
                         self.screenshot_sort_combo.setCurrentIndex(index)
                     else:
                         self.screenshot_sort_combo.setCurrentIndex(0)  # Default to Newest
+                    
+                    # Thumbnail cache budget in MB
+                    cache_mb = config.get("thumbnail_cache_mb", DEFAULT_MAX_BYTES // (1024 * 1024))
+                    self.thumbnail_cache.set_max_bytes(int(cache_mb) * 1024 * 1024)
+                    image_cache_mb = config.get("image_cache_mb", DEFAULT_IMAGE_CACHE_BYTES // (1024 * 1024))
+                    self.image_cache.set_max_bytes(int(image_cache_mb) * 1024 * 1024)
+                    
+                    # Extra Steam library folders, e.g. a second install or a Linux prefix
+                    self.custom_library_roots = [
+                        os.path.expanduser(root) for root in config.get("library_roots", [])]
         except Exception as e:
             # Use defaults if loading fails
             self.game_sort_combo.setCurrentIndex(0)  # Newest
@@ -1451,232 +1778,98 @@ class SteamScreenshotsViewer(QMainWindow):
 
     def closeEvent(self, event):
         self.save_preferences()
+        self.logger.debug(f"Update passes: {self.update_scheduler.stats()}")
+        if self.duplicate_task is not None:
+            self.duplicate_task.cancel()
+        self.thumbnail_cache.save()
+        self.screenshot_catalog.close()
+        self.name_resolver.shutdown()
+        self.game_db.close()
         super().closeEvent(event)
 
-    def remove_missing_screenshot(self, item):
+    def remove_missing_screenshot(self, screenshot_path):
         """Remove a screenshot that no longer exists from the UI"""
-        screenshot_path = item.data(Qt.ItemDataRole.UserRole)
-        
-        # Remove from main list
-        row = self.list_widget.row(item)
-        self.list_widget.takeItem(row)
-        
-        # Remove from game-specific tabs if it exists
-        try:
-            game_id = screenshot_path.split("remote\\")[1].split("\\")[0]
-            if game_id in self.game_tabs:
-                game_list = self.game_tabs[game_id]
-                for i in range(game_list.count()):
-                    if game_list.item(i).data(Qt.ItemDataRole.UserRole) == screenshot_path:
-                        game_list.takeItem(i)
-                        break
-        except Exception as e:
-            self.logger.error(f"Error removing missing screenshot from game tab: {e}")
+        self.screenshot_watcher.forget(screenshot_path)
+        self.remove_screenshots([screenshot_path])
         
         # Update status
         self.status_label.setText(f"Removed missing screenshot: {os.path.basename(screenshot_path)}")
 
-    def start_missing_screenshots_check(self):
-        """Start a timer to periodically check for missing screenshots"""
-        self.missing_check_timer = QTimer(self)
-        self.missing_check_timer.timeout.connect(self.check_for_missing_screenshots)
-        self.missing_check_timer.start(30000)  # Check every 30 seconds
-
-    def check_for_missing_screenshots(self):
-        """Check all displayed screenshots still exist"""
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            screenshot_path = item.data(Qt.ItemDataRole.UserRole)
-            if not os.path.exists(screenshot_path):
-                self.remove_missing_screenshot(item)
-
-    def get_sorted_screenshots(self, screenshots):
-        sort_order = self.game_sort_combo.currentText()
-        if sort_order == "Most Recent":
-            return sorted(screenshots, key=lambda x: os.path.getmtime(x), reverse=True)
-        elif sort_order == "A to Z":
-            return sorted(screenshots, key=lambda x: x)
-        elif sort_order == "Z to A":
-            return sorted(screenshots, key=lambda x: x, reverse=True)
-        elif sort_order == "Screenshot Count":
-            return sorted(screenshots, key=lambda x: os.path.getsize(x), reverse=True)
-        return screenshots
-
     def sort_game_tabs(self):
         """Sort the game tabs based on the current sort order"""
         if self.is_sorting:
             return
             
         self.is_sorting = True
-        self.loading_overlay.show()
         try:
-            DebugConsole.log("\n=== Starting tab sort operation ===")
-            
             sort_order = self.game_sort_combo.currentText()
-            DebugConsole.log(f"Sort order: {sort_order}")
-            
-            if self.tab_widget.count() <= 1:  # Only "All" tab exists
-                DebugConsole.log("No game tabs to sort")
+            if not self.game_tabs:  # Only "All" tab exists
                 return
+            started = time.perf_counter()
             
-            # Create a list of (game_id, tab_text, widget, screenshot_time) tuples
-            tabs_info = []
-            for game_id, game_list in self.game_tabs.items():
-                newest_time = 0
-                oldest_time = float('inf')
-                # Find newest and oldest screenshot times for this game
-                for i in range(game_list.count()):
-                    screenshot_path = game_list.item(i).data(Qt.ItemDataRole.UserRole)
-                    if os.path.exists(screenshot_path):
-                        mtime = os.path.getmtime(screenshot_path)
-                        if mtime > newest_time:
-                            newest_time = mtime
-                        if mtime < oldest_time:
-                            oldest_time = mtime
-                
-                for i in range(1, self.tab_widget.count()):
-                    if self.tab_widget.widget(i) == game_list.parent():
-                        tabs_info.append((game_id, self.tab_widget.tabText(i), self.tab_widget.widget(i), newest_time, oldest_time))
-                        break
-            
-            # Sort based on current sort order
-            if sort_order == "A to Z":
-                tabs_info.sort(key=lambda x: x[1].lower())
-            elif sort_order == "Z to A":
-                tabs_info.sort(key=lambda x: x[1].lower(), reverse=True)
+            # One key per game from the index's running aggregates; no
+            # screenshot is visited and no file is stat'ed
+            stats = self.screenshot_index.all_game_stats()
+            empty = GameStats()
+            game_ids = list(self.game_tabs)
+            if sort_order in ("A to Z", "Z to A"):
+                game_ids.sort(key=lambda game_id: self.game_names.get(game_id, "").lower(),
+                              reverse=sort_order == "Z to A")
             elif sort_order == "Newest":
-                tabs_info.sort(key=lambda x: x[3], reverse=True)  # Sort by newest screenshot time
+                game_ids.sort(key=lambda game_id: stats.get(game_id, empty).newest, reverse=True)
             elif sort_order == "Oldest":
-                tabs_info.sort(key=lambda x: x[4])  # Sort by oldest screenshot time
+                game_ids.sort(key=lambda game_id: stats.get(game_id, empty).oldest)
             elif sort_order == "Screenshot Count":
-                tabs_info.sort(key=lambda x: self.game_tabs[x[0]].count(), reverse=True)
+                game_ids.sort(key=lambda game_id: stats.get(game_id, empty).count, reverse=True)
             
-            DebugConsole.log(f"Sorted tabs: {[tab[1] for tab in tabs_info]}")
-            
-            # Rebuild tabs in sorted order
-            current_index = self.tab_widget.currentIndex()
-            for i, (game_id, tab_text, widget, _, _) in enumerate(tabs_info, 1):
-                current_tab_index = self.tab_widget.indexOf(widget)
-                if current_tab_index != i:
-                    self.tab_widget.tabBar().moveTab(current_tab_index, i)
-            if current_index > 0:  # Restore selection if it was a game tab
-                self.tab_widget.setCurrentIndex(current_index)
+            # Move tabs into place; the "All" tab stays first
+            tab_bar = self.tab_widget.tabBar()
+            current_widget = self.tab_widget.currentWidget()
+            self.tab_widget.setUpdatesEnabled(False)
+            try:
+                for i, game_id in enumerate(game_ids, 1):
+                    current_tab_index = self.tab_widget.indexOf(self.game_tabs[game_id].parent())
+                    if current_tab_index != i:
+                        tab_bar.moveTab(current_tab_index, i)
+                self.tab_widget.setCurrentWidget(current_widget)
+            finally:
+                self.tab_widget.setUpdatesEnabled(True)
             
-            DebugConsole.log("=== Tab sort operation completed ===\n")
-            QApplication.processEvents()  # Force UI update
+            DebugConsole.log(f"Sorted {len(game_ids)} game tabs ({sort_order}) in "
+                             f"{(time.perf_counter() - started) * 1000:.1f} ms")
         finally:
-            self.loading_overlay.hide()
             self.is_sorting = False
 
-    def sort_list_widget(self, list_widget, sort_order):
-        """Helper method to sort a QListWidget based on the specified order"""
-        try:
-            # Store the paths and text of all items
-            items_data = []
-            for i in range(list_widget.count()):
-                item = list_widget.item(i)
-                if item and item.data(Qt.ItemDataRole.UserRole):
-                    items_data.append({
-                        'path': item.data(Qt.ItemDataRole.UserRole),
-                        'text': item.text(),
-                        'icon': item.icon()
-                    })
-            
-            # Get current selection to restore after sorting
-            current_item = list_widget.currentItem()
-            current_path = current_item.data(Qt.ItemDataRole.UserRole) if current_item else None
-            
-            # Sort based on the selected order
-            if sort_order == "Newest":
-                items_data.sort(key=lambda x: os.path.getmtime(x['path']) if os.path.exists(x['path']) else 0, reverse=True)
-            elif sort_order == "Oldest":
-                items_data.sort(key=lambda x: os.path.getmtime(x['path']) if os.path.exists(x['path']) else 0)
-            elif sort_order == "A to Z":
-                items_data.sort(key=lambda x: os.path.basename(x['path']).lower())
-            elif sort_order == "Z to A":
-                items_data.sort(key=lambda x: os.path.basename(x['path']).lower(), reverse=True)
-            elif sort_order == "Largest":
-                items_data.sort(key=lambda x: os.path.getsize(x['path']) if os.path.exists(x['path']) else 0, reverse=True)
-            elif sort_order == "Smallest":
-                items_data.sort(key=lambda x: os.path.getsize(x['path']) if os.path.exists(x['path']) else 0)
-            
-            # Clear and repopulate with new items
-            list_widget.clear()
-            for data in items_data:
-                item = QListWidgetItem(data['icon'], data['text'])
-                item.setData(Qt.ItemDataRole.UserRole, data['path'])
-                list_widget.addItem(item)
-                
-            # Restore selection if it existed
-            if current_path:
-                for i in range(list_widget.count()):
-                    if list_widget.item(i).data(Qt.ItemDataRole.UserRole) == current_path:
-                        list_widget.setCurrentItem(list_widget.item(i))
-                        break
-        except Exception as e:
-            DebugConsole.error(f"Error sorting list: {e}")
-            raise
-
-    def load_screenshot_paths(self):
-        """Load and return all screenshot paths"""
-        DebugConsole.log("Loading screenshot paths")
-        try:
-            # Get the default Steam screenshots path
-            steam_path = os.path.expandvars(r"%ProgramFiles(x86)%\\Steam")
-            userdata_path = os.path.join(steam_path, "userdata")
-            
-            if not os.path.exists(userdata_path):
-                self.status_label.setText("Steam userdata folder not found!")
-                return []
-            
-            # Find all screenshot folders
-            screenshots = []
-            for user_folder in os.listdir(userdata_path):
-                screenshots_path = os.path.join(userdata_path, user_folder, "760", "remote", "*", "screenshots")
-                screenshot_folders = glob.glob(screenshots_path)
-                
-                for folder in screenshot_folders:
-                    screenshots.extend(glob.glob(os.path.join(folder, "*.jpg")))
-                    screenshots.extend(glob.glob(os.path.join(folder, "*.png")))
-            
-            return screenshots
-            
-        except Exception as e:
-            DebugConsole.error(f"Error loading screenshot paths: {e}")
-            return []
-
     def sort_screenshots(self):
         """Sort screenshots in all lists based on the current sort order"""
         if self.is_sorting:
             return
             
         self.is_sorting = True
-        self.loading_overlay.show()
         try:
-            DebugConsole.log("\n=== Starting screenshot sort operation ===")
-            
             sort_order = self.screenshot_sort_combo.currentText()
-            DebugConsole.log(f"Screenshot sort order: {sort_order}")
-            
-            # Sort the main 'All' list
-            self.sort_list_widget(self.list_widget, sort_order)
+            started = time.perf_counter()
             
-            # Sort all game-specific lists
-            for game_list in self.game_tabs.values():
-                self.sort_list_widget(game_list, sort_order)
+            # The index keeps a cached permutation per sort order, so each
+            # proxy only swaps in a reordered list of row numbers; no overlay
+            # or event pumping is needed for a sort that takes milliseconds
+            for view in self.screenshot_views():
+                view.model().sort_by(sort_order)
             
-            DebugConsole.log("=== Screenshot sort operation completed ===\n")
-            QApplication.processEvents()  # Force UI update
+            DebugConsole.log(f"Sorted screenshots ({sort_order}) in {(time.perf_counter() - started) * 1000:.1f} ms")
         except Exception as e:
             DebugConsole.error(f"Error during screenshot sorting: {e}")
             QMessageBox.warning(self, "Sort Error", f"Failed to sort screenshots: {str(e)}")
         finally:
-            self.loading_overlay.hide()
             self.is_sorting = False
 
 # Simple main function similar to the working examples
-app = QApplication(sys.argv)
-app.setStyle('Fusion')  # Set Fusion style for better dark theme support
-window = SteamScreenshotsViewer()
-window.show()
-sys.exit(app.exec()) 
\ No newline at end of file
+if __name__ == '__main__':
+    # Duplicate hashing runs in worker processes, which re-import this module
+    # (and, when frozen, re-launch the executable) on Windows
+    multiprocessing.freeze_support()
+    app = QApplication(sys.argv)
+    app.setStyle('Fusion')  # Set Fusion style for better dark theme support
+    window = SteamScreenshotsViewer()
+    window.show()
+    sys.exit(app.exec()) 
\ No newline at end of file
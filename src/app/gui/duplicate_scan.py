@@ -0,0 +1,94 @@
+"""
+Finds duplicate and near-duplicate screenshots on a worker thread.
+
+Hashes still current in the cache are reused and those of screenshots no
+longer in the library are dropped; the rest are computed in batches on a
+process pool (decoding and NumPy work would otherwise hold the GIL the GUI
+needs) and written back to the cache as each batch lands.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..models.hash_cache import PerceptualHashCache
+from ..utils.duplicate_groups import group_duplicates
+from ..utils.perceptual_hash import hash_files
+
+HASH_BATCH_SIZE = 64
+
+
+def default_workers() -> int:
+    # Leave a core for the GUI and the thumbnail loader
+    return max(1, min(8, (os.cpu_count() or 2) - 1))
+
+
+class DuplicateScanSignals(QObject):
+    progress = pyqtSignal(int, int)  # screenshots done (hashed, cached or unreadable), total
+    finished = pyqtSignal(list)  # DuplicateGroups, largest first
+    failed = pyqtSignal(str)
+
+
+class DuplicateScanTask(QRunnable):
+    def __init__(self, records, signals, cache_path=None, workers=None, batch_size=HASH_BATCH_SIZE):
+        super().__init__()
+        # Snapshot, so the GUI can keep editing the index meanwhile
+        self.files = [(r.path, r.mtime, r.size, r.thumbnail) for r in records]
+        self.signals = signals
+        self.cache_path = cache_path
+        self.workers = workers or default_workers()
+        self.batch_size = batch_size
+        self.cancelled = threading.Event()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self):
+        logger = logging.getLogger('DuplicateScan')
+        cache = PerceptualHashCache(self.cache_path)
+        try:
+            # The snapshot is the whole library, so anything else in the cache is gone
+            pruned = cache.prune(path for path, _, _, _ in self.files)
+            hashes = cache.lookup((path, mtime, size) for path, mtime, size, _ in self.files)
+            missing = [(path, thumbnail) for path, _, _, thumbnail in self.files if path not in hashes]
+            logger.info(f"{len(hashes)} cached hashes, {len(missing)} screenshots to hash, "
+                        f"{pruned} stale hashes dropped")
+            self.signals.progress.emit(len(hashes), len(self.files))
+            if missing:
+                self._hash(missing, hashes, cache)
+            if self.cancelled.is_set():
+                return
+            groups = group_duplicates(hashes)
+        except Exception as e:
+            logger.error(f"Duplicate scan failed: {e}")
+            self.signals.failed.emit(str(e))
+            return
+        finally:
+            cache.close()
+        logger.info(f"Found {len(groups)} duplicate groups")
+        self.signals.finished.emit(groups)
+
+    def _hash(self, missing, hashes, cache):
+        stats = {path: (mtime, size) for path, mtime, size, _ in self.files}
+        done = len(self.files) - len(missing)
+        batches = [missing[i:i + self.batch_size] for i in range(0, len(missing), self.batch_size)]
+        pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            futures = [pool.submit(hash_files, batch) for batch in batches]
+            for future in as_completed(futures):
+                if self.cancelled.is_set():
+                    return
+                rows = []
+                results = future.result()
+                for path, dhash, phash in results:
+                    if dhash is not None:
+                        hashes[path] = (dhash, phash)
+                        rows.append((path, *stats[path], dhash, phash))
+                cache.store(rows)
+                done += len(results)
+                self.signals.progress.emit(done, len(self.files))
+        finally:
+            pool.shutdown(wait=not self.cancelled.is_set(), cancel_futures=True)
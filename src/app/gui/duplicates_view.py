@@ -0,0 +1,86 @@
+"""
+Window listing groups of duplicate and near-duplicate screenshots.
+"""
+
+import datetime
+import os
+
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QHeaderView, QLabel, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget
+
+PATH_ROLE = Qt.ItemDataRole.UserRole
+
+
+def format_size(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+class DuplicatesWindow(QWidget):
+    """One top-level row per group; double-click a file to show it in the main window."""
+    screenshot_activated = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.WindowType.Window)
+        self.setWindowTitle("Duplicates")
+        self.resize(720, 520)
+        self.setStyleSheet("""
+            QWidget {
+                background-color: #1b2838;
+                color: #c7d5e0;
+            }
+            QTreeWidget {
+                background-color: #171a21;
+                border: 1px solid #2a475e;
+            }
+            QTreeWidget::item:selected {
+                background-color: #66c0f4;
+                color: #1b2838;
+            }
+            QHeaderView::section {
+                background-color: #2a475e;
+                color: #c7d5e0;
+                border: none;
+                padding: 4px;
+            }
+        """)
+        layout = QVBoxLayout(self)
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["Screenshot", "Game", "Size", "Date"])
+        self.tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.tree.setUniformRowHeights(True)
+        self.tree.itemDoubleClicked.connect(self.on_item_double_clicked)
+        layout.addWidget(self.tree)
+
+    def set_groups(self, groups, screenshot_index, game_name):
+        """Fill the tree from ``DuplicateGroup``s; ``game_name(app_id)`` labels each file"""
+        self.tree.clear()
+        reclaimable = 0
+        items = []
+        for group in groups:
+            records = [screenshot_index.get(path) for path in group.paths]
+            records = [record for record in records if record is not None]
+            if len(records) < 2:
+                continue  # Removed from the library since the scan
+            # Keeping the largest copy frees everything else
+            wasted = sum(record.size for record in records) - max(record.size for record in records)
+            reclaimable += wasted
+            kind = "Identical" if group.identical else "Similar"
+            group_item = QTreeWidgetItem([f"{kind}: {len(records)} screenshots", "", format_size(wasted), ""])
+            for record in sorted(records, key=lambda record: record.mtime):
+                child = QTreeWidgetItem([
+                    record.name, game_name(record.app_id), format_size(record.size),
+                    datetime.datetime.fromtimestamp(record.mtime).strftime('%Y-%m-%d %H:%M:%S')])
+                child.setData(0, PATH_ROLE, record.path)
+                child.setToolTip(0, record.path)
+                group_item.addChild(child)
+            items.append(group_item)
+        self.tree.addTopLevelItems(items)
+        self.summary_label.setText(
+            f"{len(items)} groups of duplicates; {format_size(reclaimable)} could be freed")
+
+    def on_item_double_clicked(self, item, column):
+        path = item.data(0, PATH_ROLE)
+        if path and os.path.exists(path):
+            self.screenshot_activated.emit(path)
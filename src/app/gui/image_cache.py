@@ -0,0 +1,169 @@
+"""
+Decoded full-size and preview-size screenshots, shared by the preview pane,
+the fullscreen viewer and the clipboard.
+
+Images live in an LRU bounded by their decoded size in bytes. Neighbours of
+the selected screenshot are decoded ahead of time on a small thread pool, so
+stepping through a grid finds its next image already in memory.
+"""
+
+import logging
+from collections import OrderedDict
+
+from PyQt6.QtCore import QObject, QRunnable, QSize, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+PREFETCH_WORKERS = 2
+
+
+def decode_image(path: str, size: QSize = None):
+    """
+    Return ``(image, full)`` for a screenshot decoded to fit ``size``.
+
+    With no size (or one larger than the image) the file is decoded at full
+    resolution and ``full`` is True; otherwise the reader scales while
+    decoding, which for JPEGs skips most of the DCT work.
+    """
+    reader = QImageReader(path)
+    source_size = reader.size()
+    full = True
+    if size is not None and source_size.isValid() and (
+            source_size.width() > size.width() or source_size.height() > size.height()):
+        reader.setScaledSize(source_size.scaled(size, Qt.AspectRatioMode.KeepAspectRatio))
+        full = False
+    image = reader.read()
+    return (QImage(), False) if image.isNull() else (image, full)
+
+
+def covers(image: QImage, full: bool, size: QSize = None) -> bool:
+    """Whether a decode is good enough to show at ``size`` (None: full resolution)"""
+    if image.isNull():
+        return False
+    if full:
+        return True
+    if size is None:
+        return False
+    return image.width() >= size.width() or image.height() >= size.height()
+
+
+class DecodeSignals(QObject):
+    decoded = pyqtSignal(str, QImage, bool)
+
+
+class DecodeTask(QRunnable):
+    def __init__(self, path, size, signals, wanted):
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.signals = signals
+        self.wanted = wanted
+
+    def run(self):
+        # The selection may have moved on while this sat in the queue
+        if self.path not in self.wanted():
+            self.signals.decoded.emit(self.path, QImage(), False)
+            return
+        try:
+            image, full = decode_image(self.path, self.size)
+        except Exception:
+            image, full = QImage(), False
+        self.signals.decoded.emit(self.path, image, full)
+
+
+class DecodedImageCache(QObject):
+    """LRU of decoded screenshots with a byte budget; only used from the GUI thread."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, workers=PREFETCH_WORKERS, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger('DecodedImageCache')
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # path -> (QImage, full), least recently used first
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(workers)
+        self.pending = set()  # paths queued or decoding
+        self.stale = set()  # pending paths invalidated before their decode came back
+        self.wanted = frozenset()  # neighbours of the current selection
+        self.signals = DecodeSignals(self)
+        self.signals.decoded.connect(self._on_decoded)
+
+    def lookup(self, path, size=None):
+        """Cached image for ``path`` if it covers ``size``, else a null QImage"""
+        entry = self.entries.get(path)
+        if entry is None or not covers(entry[0], entry[1], size):
+            return QImage()
+        self.entries.move_to_end(path)
+        return entry[0]
+
+    def get(self, path, size=None):
+        """Return ``path`` decoded to cover ``size`` (None: full resolution), decoding on a miss"""
+        image = self.lookup(path, size)
+        if not image.isNull():
+            self.hits += 1
+            return image
+        self.misses += 1
+        image, full = decode_image(path, size)
+        self.add(path, image, full)
+        return image
+
+    def add(self, path, image, full):
+        if image.isNull():
+            return
+        current = self.entries.get(path)
+        # Never replace a bigger decode of the same file with a smaller one
+        if current is not None and (current[1] or current[0].width() > image.width()) and not full:
+            return
+        self._discard(path)
+        self.entries[path] = (image, full)
+        self.total_bytes += image.sizeInBytes()
+        self._evict()
+
+    def prefetch(self, paths, size=None):
+        """Decode ``paths`` in the background; queued work for earlier selections is skipped"""
+        self.wanted = frozenset(paths)
+        for path in paths:
+            if path in self.pending or not self.lookup(path, size).isNull():
+                continue
+            self.pending.add(path)
+            self.pool.start(DecodeTask(path, size, self.signals, self._wanted))
+
+    def invalidate(self, path):
+        if path in self.pending:
+            self.stale.add(path)
+        self._discard(path)
+
+    def clear(self):
+        self.wanted = frozenset()
+        self.stale |= self.pending
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def _wanted(self):
+        return self.wanted
+
+    def _on_decoded(self, path, image, full):
+        self.pending.discard(path)
+        # Invalidated while decoding: the file changed, so the image is stale
+        if path in self.stale:
+            self.stale.discard(path)
+            return
+        self.add(path, image, full)
+
+    def _discard(self, path):
+        entry = self.entries.pop(path, None)
+        if entry is not None:
+            self.total_bytes -= entry[0].sizeInBytes()
+
+    def _evict(self):
+        # Keep at least the newest image even if it alone is over budget
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            path, (image, _) = self.entries.popitem(last=False)
+            self.total_bytes -= image.sizeInBytes()
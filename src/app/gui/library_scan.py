@@ -0,0 +1,34 @@
+"""
+Runs library scans on a worker thread.
+"""
+
+import logging
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..utils.screenshot_scanner import scan_library
+
+
+class LibraryScanSignals(QObject):
+    folder_scanned = pyqtSignal(str, list)  # folder, its ScreenshotRecords
+    finished = pyqtSignal(object)  # ScanResult
+    failed = pyqtSignal(str)
+
+
+class LibraryScanTask(QRunnable):
+    def __init__(self, roots, known_folder_mtimes, signals):
+        super().__init__()
+        self.roots = list(roots)
+        self.known_folder_mtimes = dict(known_folder_mtimes)
+        self.signals = signals
+
+    def run(self):
+        try:
+            # Stream each folder to the GUI as soon as it is scanned
+            result = scan_library(self.roots, self.known_folder_mtimes,
+                                  on_folder=self.signals.folder_scanned.emit)
+        except Exception as e:
+            logging.getLogger('LibraryScan').error(f"Background scan failed: {e}")
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
@@ -0,0 +1,85 @@
+"""
+Background resolution of unknown Steam app IDs to game names.
+
+``resolve`` answers from the name store straight away and, for IDs it does
+not know, starts at most one store lookup per ID on the shared Steam API
+client's worker pool. Names arrive through ``name_resolved``. IDs Steam has
+no name for, or that failed to fetch, are not retried until their TTL runs
+out (remembered across restarts), so offline launches never wait on the
+network.
+"""
+
+import logging
+import time
+
+import requests
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from ..utils.steam_api import default_client
+
+NOT_FOUND_TTL = 24 * 60 * 60  # Steam answered, but has no name for the ID
+ERROR_TTL = 10 * 60  # Offline, timed out or an HTTP error
+
+
+def unknown_game_name(app_id):
+    return f"Unknown Game (ID: {app_id})"
+
+
+class GameNameResolver(QObject):
+    name_resolved = pyqtSignal(str, str)  # app id, name
+    # Emitted from client worker threads, delivered on the GUI thread
+    lookup_finished = pyqtSignal(str, str, bool)  # app id, name ('' if none), whether Steam answered
+
+    def __init__(self, game_db, client=None, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger('GameNameResolver')
+        self.game_db = game_db
+        # Pass a client built with store_url=... to point lookups at a stub server
+        self.client = client or default_client()
+        self.in_flight = set()
+        self.lookup_finished.connect(self._on_finished)
+
+    def resolve(self, app_id):
+        """Best name known right now; unknown IDs are looked up in the background"""
+        app_id = str(app_id)
+        name = self.game_db.known_name(app_id)
+        if name is None:
+            self.request(app_id)
+            name = unknown_game_name(app_id)
+        return name
+
+    def request(self, app_id):
+        """Start a lookup unless one is running or the ID failed recently"""
+        if app_id in self.in_flight or self.game_db.lookup_retry_after(app_id) > time.time():
+            return
+        self.in_flight.add(app_id)
+        future = self.client.submit_app_name(app_id)
+        future.add_done_callback(lambda future, app_id=app_id: self._on_done(app_id, future))
+
+    def _on_done(self, app_id, future):
+        # Runs on a client worker thread
+        if future.cancelled():
+            return
+        try:
+            name = future.result()
+        except (requests.RequestException, ValueError) as e:
+            self.logger.debug(f"Name lookup for {app_id} failed: {e}")
+        except Exception:
+            # Anything else would leave the ID in flight, never looked up again
+            self.logger.exception(f"Unexpected error looking up {app_id}")
+        else:
+            self.lookup_finished.emit(app_id, name or '', True)
+            return
+        self.lookup_finished.emit(app_id, '', False)
+
+    def _on_finished(self, app_id, name, answered):
+        self.in_flight.discard(app_id)
+        if name:
+            self.game_db.set_fetched_name(app_id, name)
+            self.name_resolved.emit(app_id, self.game_db.get_game_name(app_id))
+            return
+        ttl = NOT_FOUND_TTL if answered else ERROR_TTL
+        self.game_db.set_lookup_failed(app_id, time.time() + ttl)
+
+    def shutdown(self):
+        self.client.close()
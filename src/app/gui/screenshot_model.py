@@ -0,0 +1,296 @@
+"""
+Shared screenshot model and per-tab proxies for the screenshot grids.
+
+Every screenshot is held once in ``ScreenshotModel``. The "All" tab and each
+game tab show a ``ScreenshotProxyModel`` over it, which only stores the
+source rows it shows. Icons are requested lazily from ``data()``, so only rows
+a view actually paints are ever decoded, and at most ``icon_capacity`` decoded
+icons stay in memory.
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict
+
+from PyQt6.QtCore import QAbstractListModel, QAbstractProxyModel, QModelIndex, Qt
+
+from ..models.screenshot_index import SORT_DESCENDING
+
+PATH_ROLE = Qt.ItemDataRole.UserRole
+
+DEFAULT_ICON_CAPACITY = 1000
+
+
+class ScreenshotModel(QAbstractListModel):
+    """Qt adapter over a ``ScreenshotIndex``; one row per screenshot record."""
+
+    def __init__(self, screenshot_index, thumbnail_loader, placeholder_icon,
+                 icon_capacity=DEFAULT_ICON_CAPACITY, parent=None):
+        super().__init__(parent)
+        self.screenshot_index = screenshot_index
+        self.thumbnail_loader = thumbnail_loader
+        self.placeholder_icon = placeholder_icon
+        self.icon_capacity = icon_capacity
+        self.icons = OrderedDict()  # path -> QIcon, least recently painted first
+        self.thumbnail_loader.thumbnail_ready.connect(self.on_thumbnail_ready)
+
+    @property
+    def game_rows(self):
+        return self.screenshot_index.game_rows
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.screenshot_index)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.screenshot_index):
+            return None
+        record = self.screenshot_index.records[index.row()]
+        if role == PATH_ROLE:
+            return record.path
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self.icon_for(record)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return record.name
+        return None
+
+    def icon_for(self, record):
+        """Return the decoded icon for a painted row, queueing a decode on a miss"""
+        icon = self.icons.get(record.path)
+        if icon is not None:
+            self.icons.move_to_end(record.path)
+            return icon
+        self.thumbnail_loader.request(record.path, record.thumbnail)
+        return self.placeholder_icon
+
+    def on_thumbnail_ready(self, path, icon):
+        row = self.screenshot_index.row_for_path(path)
+        if row is None:
+            return
+        self.icons[path] = icon
+        self.icons.move_to_end(path)
+        while len(self.icons) > self.icon_capacity:
+            self.icons.popitem(last=False)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def add_records(self, records):
+        """Append screenshot records, skipping paths already in the model"""
+        new_records = self.screenshot_index.new_records(records)
+        if not new_records:
+            return
+        first = len(self.screenshot_index)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_records) - 1)
+        self.screenshot_index.append(new_records)
+        self.endInsertRows()
+
+    def remove_paths(self, paths):
+        """Remove screenshots by path; unknown paths are ignored"""
+        # Runs come back last-first, so earlier rows stay valid as we go
+        for start, end in self.screenshot_index.removal_runs(paths):
+            self.beginRemoveRows(QModelIndex(), start, end)
+            for record in self.screenshot_index.records[start:end + 1]:
+                self.icons.pop(record.path, None)
+            self.screenshot_index.remove_rows(start, end)
+            self.endRemoveRows()
+
+    def update_records(self, records):
+        """Apply rescanned stat data for files that changed on disk"""
+        for record in records:
+            row = self.screenshot_index.update(record)
+            if row is not None:
+                # The cached icon shows the old contents
+                self.icons.pop(record.path, None)
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    def rename_path(self, old_path, new_path):
+        row = self.screenshot_index.rename(old_path, new_path)
+        if row is None:
+            return
+        icon = self.icons.pop(old_path, None)
+        if icon is not None:
+            self.icons[new_path] = icon
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def sorted_rows(self, sort_order):
+        """Every source row in display order for a sort order"""
+        return self.screenshot_index.sorted_rows(sort_order)
+
+    def sort_ranks(self, sort_order):
+        """Each source row's position in the ascending order of the sort's field"""
+        return self.screenshot_index.sort_ranks(sort_order)
+
+
+class ScreenshotProxyModel(QAbstractProxyModel):
+    """
+    A filtered, sorted view over ``ScreenshotModel``.
+
+    ``game_id=None`` shows every screenshot (the "All" tab); otherwise only
+    that game's rows are kept. The proxy holds an explicit list of source
+    rows, so filtering never walks the whole library.
+
+    ``base_rows`` are all of the tab's rows in sort order; ``source_rows``
+    are the ones the shared ``row_filter`` lets through, in the same order,
+    so changing the filter never re-sorts.
+    """
+
+    def __init__(self, source_model, game_id=None, row_filter=None, parent=None):
+        super().__init__(parent)
+        self.game_id = game_id
+        self.row_filter = row_filter
+        self.base_rows = []
+        self.source_rows = []
+        self.proxy_rows = {}  # source row -> proxy row
+        self.sort_order = None
+        self.filter_stale = False  # Set while the tab is hidden and the filter changed
+        self.setSourceModel(source_model)
+        source_model.rowsInserted.connect(self._on_rows_inserted)
+        source_model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        source_model.rowsRemoved.connect(self._on_rows_removed)
+        source_model.dataChanged.connect(self._on_data_changed)
+        source_model.modelReset.connect(self._on_model_reset)
+        self._on_model_reset()
+
+    def _matching_rows(self, first=0):
+        model = self.sourceModel()
+        if self.game_id is None:
+            return list(range(first, model.rowCount()))
+        rows = model.game_rows.get(self.game_id, [])
+        return rows[bisect_left(rows, first):]
+
+    def _filtered(self, rows):
+        if self.row_filter is None:
+            return list(rows)
+        return self.row_filter.filter_rows(self.sourceModel().screenshot_index, rows, self.game_id)
+
+    def refilter(self):
+        """Re-apply ``row_filter`` after it changed"""
+        self.filter_stale = False
+        source_rows = self._filtered(self.base_rows)
+        if source_rows == self.source_rows:
+            return
+        self.beginResetModel()
+        self.source_rows = source_rows
+        self.proxy_rows = {source: proxy for proxy, source in enumerate(self.source_rows)}
+        self.endResetModel()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or proxy_index.row() >= len(self.source_rows):
+            return QModelIndex()
+        return self.sourceModel().index(self.source_rows[proxy_index.row()], 0)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = self.proxy_rows.get(source_index.row())
+        return QModelIndex() if row is None else self.index(row, 0)
+
+    def index(self, row, column=0, parent=QModelIndex()):
+        if parent.isValid() or column != 0 or not 0 <= row < len(self.source_rows):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, child=None):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.source_rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def sort_by(self, sort_order):
+        """Reorder rows for one of the screenshot sort options, keeping selection"""
+        self.sort_order = sort_order
+        if len(self.base_rows) < 2:
+            return
+        model = self.sourceModel()
+        # Cached permutations: a copy for "All", a sort by precomputed rank for a game
+        if self.game_id is None:
+            self.base_rows = model.sorted_rows(sort_order)
+        else:
+            ranks = model.sort_ranks(sort_order)
+            self.base_rows.sort(key=ranks.__getitem__, reverse=sort_order in SORT_DESCENDING)
+        # A layout change must keep the same rows, so it only reorders the ones shown;
+        # rows the filter now lets in or out go through refilter() afterwards
+        shown = set(self.source_rows)
+        source_rows = [row for row in self.base_rows if row in shown]
+        if source_rows != self.source_rows:
+            self.layoutAboutToBeChanged.emit()
+            old_persistent = self.persistentIndexList()
+            old_sources = [self.source_rows[index.row()] for index in old_persistent]
+            self.source_rows = source_rows
+            self.proxy_rows = {source: proxy for proxy, source in enumerate(self.source_rows)}
+            self.changePersistentIndexList(
+                old_persistent, [self.index(self.proxy_rows[source], 0) for source in old_sources])
+            self.layoutChanged.emit()
+        if not self.filter_stale:
+            self.refilter()
+
+    def _on_rows_inserted(self, parent, first, last):
+        new_rows = [row for row in self._matching_rows(first) if row <= last]
+        self.base_rows.extend(new_rows)
+        new_rows = self._filtered(new_rows)
+        if not new_rows:
+            return
+        start = len(self.source_rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(new_rows) - 1)
+        for proxy_row, source_row in enumerate(new_rows, start):
+            self.source_rows.append(source_row)
+            self.proxy_rows[source_row] = proxy_row
+        self.endInsertRows()
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        doomed = sorted((self.proxy_rows[row] for row in range(first, last + 1) if row in self.proxy_rows),
+                        reverse=True)
+        for proxy_row in doomed:
+            self.beginRemoveRows(QModelIndex(), proxy_row, proxy_row)
+            del self.source_rows[proxy_row]
+            self.endRemoveRows()
+
+    def _on_rows_removed(self, parent, first, last):
+        removed = last - first + 1
+        self.base_rows = [row - removed if row > last else row
+                          for row in self.base_rows if not first <= row <= last]
+        self.source_rows = [row - removed if row > last else row for row in self.source_rows]
+        self.proxy_rows = {source: proxy for proxy, source in enumerate(self.source_rows)}
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        # New icons never change what the filter sees; restats and renames can
+        if any(role != Qt.ItemDataRole.DecorationRole for role in roles) or not roles:
+            self._refilter_rows(range(top_left.row(), bottom_right.row() + 1))
+        for source_row in range(top_left.row(), bottom_right.row() + 1):
+            proxy_row = self.proxy_rows.get(source_row)
+            if proxy_row is not None:
+                index = self.index(proxy_row, 0)
+                self.dataChanged.emit(index, index, roles)
+
+    def _refilter_rows(self, source_rows):
+        """Let changed rows in or out of the filter in place, keeping the rest of the view"""
+        if self.row_filter is None or not self.row_filter.active or self.filter_stale:
+            return
+        records = self.sourceModel().screenshot_index.records
+        rows = [row for row in source_rows if self.game_id is None or records[row].app_id == self.game_id]
+        passing = set(self._filtered(rows))
+        for row in rows:
+            proxy_row = self.proxy_rows.get(row)
+            if proxy_row is not None and row not in passing:
+                self.beginRemoveRows(QModelIndex(), proxy_row, proxy_row)
+                del self.source_rows[proxy_row]
+                self.proxy_rows = {source: proxy for proxy, source in enumerate(self.source_rows)}
+                self.endRemoveRows()
+            elif proxy_row is None and row in passing:
+                # Shown rows keep base_rows order, so count the shown ones ahead of it
+                position = self.base_rows.index(row)
+                proxy_row = sum(1 for other in self.base_rows[:position] if other in self.proxy_rows)
+                self.beginInsertRows(QModelIndex(), proxy_row, proxy_row)
+                self.source_rows.insert(proxy_row, row)
+                self.proxy_rows = {source: proxy for proxy, source in enumerate(self.source_rows)}
+                self.endInsertRows()
+
+    def _on_model_reset(self):
+        self.beginResetModel()
+        self.base_rows = self._matching_rows()
+        self.source_rows = self._filtered(self.base_rows)
+        self.proxy_rows = {source: proxy for proxy, source in enumerate(self.source_rows)}
+        self.endResetModel()
@@ -0,0 +1,176 @@
+"""
+Event-driven watching of the Steam screenshots folders.
+
+Only folders are watched, never individual files. A change marks the folder
+dirty; after a short debounce each dirty folder is listed once and compared
+with what we last saw, which yields added, removed and renamed screenshots.
+Folders the native watcher refuses (network drives, exhausted inotify
+watches) fall back to polling their directory mtime.
+"""
+
+import logging
+import os
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+from ..models.screenshot_index import ScreenshotRecord
+from ..utils.image_probe import probe_dimensions
+from ..utils.screenshot_scanner import SCREENSHOT_EXTENSIONS
+
+DEBOUNCE_MS = 300
+POLL_INTERVAL_MS = 2000
+
+
+def list_screenshot_names(folder):
+    """Screenshot file names directly inside ``folder``"""
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name for entry in entries
+                    if entry.name.lower().endswith(SCREENSHOT_EXTENSIONS) and entry.is_file()}
+    except OSError:
+        return set()
+
+
+class ScreenshotWatcher(QObject):
+    screenshots_added = pyqtSignal(list)  # ScreenshotRecords
+    screenshots_removed = pyqtSignal(list)  # paths
+    screenshots_renamed = pyqtSignal(list)  # (old path, ScreenshotRecord at the new path) pairs
+    folders_changed = pyqtSignal()  # a watched parent gained or lost a game folder
+
+    def __init__(self, debounce_ms=DEBOUNCE_MS, poll_interval_ms=POLL_INTERVAL_MS, record_lookup=None,
+                 parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger('ScreenshotWatcher')
+        # path -> indexed ScreenshotRecord or None; renames are only detected with it
+        self.record_lookup = record_lookup
+        self.folders = {}  # screenshots folder -> app id
+        self.known_names = {}  # screenshots folder -> file names last seen
+        self.parent_folders = set()  # remote folders, watched for new games
+        self.polled = {}  # folder -> mtime, for folders the native watcher refused
+        self.dirty = set()
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(debounce_ms)
+        self.debounce_timer.timeout.connect(self.flush)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(poll_interval_ms)
+        self.poll_timer.timeout.connect(self._poll)
+
+    def sync(self, folders, known_paths):
+        """
+        Watch exactly ``folders`` (screenshots folder -> app id).
+
+        ``known_paths`` maps each folder to the paths already in the index,
+        so only later changes are reported.
+        """
+        for folder in set(self.folders) - set(folders):
+            self._unwatch(folder)
+        parent_folders = {os.path.dirname(os.path.dirname(folder)) for folder in folders}
+        for folder in self.parent_folders - parent_folders:
+            self._unwatch(folder)
+        for folder in parent_folders - self.parent_folders:
+            self._watch(folder)
+        self.parent_folders = parent_folders
+
+        for folder, app_id in folders.items():
+            self.known_names[folder] = {os.path.basename(p) for p in known_paths.get(folder, ())}
+            if folder not in self.folders:
+                self._watch(folder)
+            self.folders[folder] = app_id
+
+        if self.polled and not self.poll_timer.isActive():
+            self.poll_timer.start()
+        self.logger.debug(f"Watching {len(self.folders)} folders ({len(self.polled)} polled)")
+
+    def forget(self, path):
+        """Stop reporting ``path``, e.g. after the app renamed or removed it itself"""
+        names = self.known_names.get(os.path.dirname(path))
+        if names is not None:
+            names.discard(os.path.basename(path))
+
+    def remember(self, path):
+        """Treat ``path`` as known, e.g. after the app created it itself"""
+        names = self.known_names.get(os.path.dirname(path))
+        if names is not None:
+            names.add(os.path.basename(path))
+
+    def _watch(self, folder):
+        if self.watcher.addPath(folder):
+            return
+        try:
+            self.polled[folder] = os.stat(folder).st_mtime
+        except OSError:
+            self.polled[folder] = None
+
+    def _unwatch(self, folder):
+        self.watcher.removePath(folder)
+        self.polled.pop(folder, None)
+        self.folders.pop(folder, None)
+        self.known_names.pop(folder, None)
+        if not self.polled:
+            self.poll_timer.stop()
+
+    def _on_directory_changed(self, folder):
+        self.dirty.add(folder)
+        self.debounce_timer.start()
+
+    def _poll(self):
+        for folder, mtime in list(self.polled.items()):
+            try:
+                current = os.stat(folder).st_mtime
+            except OSError:
+                current = None
+            if current != mtime:
+                self.polled[folder] = current
+                self._on_directory_changed(folder)
+
+    def flush(self):
+        """Diff every dirty folder against what was last seen and emit the changes"""
+        dirty, self.dirty = self.dirty, set()
+        added, removed, renamed = [], [], []
+        for folder in dirty:
+            if folder in self.parent_folders:
+                self.folders_changed.emit()
+                continue
+            if folder not in self.folders:
+                continue
+            app_id = self.folders[folder]
+            before = self.known_names.get(folder, set())
+            after = list_screenshot_names(folder)
+            self.known_names[folder] = after
+
+            new_records = []
+            for name in after - before:
+                path = os.path.join(folder, name)
+                try:
+                    # Steam writes its thumbnail after the screenshot, so leave it unresolved
+                    record = ScreenshotRecord.from_stat(path, app_id, os.stat(path))
+                except OSError:
+                    self.known_names[folder].discard(name)
+                    continue
+                record.width, record.height = probe_dimensions(path) or (0, 0)
+                new_records.append(record)
+            gone = [os.path.join(folder, name) for name in before - after]
+
+            if len(gone) == 1 and len(new_records) == 1 and self._is_rename(gone[0], new_records[0]):
+                renamed.append((gone[0], new_records[0]))
+            else:
+                added.extend(new_records)
+                removed.extend(gone)
+
+        if removed:
+            self.screenshots_removed.emit(removed)
+        if renamed:
+            self.screenshots_renamed.emit(renamed)
+        if added:
+            self.screenshots_added.emit(added)
+
+    def _is_rename(self, old_path, record):
+        """One file gone and one new with the same size and mtime is the same file, renamed"""
+        old = self.record_lookup(old_path) if self.record_lookup is not None else None
+        return old is not None and old.size == record.size and old.mtime == record.mtime
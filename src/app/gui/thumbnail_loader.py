@@ -0,0 +1,145 @@
+"""
+Background thumbnail decoding for the screenshot grids.
+"""
+
+import logging
+import os
+from collections import Counter
+
+from PyQt6.QtCore import QObject, QRunnable, QSize, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QIcon, QImage, QImageReader, QPixmap
+
+from ..utils.screenshot_scanner import steam_thumbnail_path
+
+THUMBNAIL_SIZE = QSize(200, 200)
+THUMBNAIL_QUALITY = 85
+
+# Where a thumbnail came from, for the loader's source counters
+SOURCE_STEAM = 'steam'
+SOURCE_CACHE = 'cache'
+SOURCE_DECODED = 'decoded'
+
+
+def decode_scaled(path: str, size: QSize = THUMBNAIL_SIZE) -> QImage:
+    """Decode an image directly at (at most) the given size, keeping aspect ratio.
+
+    Used for thumbnails and for the preview pane.
+    """
+    reader = QImageReader(path)
+    source_size = reader.size()
+    if source_size.isValid():
+        # Letting the reader scale means JPEGs are decoded at reduced DCT size
+        reader.setScaledSize(source_size.scaled(size, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return QImage()
+    if image.width() > size.width() or image.height() > size.height():
+        image = image.scaled(size, Qt.AspectRatioMode.KeepAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+    return image
+
+
+def placeholder_icon(size: QSize = THUMBNAIL_SIZE) -> QIcon:
+    """Plain Steam-blue tile shown until the real thumbnail is decoded."""
+    pixmap = QPixmap(size)
+    pixmap.fill(QColor("#2a475e"))
+    return QIcon(pixmap)
+
+
+class ThumbnailSignals(QObject):
+    # QImage is safe to create off the GUI thread, QPixmap is not
+    decoded = pyqtSignal(str, QImage, str)
+
+
+def load_thumbnail(path: str, size: QSize = THUMBNAIL_SIZE, cache=None, steam_thumbnail=None):
+    """
+    Return ``(image, source)`` for a screenshot's icon.
+
+    Tries Steam's thumbnail first, then the disk cache, and only decodes
+    (and caches) the full-size original when neither is usable.
+    ``steam_thumbnail`` is the scanner's answer for Steam's copy ('' for
+    none); when it is None the thumbnails folder is checked here.
+    """
+    stat = os.stat(path)
+
+    steam_file = steam_thumbnail
+    if steam_file is None:
+        steam_file = steam_thumbnail_path(path, stat.st_mtime)
+    if steam_file:
+        image = decode_scaled(steam_file, size)
+        if not image.isNull():
+            return image, SOURCE_STEAM
+
+    if cache is not None:
+        cached_file = cache.lookup(path, stat.st_mtime, stat.st_size)
+        if cached_file:
+            image = QImage(cached_file)
+            if not image.isNull():
+                return image, SOURCE_CACHE
+
+    image = decode_scaled(path, size)
+    if cache is not None and not image.isNull():
+        target = cache.reserve(path, stat.st_mtime, stat.st_size)
+        tmp_file = target + '.tmp'
+        if image.save(tmp_file, 'JPG', THUMBNAIL_QUALITY):
+            os.replace(tmp_file, target)
+            cache.add(path, stat.st_mtime, stat.st_size)
+    return image, SOURCE_DECODED
+
+
+class ThumbnailTask(QRunnable):
+    def __init__(self, path, size, signals, cache=None, steam_thumbnail=None):
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.signals = signals
+        self.cache = cache
+        self.steam_thumbnail = steam_thumbnail
+
+    def run(self):
+        try:
+            image, source = load_thumbnail(self.path, self.size, self.cache, self.steam_thumbnail)
+        except Exception as e:
+            logging.getLogger('ThumbnailLoader').error(f"Error decoding thumbnail {self.path}: {e}")
+            image, source = QImage(), SOURCE_DECODED
+        self.signals.decoded.emit(self.path, image, source)
+
+
+class ThumbnailLoader(QObject):
+    """Decodes thumbnails on a thread pool and hands finished icons back on the GUI thread."""
+
+    thumbnail_ready = pyqtSignal(str, QIcon)
+
+    def __init__(self, size: QSize = THUMBNAIL_SIZE, cache=None, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger('ThumbnailLoader')
+        self.size = size
+        self.cache = cache
+        self.pending = set()
+        self.source_counts = Counter()  # SOURCE_* -> icons loaded from it
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, QThreadPool.globalInstance().maxThreadCount()))
+        self.signals = ThumbnailSignals()
+        # Queued connection: the slot runs on the thread owning this loader
+        self.signals.decoded.connect(self._on_decoded, Qt.ConnectionType.QueuedConnection)
+
+    def request(self, path: str, steam_thumbnail=None):
+        """Queue a path for decoding; repeated requests for a pending path are ignored."""
+        if path in self.pending:
+            return
+        self.pending.add(path)
+        self.pool.start(ThumbnailTask(path, self.size, self.signals, self.cache, steam_thumbnail))
+
+    def _on_decoded(self, path, image, source):
+        self.pending.discard(path)
+        self.source_counts[source] += 1
+        if not self.pending:
+            self.logger.info(
+                "Thumbnails loaded - steam: {}, cache: {}, decoded: {}".format(
+                    self.source_counts[SOURCE_STEAM],
+                    self.source_counts[SOURCE_CACHE],
+                    self.source_counts[SOURCE_DECODED]))
+        if image.isNull():
+            self.logger.debug(f"No thumbnail for {path}")
+            return
+        self.thumbnail_ready.emit(path, QIcon(QPixmap.fromImage(image)))
@@ -0,0 +1,379 @@
+"""
+Tiled, zoomable image view for the fullscreen preview.
+
+The image is treated as a pyramid: level 0 is full resolution and every level
+above it halves the previous one. Only the tiles of the level matching the
+current zoom that intersect the viewport are decoded, on a background pool,
+and kept in a byte-bounded LRU. A screen-sized overview is drawn underneath
+until they arrive, so zooming and panning never show holes and memory stays
+bounded however large the screenshot is.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+
+from PyQt6.QtCore import (QEasingCurve, QObject, QPoint, QPointF, QRect, QRectF, QRunnable, QSize,
+                          QThreadPool, QVariantAnimation, Qt, pyqtSignal)
+from PyQt6.QtGui import QImage, QImageIOHandler, QImageReader, QPainter
+from PyQt6.QtWidgets import QWidget
+
+TILE_SIZE = 512
+TILE_CACHE_BYTES = 96 * 1024 * 1024
+# Largest whole level kept for formats that cannot decode a region (PNG)
+LEVEL_IMAGE_BYTES = 32 * 1024 * 1024
+TILE_WORKERS = 2
+MAX_ZOOM = 8.0
+ZOOM_STEP = 1.25
+ZOOM_ANIMATION_MS = 120
+PAN_STEP = 100  # Logical pixels per arrow key press
+DRAG_THRESHOLD = 4  # Pixels a press may move and still count as a click
+
+
+class TileSource:
+    """Decodes pyramid tiles of one image file; safe to use from worker threads."""
+
+    def __init__(self, path: str, size: QSize = QSize()):
+        self.path = path
+        reader = QImageReader(path)
+        self.size = size if size.isValid() and not size.isEmpty() else reader.size()
+        # JPEG can decode just a region; other formats are decoded a whole level at a time
+        self.clip_supported = reader.supportsOption(QImageIOHandler.ImageOption.ClipRect)
+        self.lock = threading.Lock()
+        self.level_image = (None, QImage())
+        self.active_level = None  # The level the view shows; only it stays decoded
+
+        self.max_level = 0
+        while max(self.size.width(), self.size.height()) > TILE_SIZE << self.max_level:
+            self.max_level += 1
+        # Without region decoding the finest level offered is the first that fits LEVEL_IMAGE_BYTES;
+        # zooming in past it enlarges that level rather than holding the full image in memory
+        self.min_level = 0
+        if not self.clip_supported:
+            while self.min_level < self.max_level and self.level_bytes(self.min_level) > LEVEL_IMAGE_BYTES:
+                self.min_level += 1
+
+    def level_size(self, level: int) -> QSize:
+        scale = 1 << level
+        return QSize(-(-self.size.width() // scale), -(-self.size.height() // scale))
+
+    def level_bytes(self, level: int) -> int:
+        size = self.level_size(level)
+        return size.width() * size.height() * 4
+
+    def tile_rect(self, level: int, column: int, row: int) -> QRect:
+        """A tile's rectangle in the pixel space of its level"""
+        bounds = QRect(QPoint(0, 0), self.level_size(level))
+        return QRect(column * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE).intersected(bounds)
+
+    def decode_tile(self, level: int, column: int, row: int) -> QImage:
+        rect = self.tile_rect(level, column, row)
+        if rect.isEmpty():
+            return QImage()
+        if not self.clip_supported:
+            return self._level_image(level).copy(rect)
+        scale = 1 << level
+        source = QRect(rect.x() * scale, rect.y() * scale, rect.width() * scale, rect.height() * scale)
+        reader = QImageReader(self.path)
+        reader.setClipRect(source.intersected(QRect(QPoint(0, 0), self.size)))
+        if level:
+            reader.setScaledSize(rect.size())
+        return reader.read()
+
+    def set_active_level(self, level):
+        """Drop a decoded level the view has left; None when it shows no tiles"""
+        # No lock: a worker may hold it for a whole-level decode, and the GUI must not wait
+        self.active_level = level
+        if self.level_image[0] != level:
+            self.level_image = (None, QImage())
+
+    def _level_image(self, level: int) -> QImage:
+        # Only the level the view shows is kept; a full-size PNG level can be 100+ MB
+        with self.lock:
+            cached_level, image = self.level_image
+            if cached_level != level:
+                reader = QImageReader(self.path)
+                if level:
+                    reader.setScaledSize(self.level_size(level))
+                image = reader.read()
+                if level == self.active_level:
+                    self.level_image = (level, image)
+            return image
+
+
+class TileSignals(QObject):
+    tile_ready = pyqtSignal(tuple, QImage)  # (generation, level, column, row), tile
+
+
+class TileTask(QRunnable):
+    def __init__(self, source, key, signals, wanted):
+        super().__init__()
+        self.source = source
+        self.key = key
+        self.signals = signals
+        self.wanted = wanted
+
+    def run(self):
+        # Panned or zoomed away while this sat in the queue
+        if self.key not in self.wanted():
+            self.signals.tile_ready.emit(self.key, QImage())
+            return
+        try:
+            image = self.source.decode_tile(*self.key[1:])
+        except Exception:
+            image = QImage()
+        self.signals.tile_ready.emit(self.key, image)
+
+
+class TiledImageView(QWidget):
+    """Wheel to zoom around the cursor, drag to pan, click or Escape to close."""
+
+    close_requested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.source = None
+        self.overview = QImage()
+        self.generation = 0
+        self.tiles = OrderedDict()  # (generation, level, column, row) -> QImage
+        self.tile_bytes = 0
+        self.pending = set()
+        self.wanted = frozenset()
+        self.tile_level = None  # Pyramid level of the tiles being shown, None for the overview
+
+        self.zoom = 1.0
+        self.target_zoom = 1.0
+        self.center = QPointF()  # Image point shown at the middle of the widget
+        self.fitted = True
+        self.press_pos = None
+        self.last_pos = None
+        self.dragging = False
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(TILE_WORKERS)
+        self.signals = TileSignals(self)
+        self.signals.tile_ready.connect(self._on_tile_ready)
+
+        self.zoom_anchor = (QPointF(), QPointF())  # (widget point, image point) held still
+        self.zoom_animation = QVariantAnimation(self)
+        self.zoom_animation.setDuration(ZOOM_ANIMATION_MS)
+        self.zoom_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.zoom_animation.valueChanged.connect(self._apply_zoom)
+
+    def set_image(self, path, size=QSize(), overview=QImage()):
+        """Show ``path``; ``overview`` is a screen-sized decode drawn until tiles arrive"""
+        self.clear()
+        self.source = TileSource(path, size)
+        self.overview = overview
+        self.fit()
+
+    def clear(self):
+        self.generation += 1
+        self.wanted = frozenset()
+        self.pending.clear()
+        self.tiles.clear()
+        self.tile_bytes = 0
+        self._set_tile_level(None)
+        self.source = None
+        self.overview = QImage()
+        self.zoom_animation.stop()
+        self.update()
+
+    def image_size(self):
+        if self.source is not None and self.source.size.isValid():
+            return self.source.size
+        return self.overview.size()
+
+    def fit_zoom(self):
+        size = self.image_size()
+        if size.isEmpty():
+            return 1.0
+        return min(self.width() / size.width(), self.height() / size.height(), 1.0)
+
+    def fit(self):
+        size = self.image_size()
+        self.zoom_animation.stop()
+        self.zoom = self.target_zoom = self.fit_zoom()
+        self.center = QPointF(size.width() / 2, size.height() / 2)
+        self.fitted = True
+        self.update()
+
+    def zoom_to(self, zoom, anchor=None, animate=True):
+        """Zoom so the image point under ``anchor`` (widget coordinates) stays put"""
+        zoom = max(min(self.fit_zoom(), 1.0) / 2, min(zoom, MAX_ZOOM))
+        if anchor is None:
+            anchor = QPointF(self.width() / 2, self.height() / 2)
+        self.zoom_anchor = (anchor, self.map_to_image(anchor))
+        self.target_zoom = zoom
+        self.fitted = False
+        self.zoom_animation.stop()
+        if animate:
+            self.zoom_animation.setStartValue(float(self.zoom))
+            self.zoom_animation.setEndValue(float(zoom))
+            self.zoom_animation.start()
+        else:
+            self._apply_zoom(zoom)
+
+    def _apply_zoom(self, zoom):
+        anchor, image_point = self.zoom_anchor
+        self.zoom = zoom
+        offset = anchor - QPointF(self.width() / 2, self.height() / 2)
+        self.center = image_point - offset / zoom
+        self.update()
+
+    def map_to_image(self, point):
+        return self.center + (point - QPointF(self.width() / 2, self.height() / 2)) / self.zoom
+
+    def visible_image_rect(self):
+        top_left = self.map_to_image(QPointF(0, 0))
+        bottom_right = self.map_to_image(QPointF(self.width(), self.height()))
+        size = self.image_size()
+        return QRectF(top_left, bottom_right).intersected(QRectF(0, 0, size.width(), size.height()))
+
+    def level_for_zoom(self):
+        """Coarsest level that still has at least one pixel per device pixel"""
+        if self.source is None:
+            return 0
+        scale = self.zoom * self.devicePixelRatioF()
+        level = 0 if scale >= 1 else min(int(math.floor(math.log2(1 / scale))), self.source.max_level)
+        return max(level, self.source.min_level)
+
+    def paintEvent(self, event):
+        size = self.image_size()
+        if size.isEmpty():
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.translate(self.width() / 2, self.height() / 2)
+        painter.scale(self.zoom, self.zoom)
+        painter.translate(-self.center)
+
+        full_rect = QRectF(0, 0, size.width(), size.height())
+        if not self.overview.isNull():
+            painter.drawImage(full_rect, self.overview)
+
+        # The overview is enough until zoomed in past its resolution
+        needed = size.width() * self.zoom * self.devicePixelRatioF()
+        if self.source is None or (not self.overview.isNull() and self.overview.width() >= needed):
+            self._set_tile_level(None)
+            self._request_tiles([])
+            return
+
+        level = self.level_for_zoom()
+        self._set_tile_level(level)
+        scale = 1 << level
+        visible = self.visible_image_rect()
+        span = TILE_SIZE * scale
+        columns = range(int(visible.left() // span), int(math.ceil(visible.right() / span)))
+        rows = range(int(visible.top() // span), int(math.ceil(visible.bottom() / span)))
+        missing = []
+        for row in rows:
+            for column in columns:
+                key = (self.generation, level, column, row)
+                tile = self.tiles.get(key)
+                if tile is None:
+                    missing.append(key)
+                    continue
+                self.tiles.move_to_end(key)
+                rect = self.source.tile_rect(level, column, row)
+                painter.drawImage(QRectF(rect.x() * scale, rect.y() * scale,
+                                         rect.width() * scale, rect.height() * scale), tile)
+        painter.end()
+
+        # Decode the tiles nearest the middle first
+        middle = self.center / span
+        missing.sort(key=lambda key: abs(key[2] + 0.5 - middle.x()) + abs(key[3] + 0.5 - middle.y()))
+        self._request_tiles(missing)
+
+    def _set_tile_level(self, level):
+        if level != self.tile_level and self.source is not None:
+            self.source.set_active_level(level)
+        self.tile_level = level
+
+    def _request_tiles(self, keys):
+        self.wanted = frozenset(keys)
+        for key in keys:
+            if key not in self.pending:
+                self.pending.add(key)
+                self.pool.start(TileTask(self.source, key, self.signals, self._wanted))
+
+    def _wanted(self):
+        return self.wanted
+
+    def _on_tile_ready(self, key, image):
+        self.pending.discard(key)
+        if key[0] != self.generation or image.isNull():
+            return
+        self.tiles[key] = image
+        self.tile_bytes += image.sizeInBytes()
+        while self.tile_bytes > TILE_CACHE_BYTES and len(self.tiles) > 1:
+            _, evicted = self.tiles.popitem(last=False)
+            self.tile_bytes -= evicted.sizeInBytes()
+        self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.fitted:
+            self.fit()
+
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() / 120
+        if steps:
+            self.zoom_to(self.target_zoom * ZOOM_STEP ** steps, event.position())
+        event.accept()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.press_pos = self.last_pos = event.position()
+            self.dragging = False
+
+    def mouseMoveEvent(self, event):
+        if self.press_pos is None:
+            return
+        pos = event.position()
+        if not self.dragging and (pos - self.press_pos).manhattanLength() > DRAG_THRESHOLD:
+            self.dragging = True
+            self.setCursor(Qt.CursorShape.ClosedHandCursor)
+        if self.dragging:
+            self.zoom_animation.stop()
+            self.zoom = self.target_zoom
+            self.center -= (pos - self.last_pos) / self.zoom
+            self.fitted = False
+            self.update()
+        self.last_pos = pos
+
+    def mouseReleaseEvent(self, event):
+        if event.button() != Qt.MouseButton.LeftButton or self.press_pos is None:
+            return
+        if self.dragging:
+            self.unsetCursor()
+        else:
+            self.close_requested.emit()
+        self.press_pos = None
+        self.dragging = False
+
+    def keyPressEvent(self, event):
+        key = event.key()
+        pan = {
+            Qt.Key.Key_Left: QPointF(-PAN_STEP, 0),
+            Qt.Key.Key_Right: QPointF(PAN_STEP, 0),
+            Qt.Key.Key_Up: QPointF(0, -PAN_STEP),
+            Qt.Key.Key_Down: QPointF(0, PAN_STEP),
+        }
+        if key == Qt.Key.Key_Escape:
+            self.close_requested.emit()
+        elif key in (Qt.Key.Key_Plus, Qt.Key.Key_Equal):
+            self.zoom_to(self.target_zoom * ZOOM_STEP)
+        elif key == Qt.Key.Key_Minus:
+            self.zoom_to(self.target_zoom / ZOOM_STEP)
+        elif key == Qt.Key.Key_0:
+            self.fit()
+        elif key == Qt.Key.Key_1:
+            self.zoom_to(1.0)
+        elif key in pan:
+            self.center += pan[key] / self.zoom
+            self.fitted = False
+            self.update()
+        else:
+            super().keyPressEvent(event)
@@ -0,0 +1,66 @@
+"""
+Coalesces requests for library-wide passes (sorting, filtering, repopulating).
+
+Any number of ``request`` calls within one event-loop tick collapse into a
+single deferred run of each requested pass, in a fixed order. Requests made
+while the scheduler is held back (e.g. records are still being inserted) stay
+pending until it is asked to run again.
+"""
+
+import logging
+from typing import Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+REPOPULATE = 'repopulate'
+FILTER = 'filter'
+SORT_GAMES = 'sort_games'
+SORT_SCREENSHOTS = 'sort_screenshots'
+PASS_ORDER = (REPOPULATE, FILTER, SORT_GAMES, SORT_SCREENSHOTS)
+
+
+class UpdateScheduler(QObject):
+    def __init__(self, ready: Optional[Callable[[], bool]] = None, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger('UpdateScheduler')
+        self.ready = ready or (lambda: True)
+        self.handlers: Dict[str, Callable[[], None]] = {}
+        self.pending = set()
+        # Per pass: how often it was asked for, how often it actually ran
+        self.requested = dict.fromkeys(PASS_ORDER, 0)
+        self.ran = dict.fromkeys(PASS_ORDER, 0)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.run)
+
+    def set_handler(self, name: str, handler: Callable[[], None]):
+        self.handlers[name] = handler
+
+    def request(self, *names: str):
+        """Ask for passes to run on the next tick; repeats before then are free"""
+        for name in names:
+            self.requested[name] += 1
+            self.pending.add(name)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def run(self):
+        """Run every pending pass once, unless the scheduler is held back"""
+        if not self.pending or not self.ready():
+            return
+        pending, self.pending = self.pending, set()
+        for name in PASS_ORDER:
+            if name in pending and name in self.handlers:
+                self.ran[name] += 1
+                self.handlers[name]()
+        self.logger.debug(f"Ran {', '.join(n for n in PASS_ORDER if n in pending)} ({self.stats()})")
+
+    @property
+    def skipped(self) -> int:
+        """Passes requested but merged into another run (or still pending)"""
+        return sum(self.requested.values()) - sum(self.ran.values())
+
+    def stats(self) -> Dict[str, int]:
+        return {'requested': sum(self.requested.values()), 'ran': sum(self.ran.values()),
+                'skipped': self.skipped}
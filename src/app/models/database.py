@@ -0,0 +1,38 @@
+"""
+Where the app keeps its per-user files, and how its SQLite databases open.
+
+Every database uses WAL journaling, so readers never wait on the writer,
+with ``synchronous=NORMAL``, which under WAL can only lose the latest
+transactions on power loss. The schema version lives in ``PRAGMA
+user_version``; a file written by any other version has its tables dropped
+and recreated rather than migrated.
+"""
+
+import os
+import sqlite3
+from typing import Iterable
+
+APP_DIR_NAME = 'Game Screenshot Viewer'
+
+
+def app_data_path(*parts: str) -> str:
+    """A path in the per-user data folder: under %APPDATA% on Windows, the home directory elsewhere"""
+    return os.path.join(os.getenv('APPDATA') or os.path.expanduser('~'), APP_DIR_NAME, *parts)
+
+
+def open_database(db_path: str, schema: str, version: int, tables: Iterable[str]) -> sqlite3.Connection:
+    """Connect to ``db_path``, creating its folder, with ``schema`` at ``version``; ``tables`` are what it creates"""
+    folder = os.path.dirname(db_path)
+    if db_path != ':memory:' and folder:
+        os.makedirs(folder, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != version:
+        with conn:
+            for table in tables:
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+    with conn:
+        conn.executescript(schema)
+        conn.execute(f"PRAGMA user_version = {version}")
+    return conn
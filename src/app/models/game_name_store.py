@@ -0,0 +1,224 @@
+"""
+Indexed on-disk store of Steam game names.
+
+Names live in three SQLite tables, one per layer: the baseline list shipped
+with the build, names fetched from Steam on this machine, and names the user
+typed in. A lookup is a single indexed query that prefers custom over fetched
+over baseline, so nothing is loaded into memory up front and the database
+opens in milliseconds however many apps it holds.
+
+The JSON caches earlier versions wrote are imported once; after that they
+are only re-read when the file itself changes (e.g. a new build ships a
+newer baseline).
+
+Single-name updates are written behind: ``stage`` keeps them in memory
+(visible to lookups straight away) until ``flush`` commits everything
+staged in one transaction.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from typing import Dict, Iterable, Optional, Tuple
+
+from .database import open_database
+
+SCHEMA_VERSION = 1
+
+BASELINE = 'baseline'
+FETCHED = 'fetched'
+CUSTOM = 'custom'
+LAYERS = (CUSTOM, FETCHED, BASELINE)  # Lookup precedence
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS baseline_names (app_id TEXT PRIMARY KEY, name TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS fetched_names (app_id TEXT PRIMARY KEY, name TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS custom_names (app_id TEXT PRIMARY KEY, name TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS failed_lookups (app_id TEXT PRIMARY KEY, retry_after REAL NOT NULL) WITHOUT ROWID;
+"""
+
+TABLES = [f"{layer}_names" for layer in LAYERS] + ['meta', 'failed_lookups']
+
+LOOKUP = """
+SELECT COALESCE(
+    (SELECT name FROM custom_names WHERE app_id = ?1),
+    (SELECT name FROM fetched_names WHERE app_id = ?1),
+    (SELECT name FROM baseline_names WHERE app_id = ?1))
+"""
+
+
+def _file_signature(path: str) -> Optional[str]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class GameNameStore:
+    def __init__(self, db_path: str):
+        self.logger = logging.getLogger('GameNameStore')
+        self.db_path = db_path
+        self.conn = open_database(db_path, SCHEMA, SCHEMA_VERSION, TABLES)
+
+        self.staged: Dict[str, Dict[str, str]] = {layer: {} for layer in LAYERS}
+        self.staged_failures: Dict[str, float] = {}  # app id -> time to retry after
+        # Write volume, for the debug log and anyone tuning the flush interval
+        self.rows_staged = 0
+        self.rows_written = 0
+        self.flushes = 0
+
+    def get(self, app_id: str) -> Optional[str]:
+        """Name for ``app_id`` from the highest layer that has one"""
+        app_id = str(app_id)
+        if any(app_id in staged for staged in self.staged.values()):
+            for layer in LAYERS:
+                name = self.get_layer(layer, app_id)
+                if name:
+                    return name
+            return None
+        return self.conn.execute(LOOKUP, (app_id,)).fetchone()[0]
+
+    def get_layer(self, layer: str, app_id: str) -> Optional[str]:
+        app_id = str(app_id)
+        name = self.staged[layer].get(app_id)
+        if name is not None:
+            return name
+        row = self.conn.execute(f"SELECT name FROM {layer}_names WHERE app_id = ?", (app_id,)).fetchone()
+        return row[0] if row else None
+
+    def lookup_many(self, app_ids: Iterable[str], layers: Iterable[str] = LAYERS) -> Dict[str, str]:
+        """Names for many IDs at once from the first of ``layers`` that has each; staged names included"""
+        app_ids = [str(app_id) for app_id in app_ids]
+        found: Dict[str, str] = {}
+        for layer in reversed(tuple(layers)):  # Higher layers overwrite lower ones
+            for start in range(0, len(app_ids), 500):
+                chunk = app_ids[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                found.update(self.conn.execute(
+                    f"SELECT app_id, name FROM {layer}_names WHERE app_id IN ({placeholders})", chunk))
+            staged = self.staged[layer]
+            if staged:
+                found.update((app_id, staged[app_id]) for app_id in app_ids if app_id in staged)
+        return found
+
+    def __contains__(self, app_id):
+        return self.get(app_id) is not None
+
+    def count(self, layer: str) -> int:
+        return self.conn.execute(f"SELECT COUNT(*) FROM {layer}_names").fetchone()[0]
+
+    def set_names(self, layer: str, names: Iterable[Tuple[str, str]]) -> int:
+        """Insert or replace ``(app_id, name)`` pairs in one transaction; returns rows written"""
+        rows = [(str(app_id), name) for app_id, name in names]
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    f"INSERT OR REPLACE INTO {layer}_names (app_id, name) VALUES (?, ?)", rows)
+        except sqlite3.Error as e:
+            self.logger.error(f"Error writing {layer} game names: {e}")
+            return 0
+        return len(rows)
+
+    def stage(self, layer: str, app_id: str, name: str):
+        """Queue one name for the next ``flush``; later writes to the same ID replace it"""
+        self.staged[layer][str(app_id)] = name
+        self.rows_staged += 1
+
+    def stage_many(self, layer: str, names: Iterable[Tuple[str, str]]):
+        for app_id, name in names:
+            self.stage(layer, app_id, name)
+
+    def retry_after(self, app_id: str) -> float:
+        """When a failed lookup of ``app_id`` may be retried (0 if it never failed)"""
+        app_id = str(app_id)
+        if app_id in self.staged_failures:
+            return self.staged_failures[app_id]
+        row = self.conn.execute("SELECT retry_after FROM failed_lookups WHERE app_id = ?", (app_id,)).fetchone()
+        return row[0] if row else 0.0
+
+    def stage_failure(self, app_id: str, retry_after: float):
+        self.staged_failures[str(app_id)] = retry_after
+        self.rows_staged += 1
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.staged_failures) or any(self.staged.values())
+
+    def flush(self) -> int:
+        """Commit everything staged in one transaction; returns rows written"""
+        if not self.dirty:
+            return 0
+        staged, failures = self.staged, self.staged_failures
+        try:
+            with self.conn:
+                for layer, names in staged.items():
+                    self.conn.executemany(
+                        f"INSERT OR REPLACE INTO {layer}_names (app_id, name) VALUES (?, ?)", names.items())
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO failed_lookups (app_id, retry_after) VALUES (?, ?)", failures.items())
+                # A name that finally arrived supersedes an earlier failure
+                self.conn.executemany("DELETE FROM failed_lookups WHERE app_id = ?",
+                                      ((app_id,) for app_id in staged[FETCHED]))
+        except sqlite3.Error as e:
+            # Keep the names staged and try again on the next flush
+            self.logger.error(f"Error flushing game names: {e}")
+            return 0
+        written = sum(len(names) for names in staged.values()) + len(failures)
+        self.staged = {layer: {} for layer in LAYERS}
+        self.staged_failures = {}
+        self.rows_written += written
+        self.flushes += 1
+        self.logger.debug(f"Flushed {written} game names ({self.write_stats()})")
+        return written
+
+    def write_stats(self) -> Dict[str, int]:
+        """Rows staged, rows actually written and transactions committed so far"""
+        return {
+            'rows_staged': self.rows_staged,
+            'rows_written': self.rows_written,
+            'flushes': self.flushes,
+        }
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def import_json(self, layer: str, path: str, replace: bool = False) -> bool:
+        """
+        Load an ``{app_id: name}`` JSON file into a layer if it changed since the last import.
+
+        ``replace`` swaps the whole layer (the shipped baseline); otherwise
+        names already in the store win, so a stale legacy cache never
+        overwrites newer data.
+        """
+        signature = _file_signature(path)
+        key = f"imported:{layer}:{os.path.normcase(os.path.abspath(path))}"
+        if signature is None or self.get_meta(key) == signature:
+            return False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                names = json.load(f)
+            rows = [(str(app_id), name) for app_id, name in names.items() if name]
+            verb = "REPLACE" if replace else "IGNORE"
+            with self.conn:
+                if replace:
+                    self.conn.execute(f"DELETE FROM {layer}_names")
+                self.conn.executemany(
+                    f"INSERT OR {verb} INTO {layer}_names (app_id, name) VALUES (?, ?)", rows)
+                self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, signature))
+        except (OSError, ValueError, AttributeError, sqlite3.Error) as e:
+            self.logger.error(f"Error importing {path}: {e}")
+            return False
+        self.logger.debug(f"Imported {len(rows)} {layer} game names from {path}")
+        return True
+
+    def close(self):
+        self.flush()
+        self.conn.close()
@@ -0,0 +1,75 @@
+"""
+Persistent SQLite cache of perceptual hashes, keyed by path, mtime and size,
+so only new or edited screenshots are ever hashed again.
+"""
+
+import logging
+import sqlite3
+from typing import Dict, Iterable, Optional, Tuple
+
+from .database import app_data_path, open_database
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    dhash INTEGER NOT NULL,
+    phash INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def default_hash_cache_path() -> str:
+    return app_data_path('hashes.db')
+
+
+def _to_signed(value: int) -> int:
+    # SQLite integers are signed 64-bit
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class PerceptualHashCache:
+    def __init__(self, db_path: Optional[str] = None):
+        self.logger = logging.getLogger('PerceptualHashCache')
+        self.db_path = db_path or default_hash_cache_path()
+        self.conn = open_database(self.db_path, SCHEMA, SCHEMA_VERSION, ['hashes'])
+
+    def lookup(self, files: Iterable[Tuple[str, float, int]]) -> Dict[str, Tuple[int, int]]:
+        """``(dhash, phash)`` for each ``(path, mtime, size)`` whose cached hashes are still current"""
+        files = {path: (mtime, size) for path, mtime, size in files}
+        found = {}
+        for path, mtime, size, dhash, phash in self.conn.execute(
+                "SELECT path, mtime, size, dhash, phash FROM hashes"):
+            if files.get(path) == (mtime, size):
+                found[path] = (_to_unsigned(dhash), _to_unsigned(phash))
+        return found
+
+    def store(self, rows: Iterable[Tuple[str, float, int, int, int]]):
+        """Insert or replace ``(path, mtime, size, dhash, phash)`` rows in one transaction"""
+        rows = [(path, mtime, size, _to_signed(dhash), _to_signed(phash))
+                for path, mtime, size, dhash, phash in rows]
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO hashes (path, mtime, size, dhash, phash) VALUES (?, ?, ?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            self.logger.error(f"Error writing perceptual hashes: {e}")
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """Drop hashes of screenshots no longer in the library; returns rows removed"""
+        keep = set(keep)
+        stale = [(path,) for (path,) in self.conn.execute("SELECT path FROM hashes") if path not in keep]
+        if stale:
+            with self.conn:
+                self.conn.executemany("DELETE FROM hashes WHERE path = ?", stale)
+        return len(stale)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,129 @@
+"""
+Persistent SQLite catalog of screenshots, so the UI can render the last known
+library immediately on launch while a rescan runs in the background.
+"""
+
+import logging
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+from .database import app_data_path, open_database
+from .screenshot_index import ScreenshotRecord
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS screenshots (
+    path TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    app_id TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    width INTEGER NOT NULL DEFAULT 0,
+    height INTEGER NOT NULL DEFAULT 0,
+    thumbnail TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS screenshots_folder ON screenshots (folder);
+CREATE TABLE IF NOT EXISTS folders (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL
+);
+"""
+
+# Keep known dimensions unless the file changed underneath them
+UPSERT = """
+INSERT INTO screenshots (path, folder, app_id, mtime, size, width, height, thumbnail)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(path) DO UPDATE SET
+    folder = excluded.folder,
+    app_id = excluded.app_id,
+    thumbnail = excluded.thumbnail,
+    width = CASE WHEN screenshots.mtime = excluded.mtime AND screenshots.size = excluded.size
+                 AND excluded.width = 0 THEN screenshots.width ELSE excluded.width END,
+    height = CASE WHEN screenshots.mtime = excluded.mtime AND screenshots.size = excluded.size
+                  AND excluded.height = 0 THEN screenshots.height ELSE excluded.height END,
+    mtime = excluded.mtime,
+    size = excluded.size
+"""
+
+
+def default_catalog_path() -> str:
+    return app_data_path('screenshots.db')
+
+
+class ScreenshotCatalog:
+    def __init__(self, db_path: Optional[str] = None):
+        self.logger = logging.getLogger('ScreenshotCatalog')
+        self.db_path = db_path or default_catalog_path()
+        self.conn = open_database(self.db_path, SCHEMA, SCHEMA_VERSION, ['screenshots', 'folders'])
+
+    def load_records(self) -> List[ScreenshotRecord]:
+        """Every catalogued screenshot, as index records"""
+        records = []
+        rows = self.conn.execute(
+            "SELECT path, app_id, mtime, size, width, height, thumbnail FROM screenshots")
+        for path, app_id, mtime, size, width, height, thumbnail in rows:
+            records.append(ScreenshotRecord(path, app_id, mtime, size, width, height, thumbnail))
+        return records
+
+    def folder_mtimes(self) -> Dict[str, float]:
+        return dict(self.conn.execute("SELECT path, mtime FROM folders"))
+
+    def apply_scan(self, result):
+        """Store a ``ScanResult``: replace changed folders, drop removed ones"""
+        try:
+            with self.conn:
+                for folder in result.removed:
+                    self.conn.execute("DELETE FROM screenshots WHERE folder = ?", (folder,))
+                    self.conn.execute("DELETE FROM folders WHERE path = ?", (folder,))
+                for folder, records in result.changed.items():
+                    current = {record.path for record in records}
+                    stale = [(path,) for (path,) in self.conn.execute(
+                        "SELECT path FROM screenshots WHERE folder = ?", (folder,)) if path not in current]
+                    self.conn.executemany("DELETE FROM screenshots WHERE path = ?", stale)
+                    self.conn.executemany(UPSERT, (
+                        (r.path, folder, r.app_id, r.mtime, r.size, r.width, r.height, r.thumbnail or '')
+                        for r in records))
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO folders (path, mtime) VALUES (?, ?)",
+                        (folder, result.folder_mtimes[folder]))
+        except sqlite3.Error as e:
+            self.logger.error(f"Error updating screenshot catalog: {e}")
+
+    def add_records(self, records: Iterable[ScreenshotRecord]):
+        """Insert or update individual screenshots, e.g. ones reported by the watcher"""
+        try:
+            with self.conn:
+                self.conn.executemany(UPSERT, (
+                    (r.path, os.path.dirname(r.path), r.app_id, r.mtime, r.size, r.width, r.height,
+                     r.thumbnail or '')
+                    for r in records))
+        except sqlite3.Error as e:
+            self.logger.error(f"Error adding catalogued screenshots: {e}")
+
+    def update_dimensions(self, path: str, width: int, height: int):
+        try:
+            with self.conn:
+                self.conn.execute("UPDATE screenshots SET width = ?, height = ? WHERE path = ?",
+                                  (width, height, path))
+        except sqlite3.Error as e:
+            self.logger.error(f"Error updating screenshot dimensions: {e}")
+
+    def rename(self, old_path: str, new_path: str):
+        try:
+            with self.conn:
+                self.conn.execute("UPDATE screenshots SET path = ?, thumbnail = '' WHERE path = ?",
+                                  (new_path, old_path))
+        except sqlite3.Error as e:
+            self.logger.error(f"Error renaming catalogued screenshot: {e}")
+
+    def remove_paths(self, paths: Iterable[str]):
+        try:
+            with self.conn:
+                self.conn.executemany("DELETE FROM screenshots WHERE path = ?", ((p,) for p in paths))
+        except sqlite3.Error as e:
+            self.logger.error(f"Error removing catalogued screenshots: {e}")
+
+    def close(self):
+        self.conn.close()
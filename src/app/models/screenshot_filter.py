@@ -0,0 +1,118 @@
+"""
+The library-wide screenshot filter shared by every tab.
+
+A screenshot passes if it matches the search query and falls inside the
+date and size ranges; each part is optional. The query is answered from the
+screenshot index's trigram indexes, the ranges by binary search over its
+sorted mtime and size orders. Results are cached until either the filter or
+the index changes, so the "All" proxy and every game proxy reuse one result
+per edit.
+"""
+
+from typing import Optional, Tuple
+
+Range = Tuple[Optional[float], Optional[float]]
+OPEN_RANGE: Range = (None, None)
+
+
+class ScreenshotFilter:
+    def __init__(self):
+        self.query = ''
+        self.date_range: Range = OPEN_RANGE  # mtime, seconds since the epoch
+        self.size_range: Range = OPEN_RANGE  # bytes
+        self._cache_key = None
+        self._matches = None
+        self._rows = None
+        self._rows_ready = False
+
+    @property
+    def active(self) -> bool:
+        return bool(self.query) or self.ranged
+
+    @property
+    def ranged(self) -> bool:
+        return self.date_range != OPEN_RANGE or self.size_range != OPEN_RANGE
+
+    def set_query(self, query: str) -> bool:
+        """Returns whether the query actually changed"""
+        query = query.strip().lower()
+        if query == self.query:
+            return False
+        self.query = query
+        return True
+
+    def set_date_range(self, start: Optional[float] = None, end: Optional[float] = None) -> bool:
+        """Keep screenshots modified between two timestamps (inclusive); None leaves a side open"""
+        if self.date_range == (start, end):
+            return False
+        self.date_range = (start, end)
+        return True
+
+    def set_size_range(self, minimum: Optional[int] = None, maximum: Optional[int] = None) -> bool:
+        """Keep screenshots between two sizes in bytes (inclusive); None leaves a side open"""
+        if self.size_range == (minimum, maximum):
+            return False
+        self.size_range = (minimum, maximum)
+        return True
+
+    def matches(self, screenshot_index):
+        """
+        ``(records, app_ids)`` for the query as returned by
+        ``ScreenshotIndex.search``, or None when there is no query.
+        """
+        if not self.query:
+            return None
+        self._refresh(screenshot_index)
+        if self._matches is None:
+            self._matches = screenshot_index.search(self.query)
+        return self._matches
+
+    def matching_rows(self, screenshot_index):
+        """Source rows that pass the filter, or None when every row does"""
+        if not self.active:
+            return None
+        self._refresh(screenshot_index)
+        if not self._rows_ready:
+            self._rows = self._compute_rows(screenshot_index)
+            self._rows_ready = True
+        return self._rows
+
+    def filter_rows(self, screenshot_index, rows, app_id=None):
+        """The rows, in order, that pass the filter; ``app_id`` when all of them belong to one game"""
+        if not self.active:
+            return list(rows)
+        if app_id is not None and not self.ranged and app_id in self.matches(screenshot_index)[1]:
+            return list(rows)
+        wanted = self.matching_rows(screenshot_index)
+        if wanted is None:
+            return list(rows)
+        return [row for row in rows if row in wanted]
+
+    def _refresh(self, screenshot_index):
+        key = (id(screenshot_index), screenshot_index.generation, self.query, self.date_range, self.size_range)
+        if key != self._cache_key:
+            self._matches = self._rows = None
+            self._rows_ready = False
+            self._cache_key = key
+
+    def _compute_rows(self, screenshot_index):
+        constraints = []
+        for field, bounds in (('mtime', self.date_range), ('size', self.size_range)):
+            if bounds != OPEN_RANGE:
+                constraints.append(screenshot_index.rows_in_range(field, *bounds))
+        if self.query:
+            records, app_ids = self.matches(screenshot_index)
+            if len(records) < len(screenshot_index):
+                rows_by_path = screenshot_index.rows_by_path
+                rows = {rows_by_path[record.path] for record in records}
+                for app_id in app_ids:
+                    rows.update(screenshot_index.game_rows.get(app_id, ()))
+                constraints.append(rows)
+        if not constraints:
+            return None
+        # Start from the most selective constraint
+        constraints.sort(key=len)
+        rows = set(constraints[0])
+        for other in constraints[1:]:
+            rows.intersection_update(other)
+        return rows
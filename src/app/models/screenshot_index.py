@@ -0,0 +1,359 @@
+"""
+In-memory index of screenshot records.
+
+Each screenshot is stat'ed once when it is scanned; sorting, grouping and the
+details panel read the cached values instead of hitting the filesystem again.
+
+Sorting works on per-field key columns (mtime, size, lowercase name). The
+ascending row order for each field is computed once and cached together with
+each row's rank in it; edits drop or patch only the fields they touch. The
+same orders answer date and size range queries by binary search.
+
+Per-game aggregates (count, newest, oldest, total bytes) are kept alongside,
+so ordering game tabs never has to walk a game's screenshots.
+
+File names and game names are also kept in trigram indexes for search.
+``generation`` changes with every edit, so derived results can be cached.
+"""
+
+import os
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .search_index import TrigramIndex
+
+SORT_DESCENDING = ("Newest", "Z to A", "Largest")
+SORT_FIELDS = {
+    "Newest": 'mtime', "Oldest": 'mtime',
+    "A to Z": 'name', "Z to A": 'name',
+    "Largest": 'size', "Smallest": 'size',
+}
+# Appends up to this size are merged into cached orders; larger ones rebuild them
+INCREMENTAL_SORT_LIMIT = 64
+
+
+def _sort_key(record: 'ScreenshotRecord', field: str):
+    if field == 'name':
+        return os.path.basename(record.path).lower()
+    return getattr(record, field)
+
+
+def _bisect(order: List[int], before) -> int:
+    """First position in ``order`` whose row ``before`` no longer holds for"""
+    # bisect only takes key= from Python 3.10
+    lo, hi = 0, len(order)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if before(order[mid]):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _insert_row(order: List[int], column: list, row: int):
+    """Insert ``row`` into ``order``, which is sorted by ``(column[row], row)``"""
+    key = (column[row], row)
+    order.insert(_bisect(order, lambda other: (column[other], other) < key), row)
+
+
+class ScreenshotRecord:
+    __slots__ = ('path', 'app_id', 'mtime', 'size', 'width', 'height', 'thumbnail')
+
+    def __init__(self, path: str, app_id: str, mtime: float = 0.0, size: int = 0,
+                 width: int = 0, height: int = 0, thumbnail: Optional[str] = None):
+        self.path = path
+        self.app_id = app_id
+        self.mtime = mtime
+        self.size = size
+        self.width = width
+        self.height = height
+        # Steam's thumbnail for this file: a path, '' if it has none, None if unknown
+        self.thumbnail = thumbnail
+
+    @classmethod
+    def from_stat(cls, path: str, app_id: str, stat: os.stat_result) -> 'ScreenshotRecord':
+        return cls(path, app_id, stat.st_mtime, stat.st_size)
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+    def __repr__(self):
+        return f"ScreenshotRecord({self.path!r}, app_id={self.app_id!r})"
+
+
+class GameStats:
+    """Aggregates over one game's screenshots, maintained as records come and go"""
+    __slots__ = ('count', 'newest', 'oldest', 'total_bytes', 'stale')
+
+    def __init__(self):
+        self.count = 0
+        self.newest = 0.0
+        self.oldest = 0.0
+        self.total_bytes = 0
+        self.stale = False  # newest/oldest need recomputing after a removal
+
+    def add(self, mtime: float, size: int):
+        if self.count == 0 and not self.stale:
+            self.newest = self.oldest = mtime
+        else:
+            self.newest = max(self.newest, mtime)
+            self.oldest = min(self.oldest, mtime)
+        self.count += 1
+        self.total_bytes += size
+
+    def discard(self, mtime: float, size: int):
+        self.count -= 1
+        self.total_bytes -= size
+        # Only losing an extreme value invalidates newest/oldest
+        if mtime == self.newest or mtime == self.oldest:
+            self.stale = True
+
+    def __repr__(self):
+        return (f"GameStats(count={self.count}, newest={self.newest}, oldest={self.oldest}, "
+                f"total_bytes={self.total_bytes})")
+
+
+class ScreenshotIndex:
+    """
+    Row-ordered store of ``ScreenshotRecord`` objects.
+
+    Rows are stable except on removal, when later rows shift down by the
+    number of removed rows (mirroring a Qt list model).
+    """
+
+    def __init__(self):
+        self.records: List[ScreenshotRecord] = []
+        self.rows_by_path: Dict[str, int] = {}
+        self.game_rows: Dict[str, List[int]] = {}  # app_id -> ascending rows
+        self.columns: Dict[str, list] = {field: [] for field in set(SORT_FIELDS.values())}
+        self.orders: Dict[str, List[int]] = {}  # field -> rows in ascending key order
+        self.ranks: Dict[str, List[int]] = {}  # field -> each row's position in that order
+        self.stats: Dict[str, GameStats] = {}  # app_id -> aggregates
+        self.name_search = TrigramIndex()  # record -> file name
+        self.game_search = TrigramIndex()  # app_id -> game name and ID
+        self.generation = 0
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, path):
+        return path in self.rows_by_path
+
+    def get(self, path: str) -> Optional[ScreenshotRecord]:
+        row = self.rows_by_path.get(path)
+        return None if row is None else self.records[row]
+
+    def row_for_path(self, path: str) -> Optional[int]:
+        return self.rows_by_path.get(path)
+
+    def new_records(self, records: Iterable[ScreenshotRecord]) -> List[ScreenshotRecord]:
+        """Filter out records whose path is already indexed (or repeated)"""
+        fresh = []
+        seen = set()
+        for record in records:
+            if record.path not in self.rows_by_path and record.path not in seen:
+                seen.add(record.path)
+                fresh.append(record)
+        return fresh
+
+    def append(self, records: List[ScreenshotRecord]):
+        """Append records that ``new_records`` has already de-duplicated"""
+        self.generation += 1
+        first = len(self.records)
+        for row, record in enumerate(records, first):
+            self.records.append(record)
+            self.rows_by_path[record.path] = row
+            self.game_rows.setdefault(record.app_id, []).append(row)
+            self._stats(record.app_id).add(record.mtime, record.size)
+            self.name_search.add(record, record.name)
+        for field, column in self.columns.items():
+            column.extend(_sort_key(record, field) for record in records)
+        if len(records) > INCREMENTAL_SORT_LIMIT:
+            self._invalidate_sort()
+            return
+        for field, order in self.orders.items():
+            column = self.columns[field]
+            for row in range(first, len(self.records)):
+                _insert_row(order, column, row)
+            self.ranks.pop(field, None)
+
+    def remove_rows(self, start: int, end: int):
+        """Delete rows ``start..end`` inclusive"""
+        self.generation += 1
+        for record in self.records[start:end + 1]:
+            self.name_search.remove(record)
+            stats = self.stats[record.app_id]
+            stats.discard(record.mtime, record.size)
+            if stats.count == 0:
+                del self.stats[record.app_id]
+        del self.records[start:end + 1]
+        for column in self.columns.values():
+            del column[start:end + 1]
+        # Later rows shift down, so drop them from the cached orders and renumber
+        removed = end - start + 1
+        for field, order in self.orders.items():
+            self.orders[field] = [row - removed if row > end else row for row in order if not start <= row <= end]
+        self.ranks.clear()
+        self._reindex()
+
+    def removal_runs(self, paths: Iterable[str]):
+        """Contiguous ``(start, end)`` row runs covering ``paths``, last run first"""
+        rows = sorted({self.rows_by_path[p] for p in paths if p in self.rows_by_path}, reverse=True)
+        runs = []
+        for row in rows:
+            if runs and row == runs[-1][0] - 1:
+                runs[-1][0] = row
+            else:
+                runs.append([row, row])
+        return [tuple(run) for run in runs]
+
+    def rename(self, old_path: str, new_path: str) -> Optional[int]:
+        row = self.rows_by_path.pop(old_path, None)
+        if row is not None:
+            self.generation += 1
+            record = self.records[row]
+            record.path = new_path
+            self.rows_by_path[new_path] = row
+            self.name_search.add(record, record.name)
+            self._set_key(row, 'name')
+        return row
+
+    def update(self, fresh: ScreenshotRecord) -> Optional[int]:
+        """Copy rescanned stat data onto the indexed record for the same path"""
+        row = self.rows_by_path.get(fresh.path)
+        if row is not None:
+            record = self.records[row]
+            if record.mtime != fresh.mtime or record.size != fresh.size:
+                record.width, record.height = fresh.width, fresh.height
+                self._restat(record, fresh.mtime, fresh.size)
+                self.generation += 1
+            record.thumbnail = fresh.thumbnail
+            self._set_key(row, 'mtime')
+            self._set_key(row, 'size')
+        return row
+
+    def refresh(self, path: str) -> Optional[ScreenshotRecord]:
+        """Re-stat one file; returns its (updated) record, or None if it is gone"""
+        record = self.get(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if record is not None and (record.mtime != stat.st_mtime or record.size != stat.st_size):
+            self._restat(record, stat.st_mtime, stat.st_size)
+            self.generation += 1
+            record.width = record.height = 0  # Re-probed on demand
+            row = self.rows_by_path[path]
+            self._set_key(row, 'mtime')
+            self._set_key(row, 'size')
+        return record
+
+    def set_dimensions(self, path: str, width: int, height: int) -> Optional[ScreenshotRecord]:
+        record = self.get(path)
+        if record is not None:
+            record.width, record.height = width, height
+        return record
+
+    def set_game_name(self, app_id: str, name: str):
+        """Make a game findable by its (possibly custom) name as well as its ID"""
+        if self.game_search.texts.get(app_id) != f"{name}\n{app_id}".lower():
+            self.game_search.add(app_id, f"{name}\n{app_id}")
+            self.generation += 1
+
+    def search(self, query: str) -> Tuple[Set[ScreenshotRecord], Set[str]]:
+        """
+        ``(records, app_ids)``: records whose file name contains ``query`` and
+        games whose name or ID does. A screenshot matches if it is in the
+        first set or its game is in the second.
+        """
+        return self.name_search.search(query), self.game_search.search(query)
+
+    def game_stats(self, app_id: str) -> GameStats:
+        """Aggregates for one game (all zero if it has no screenshots)"""
+        stats = self.stats.get(app_id)
+        if stats is None:
+            return GameStats()
+        if stats.stale:
+            mtimes = [self.records[row].mtime for row in self.game_rows.get(app_id, [])]
+            stats.newest, stats.oldest = max(mtimes), min(mtimes)
+            stats.stale = False
+        return stats
+
+    def all_game_stats(self) -> Dict[str, GameStats]:
+        return {app_id: self.game_stats(app_id) for app_id in self.stats}
+
+    def _stats(self, app_id: str) -> GameStats:
+        stats = self.stats.get(app_id)
+        if stats is None:
+            stats = self.stats[app_id] = GameStats()
+        return stats
+
+    def _restat(self, record: ScreenshotRecord, mtime: float, size: int):
+        stats = self._stats(record.app_id)
+        stats.discard(record.mtime, record.size)
+        stats.add(mtime, size)
+        record.mtime = mtime
+        record.size = size
+
+    def sorted_rows(self, sort_order: str) -> List[int]:
+        """Every row in display order for a screenshot sort order"""
+        order = self._order(SORT_FIELDS.get(sort_order, 'mtime'))
+        return order[::-1] if sort_order in SORT_DESCENDING else list(order)
+
+    def sort_ranks(self, sort_order: str) -> List[int]:
+        """Position of each row in the ascending order of the sort's field"""
+        field = SORT_FIELDS.get(sort_order, 'mtime')
+        ranks = self.ranks.get(field)
+        if ranks is None:
+            ranks = [0] * len(self.records)
+            for position, row in enumerate(self._order(field)):
+                ranks[row] = position
+            self.ranks[field] = ranks
+        return ranks
+
+    def rows_in_range(self, field: str, low=None, high=None) -> List[int]:
+        """
+        Rows whose ``field`` ('mtime' or 'size') lies in ``[low, high]``,
+        in ascending key order; a None bound is open.
+        """
+        order = self._order(field)
+        column = self.columns[field]
+        start = 0 if low is None else _bisect(order, lambda row: column[row] < low)
+        end = len(order) if high is None else _bisect(order, lambda row: column[row] <= high)
+        return order[start:end]
+
+    def _order(self, field: str) -> List[int]:
+        order = self.orders.get(field)
+        if order is None:
+            column = self.columns[field]
+            order = sorted(range(len(column)), key=column.__getitem__)
+            self.orders[field] = order
+        return order
+
+    def _set_key(self, row: int, field: str):
+        key = _sort_key(self.records[row], field)
+        column = self.columns[field]
+        if column[row] == key:
+            return
+        column[row] = key
+        order = self.orders.get(field)
+        if order is not None:
+            # Move just this row within the cached order
+            order.remove(row)
+            _insert_row(order, column, row)
+        self.ranks.pop(field, None)
+
+    def _invalidate_sort(self):
+        self.orders.clear()
+        self.ranks.clear()
+
+    def game_records(self, app_id: str) -> List[ScreenshotRecord]:
+        return [self.records[row] for row in self.game_rows.get(app_id, [])]
+
+    def _reindex(self):
+        # Rows after a removal shift down; removals are rare enough to rebuild
+        self.rows_by_path = {record.path: row for row, record in enumerate(self.records)}
+        self.game_rows = {}
+        for row, record in enumerate(self.records):
+            self.game_rows.setdefault(record.app_id, []).append(row)
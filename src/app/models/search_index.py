@@ -0,0 +1,87 @@
+"""
+Substring search over short strings (file names, game names) via trigrams.
+
+Every indexed text is lowercased and split into its overlapping 3-character
+grams; each gram maps to the set of keys whose text contains it. A query of
+three or more characters intersects the posting sets of its own grams,
+smallest first, and only the surviving candidates are checked with a real
+substring test. Shorter queries have no gram to look up, and grams found in
+most texts narrow nothing down; both fall back to scanning the texts, which
+is cheaper than building and verifying a huge candidate set. Adding or
+removing a key touches only its own grams.
+"""
+
+from typing import Dict, Hashable, Set
+
+_NO_KEYS = frozenset()
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    def __init__(self):
+        self.texts: Dict[Hashable, str] = {}
+        self.postings: Dict[str, Set[Hashable]] = {}
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __contains__(self, key):
+        return key in self.texts
+
+    def add(self, key: Hashable, text: str):
+        """Index ``text`` under ``key``, replacing whatever the key had before"""
+        text = text.lower()
+        old = self.texts.get(key)
+        if old == text:
+            return
+        if old is not None:
+            self.remove(key)
+        self.texts[key] = text
+        postings = self.postings
+        for gram in trigrams(text):
+            keys = postings.get(gram)
+            if keys is None:
+                postings[gram] = {key}
+            else:
+                keys.add(key)
+
+    def remove(self, key: Hashable):
+        text = self.texts.pop(key, None)
+        if text is None:
+            return
+        for gram in trigrams(text):
+            keys = self.postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.postings[gram]
+
+    def clear(self):
+        self.texts = {}
+        self.postings = {}
+
+    def matches(self, key: Hashable, query: str) -> bool:
+        return query.lower() in self.texts.get(key, '')
+
+    def search(self, query: str) -> Set[Hashable]:
+        """Keys whose text contains ``query`` (case-insensitive)"""
+        query = query.lower()
+        if len(query) < 3:
+            return self._scan(query)
+        postings = sorted((self.postings.get(gram, _NO_KEYS) for gram in trigrams(query)), key=len)
+        if not postings[0]:
+            return set()
+        if len(query) == 3:
+            return set(postings[0])
+        if len(postings[0]) * 2 > len(self.texts):
+            return self._scan(query)
+        candidates = postings[0].intersection(*[keys for keys in postings[1:] if len(keys) * 2 < len(self.texts)])
+        # Sharing every gram does not guarantee the grams are adjacent
+        texts = self.texts
+        return {key for key in candidates if query in texts[key]}
+
+    def _scan(self, query: str) -> Set[Hashable]:
+        return {key for key, text in self.texts.items() if query in text}
@@ -0,0 +1,132 @@
+"""
+Streaming import of Steam's GetAppList into the game name store.
+
+The payload (``{"applist": {"apps": [{"appid": ..., "name": ...}, ...]}}``)
+runs to many megabytes, so it is never loaded whole: chunks are decoded
+incrementally and each app object is parsed as soon as it is complete.
+Names are compared with the store in batches and only new or changed ones
+are written. The response's ETag / Last-Modified are recorded so the next
+import can be answered with a 304 and skipped entirely.
+"""
+
+import codecs
+import json
+import logging
+import re
+import time
+from typing import Iterable, Iterator, Tuple
+
+from ..models.game_name_store import BASELINE, FETCHED
+
+BATCH_SIZE = 5000
+CHUNK_SIZE = 64 * 1024
+
+ETAG_KEY = 'app_list_etag'
+LAST_MODIFIED_KEY = 'app_list_last_modified'
+COUNT_KEY = 'app_list_count'
+
+APPS_ARRAY = re.compile(r'"apps"\s*:\s*\[')
+SEPARATORS = ' \t\r\n,'
+
+logger = logging.getLogger('AppListImport')
+
+
+def iter_apps(chunks: Iterable[bytes]) -> Iterator[Tuple[str, str]]:
+    """Yield ``(app_id, name)`` from GetAppList JSON arriving in byte chunks"""
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    in_array = False
+    for chunk in chunks:
+        buffer += text.decode(chunk)
+        if not in_array:
+            match = APPS_ARRAY.search(buffer)
+            if match is None:
+                # Keep enough of the tail for a key split across chunks
+                buffer = buffer[-64:]
+                continue
+            in_array = True
+            buffer = buffer[match.end():]
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in SEPARATORS:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == ']':
+                return
+            try:
+                app, pos = decoder.raw_decode(buffer, pos)
+            except ValueError:
+                break  # The object continues in the next chunk
+            if isinstance(app, dict) and app.get('name') and 'appid' in app:
+                yield str(app['appid']), app['name']
+        buffer = buffer[pos:]
+    raise ValueError("App list ended before the apps array was closed")
+
+
+class ImportResult:
+    def __init__(self):
+        self.not_modified = False
+        self.seen = 0
+        self.written = 0
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        if self.not_modified:
+            return "ImportResult(not modified)"
+        return f"ImportResult(seen={self.seen}, written={self.written}, elapsed={self.elapsed:.2f}s)"
+
+
+def import_apps(store, apps: Iterable[Tuple[str, str]], batch_size: int = BATCH_SIZE) -> ImportResult:
+    """Write apps whose name differs from what the store already has (fetched, else baseline)"""
+    result = ImportResult()
+    started = time.perf_counter()
+    batch = []
+
+    def apply(batch):
+        known = store.lookup_many([app_id for app_id, _ in batch], (FETCHED, BASELINE))
+        changed = [(app_id, name) for app_id, name in batch if known.get(app_id) != name]
+        if changed:
+            result.written += store.set_names(FETCHED, changed)
+
+    for app in apps:
+        batch.append(app)
+        result.seen += 1
+        if len(batch) >= batch_size:
+            apply(batch)
+            batch = []
+    if batch:
+        apply(batch)
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def update_app_list(client, store) -> ImportResult:
+    """
+    Conditionally download GetAppList and apply it to ``store``.
+
+    Raises ``requests.RequestException`` if the download fails and
+    ``ValueError`` if the payload is cut short or malformed. The recorded
+    ETag is only replaced after a complete import, so an interrupted one is
+    simply redone.
+    """
+    response = client.open_app_list(store.get_meta(ETAG_KEY), store.get_meta(LAST_MODIFIED_KEY))
+    try:
+        if response.status_code == 304:
+            result = ImportResult()
+            result.not_modified = True
+            logger.info("App list not modified since last import")
+            return result
+        response.raise_for_status()
+        result = import_apps(store, iter_apps(response.iter_content(CHUNK_SIZE)))
+    finally:
+        response.close()
+
+    for key, value in ((ETAG_KEY, response.headers.get('ETag')),
+                       (LAST_MODIFIED_KEY, response.headers.get('Last-Modified')),
+                       (COUNT_KEY, str(result.seen))):
+        if value:
+            store.set_meta(key, value)
+    logger.info(f"Imported app list: {result}")
+    return result
@@ -0,0 +1,120 @@
+"""
+Grouping screenshots whose perceptual hashes are within a few bits.
+
+Hashes go into a BK-tree keyed on Hamming distance, so each lookup only
+visits subtrees whose distance band can still hold a match instead of
+comparing against every other screenshot. Matches are merged with
+union-find, so chains of near-identical burst frames form one group.
+"""
+
+from typing import Dict, Hashable, List, Tuple
+
+# Bits out of 64 that may differ for two screenshots to count as near-duplicates
+PHASH_THRESHOLD = 10
+DHASH_THRESHOLD = 10
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+class BKTree:
+    """Metric tree over 64-bit hashes; items with equal hashes share a node."""
+
+    def __init__(self):
+        self.root = None  # [hash, items, {distance: child}]
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, value: int, item: Hashable):
+        self.size += 1
+        if self.root is None:
+            self.root = [value, [item], {}]
+            return
+        node = self.root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value, [item], {}]
+                return
+            node = child
+
+    def search(self, value: int, radius: int) -> List[Tuple[int, Hashable]]:
+        """``(distance, item)`` for every item within ``radius`` bits of ``value``"""
+        found = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            distance = hamming(value, node[0])
+            if distance <= radius:
+                found.extend((distance, item) for item in node[1])
+            # Triangle inequality: only children in this band can be close enough
+            for child_distance, child in node[2].items():
+                if distance - radius <= child_distance <= distance + radius:
+                    stack.append(child)
+        return found
+
+
+class DuplicateGroup:
+    __slots__ = ('paths', 'identical')
+
+    def __init__(self, paths: List[str], identical: bool):
+        self.paths = paths
+        self.identical = identical  # Every member has the same hashes
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __repr__(self):
+        kind = "identical" if self.identical else "similar"
+        return f"DuplicateGroup({len(self.paths)} {kind})"
+
+
+def group_duplicates(hashes: Dict[str, Tuple[int, int]], phash_threshold: int = PHASH_THRESHOLD,
+                     dhash_threshold: int = DHASH_THRESHOLD) -> List[DuplicateGroup]:
+    """
+    Groups of two or more paths whose ``(dhash, phash)`` are close.
+
+    Candidates come from a pHash BK-tree lookup; a dHash check then weeds
+    out images that only share coarse structure.
+    """
+    tree = BKTree()
+    for path, (_, phash) in hashes.items():
+        tree.add(phash, path)
+
+    parent: Dict[str, str] = {}
+
+    def find(path):
+        root = path
+        while parent.get(root, root) != root:
+            root = parent[root]
+        while path != root:
+            parent[path], path = root, parent.get(path, path)
+        return root
+
+    for path, (dhash, phash) in hashes.items():
+        for _, other in tree.search(phash, phash_threshold):
+            if other != path and hamming(dhash, hashes[other][0]) <= dhash_threshold:
+                a, b = find(path), find(other)
+                if a != b:
+                    parent.setdefault(a, a)
+                    parent[b] = a
+
+    members: Dict[str, List[str]] = {}
+    for path in parent:
+        members.setdefault(find(path), []).append(path)
+    groups = []
+    for paths in members.values():
+        if len(paths) < 2:
+            continue
+        paths.sort()
+        identical = len({hashes[path] for path in paths}) == 1
+        groups.append(DuplicateGroup(paths, identical))
+    groups.sort(key=len, reverse=True)
+    return groups
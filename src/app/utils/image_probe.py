@@ -0,0 +1,72 @@
+"""
+Reads image dimensions from file headers without decoding any pixels.
+
+PNG keeps them in the IHDR chunk right after the signature; JPEG keeps them
+in the first SOF segment, which is found by seeking from marker to marker.
+Either way only a few hundred bytes are read.
+"""
+
+import struct
+from typing import Optional, Tuple
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# SOF0-SOF15, minus DHT (C4), JPG (C8) and DAC (CC) which share the range
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers with no length field after them
+JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+
+
+def _png_dimensions(f) -> Optional[Tuple[int, int]]:
+    header = f.read(8)  # Chunk length and type
+    if len(header) < 8 or header[4:] != b'IHDR':
+        return None
+    data = f.read(8)
+    if len(data) < 8:
+        return None
+    return struct.unpack('>II', data)
+
+
+def _jpeg_dimensions(f) -> Optional[Tuple[int, int]]:
+    while True:
+        byte = f.read(1)
+        # Skip to the next marker, including any fill bytes
+        while byte and byte != b'\xff':
+            byte = f.read(1)
+        while byte == b'\xff':
+            byte = f.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker == 0xDA or marker == 0xD9:  # Start of scan / end of image: no SOF
+            return None
+        if marker in JPEG_STANDALONE_MARKERS:
+            continue
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+        if length < 2:
+            return None
+        if marker in JPEG_SOF_MARKERS:
+            data = f.read(5)
+            if len(data) < 5:
+                return None
+            height, width = struct.unpack('>xHH', data)
+            return width, height
+        f.seek(length - 2, 1)
+
+
+def probe_dimensions(path: str) -> Optional[Tuple[int, int]]:
+    """Return ``(width, height)`` from the PNG or JPEG header, or None if unknown"""
+    try:
+        with open(path, 'rb') as f:
+            signature = f.read(8)
+            if signature == PNG_SIGNATURE:
+                return _png_dimensions(f)
+            if signature[:2] == b'\xff\xd8':
+                f.seek(2)
+                return _jpeg_dimensions(f)
+    except (OSError, struct.error):
+        pass
+    return None
@@ -5,7 +5,7 @@ from pathlib import Path
 
 def setup_logging():
     """Configure logging for the application."""
-    log_dir = Path(os.getenv('APPDATA')) / 'Game Screenshot Viewer' / 'Logs'
+    log_dir = Path(os.getenv('APPDATA') or Path.home()) / 'Game Screenshot Viewer' / 'Logs'
     log_dir.mkdir(parents=True, exist_ok=True)
     
     logging.basicConfig(
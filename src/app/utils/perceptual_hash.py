@@ -0,0 +1,92 @@
+"""
+Perceptual hashes of screenshots, for finding duplicates and near-duplicates.
+
+Each image is decoded straight to a tiny grayscale array (JPEG draft mode
+skips most of the decode), then a whole batch is hashed at once with NumPy:
+
+* dHash: 9x8 pixels, one bit per horizontally adjacent pair, set when the
+  right pixel is brighter.
+* pHash: 32x32 pixels, 2-D DCT as two matrix products, one bit per
+  low-frequency 8x8 coefficient above that image's median.
+
+Both are 64-bit ints; similar images differ in few bits. ``hash_files`` is
+the unit of work for a process pool and never raises.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+PHASH_SIZE = 32
+PHASH_LOW = 8
+DHASH_WIDTH, DHASH_HEIGHT = 9, 8
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    """Orthonormal DCT-II basis; ``m @ x @ m.T`` is the 2-D DCT of ``x``"""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    m = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    m[0] /= np.sqrt(2)
+    return m.astype(np.float32)
+
+
+DCT = _dct_matrix(PHASH_SIZE)
+
+
+def _pack(bits: np.ndarray) -> List[int]:
+    """(N, 64) booleans to N ints, first bit most significant"""
+    packed = np.packbits(bits, axis=1)
+    return [int(value) for value in packed.view('>u8').ravel()]
+
+
+def dhash_batch(pixels: np.ndarray) -> List[int]:
+    """dHash of a stack of (8, 9) grayscale images"""
+    bits = pixels[:, :, 1:] > pixels[:, :, :-1]
+    return _pack(bits.reshape(len(pixels), -1))
+
+
+def phash_batch(pixels: np.ndarray) -> List[int]:
+    """pHash of a stack of (32, 32) grayscale images"""
+    coeffs = DCT @ pixels @ DCT.T
+    low = coeffs[:, :PHASH_LOW, :PHASH_LOW].reshape(len(pixels), -1)
+    # The DC term only says how bright the image is, so it stays out of the median
+    median = np.median(low[:, 1:], axis=1, keepdims=True)
+    return _pack(low > median)
+
+
+def load_gray(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """The (32, 32) pHash and (8, 9) dHash inputs for one image"""
+    with Image.open(path) as image:
+        image.draft('L', (PHASH_SIZE * 2, PHASH_SIZE * 2))
+        image = image.convert('L')
+        small = image.resize((PHASH_SIZE, PHASH_SIZE), Image.Resampling.BOX)
+        tiny = image.resize((DHASH_WIDTH, DHASH_HEIGHT), Image.Resampling.BOX)
+    return np.asarray(small, dtype=np.float32), np.asarray(tiny, dtype=np.int16)
+
+
+def hash_files(items: Sequence[Tuple[str, Optional[str]]]) -> List[Tuple[str, Optional[int], Optional[int]]]:
+    """
+    ``(dhash, phash)`` for a batch of ``(path, thumbnail)`` pairs.
+
+    The small thumbnail is decoded when there is one, the screenshot itself
+    otherwise. Returns ``(path, dhash, phash)`` per item, with None hashes
+    for files that could not be read.
+    """
+    loaded, failed = [], []
+    for path, thumbnail in items:
+        for source in filter(None, (thumbnail, path)):
+            try:
+                loaded.append((path, *load_gray(source)))
+                break
+            except (OSError, ValueError, Image.DecompressionBombError):
+                continue
+        else:
+            failed.append((path, None, None))
+    if not loaded:
+        return failed
+    paths = [path for path, _, _ in loaded]
+    phashes = phash_batch(np.stack([small for _, small, _ in loaded]))
+    dhashes = dhash_batch(np.stack([tiny for _, _, tiny in loaded]))
+    return list(zip(paths, dhashes, phashes)) + failed
@@ -0,0 +1,228 @@
+"""
+Finds Steam screenshots on disk.
+
+Screenshots live in ``<steam>/userdata/<user>/760/remote/<appid>/screenshots``.
+Scans walk those folders with ``os.scandir`` (directory entries carry stat
+data for free on Windows) and fan out across folders on a thread pool. Each
+screenshots folder is scanned as a unit so a rescan can skip folders whose
+directory mtime has not changed since the last one.
+"""
+
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional
+
+from ..models.screenshot_index import ScreenshotRecord
+from .image_probe import probe_dimensions
+
+SCREENSHOT_EXTENSIONS = ('.jpg', '.png')
+DEFAULT_SCAN_WORKERS = 8
+
+logger = logging.getLogger('ScreenshotScanner')
+
+
+def default_library_roots() -> List[str]:
+    """Steam install folders that exist on this machine, without duplicates"""
+    if sys.platform == 'win32':
+        candidates = [
+            os.path.expandvars(r"%ProgramFiles(x86)%\\Steam"),
+            os.path.expandvars(r"%ProgramFiles%\\Steam"),
+        ]
+    elif sys.platform == 'darwin':
+        candidates = [os.path.expanduser("~/Library/Application Support/Steam")]
+    else:
+        candidates = [
+            os.path.expanduser("~/.steam/steam"),
+            os.path.expanduser("~/.local/share/Steam"),
+            os.path.expanduser("~/.var/app/com.valvesoftware.Steam/.local/share/Steam"),
+        ]
+    return unique_roots(root for root in candidates if os.path.isdir(root))
+
+
+def unique_roots(roots: Iterable[str]) -> List[str]:
+    """Drop roots that resolve to the same folder (``~/.steam/steam`` is usually a symlink)"""
+    seen = set()
+    result = []
+    for root in roots:
+        real = os.path.normcase(os.path.realpath(root))
+        if real not in seen:
+            seen.add(real)
+            result.append(root)
+    return result
+
+
+def userdata_folders(roots: Iterable[str]) -> List[str]:
+    """The ``userdata`` folders of the given Steam roots that exist"""
+    folders = (os.path.join(root, "userdata") for root in roots)
+    return [folder for folder in folders if os.path.isdir(folder)]
+
+
+def steam_thumbnail_path(path: str, mtime: float, thumbnails: Optional[Dict[str, float]] = None) -> Optional[str]:
+    """
+    Return Steam's own downscaled copy of a screenshot if it is up to date.
+
+    Steam writes one into ``<appid>/screenshots/thumbnails/`` under the same
+    name (always as a JPEG). Copies older than the original are ignored.
+    ``thumbnails`` (name -> mtime) avoids a stat per lookup when a whole
+    folder is being scanned.
+    """
+    folder, filename = os.path.split(path)
+    thumbnails_folder = os.path.join(folder, 'thumbnails')
+    candidates = [filename]
+    stem, ext = os.path.splitext(filename)
+    if ext.lower() != '.jpg':
+        candidates.append(stem + '.jpg')
+    for candidate in candidates:
+        if thumbnails is not None:
+            thumbnail_mtime = thumbnails.get(candidate)
+            if thumbnail_mtime is None:
+                continue
+        else:
+            try:
+                thumbnail_mtime = os.stat(os.path.join(thumbnails_folder, candidate)).st_mtime
+            except OSError:
+                continue
+        if thumbnail_mtime >= mtime:
+            return os.path.join(thumbnails_folder, candidate)
+    return None
+
+
+class ScanResult:
+    """What changed on disk compared to the folder mtimes a scan was given."""
+
+    def __init__(self):
+        self.folder_mtimes: Dict[str, float] = {}  # every screenshots folder found
+        self.changed: Dict[str, List[ScreenshotRecord]] = {}  # folder -> its current records
+        self.removed: set = set()  # folders that no longer exist
+        self.files_scanned = 0
+        self.elapsed = 0.0
+
+    def records(self) -> List[ScreenshotRecord]:
+        return [record for records in self.changed.values() for record in records]
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files_scanned / self.elapsed if self.elapsed else 0.0
+
+
+def _subdirectories(path: str):
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
+
+
+def _user_screenshot_folders(user_folder: str) -> Dict[str, str]:
+    folders = {}
+    for app_entry in _subdirectories(os.path.join(user_folder, "760", "remote")):
+        folder = os.path.join(app_entry.path, "screenshots")
+        if os.path.isdir(folder):
+            folders[folder] = app_entry.name
+    return folders
+
+
+def find_screenshot_folders(roots: Iterable[str], executor: Optional[ThreadPoolExecutor] = None) -> Dict[str, str]:
+    """Map every ``.../<appid>/screenshots`` folder under the roots to its app id"""
+    user_folders = [entry.path for userdata in userdata_folders(roots) for entry in _subdirectories(userdata)]
+    mapper = executor.map if executor else map
+    folders = {}
+    for user_result in mapper(_user_screenshot_folders, user_folders):
+        folders.update(user_result)
+    return folders
+
+
+def scan_folder(folder: str, app_id: str) -> List[ScreenshotRecord]:
+    """Stat every screenshot in one folder and read its dimensions from the header"""
+    thumbnails = {}
+    try:
+        with os.scandir(os.path.join(folder, 'thumbnails')) as entries:
+            for entry in entries:
+                try:
+                    thumbnails[entry.name] = entry.stat().st_mtime
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+    records = []
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(SCREENSHOT_EXTENSIONS):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    record = ScreenshotRecord.from_stat(entry.path, app_id, entry.stat())
+                except OSError:
+                    continue
+                # Resolved here so the icon loader does not have to look for it
+                record.thumbnail = steam_thumbnail_path(entry.path, record.mtime, thumbnails) or ''
+                record.width, record.height = probe_dimensions(entry.path) or (0, 0)
+                records.append(record)
+    except OSError as e:
+        logger.error(f"Error scanning {folder}: {e}")
+    return records
+
+
+def _scan_one(job):
+    folder, app_id, known_mtime, full = job
+    try:
+        mtime = os.stat(folder).st_mtime
+    except OSError:
+        return folder, None, None
+    if not full and known_mtime == mtime:
+        return folder, mtime, None
+    return folder, mtime, scan_folder(folder, app_id)
+
+
+def iter_scan_library(roots: Iterable[str], known_folder_mtimes: Optional[Dict[str, float]] = None,
+                      full: bool = False, max_workers: int = DEFAULT_SCAN_WORKERS):
+    """
+    Yield ``(folder, mtime, records)`` for each screenshots folder as soon as it is scanned.
+
+    ``records`` is None for folders skipped because their mtime matches
+    ``known_folder_mtimes`` (unless ``full`` is set). Folders come back in
+    completion order, not path order.
+    """
+    known_folder_mtimes = known_folder_mtimes or {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        folders = find_screenshot_folders(roots, executor)
+        futures = [executor.submit(_scan_one, (folder, app_id, known_folder_mtimes.get(folder), full))
+                   for folder, app_id in folders.items()]
+        for future in as_completed(futures):
+            folder, mtime, records = future.result()
+            if mtime is not None:
+                yield folder, mtime, records
+
+
+def scan_library(roots: Iterable[str], known_folder_mtimes: Optional[Dict[str, float]] = None,
+                 full: bool = False, max_workers: int = DEFAULT_SCAN_WORKERS, on_folder=None) -> ScanResult:
+    """
+    Scan every screenshots folder under the given Steam roots.
+
+    Folders whose mtime matches ``known_folder_mtimes`` are skipped unless
+    ``full`` is set; known folders that are gone end up in ``removed``.
+    ``on_folder(folder, records)`` is called for each rescanned folder as it
+    completes, so callers can stream results before the scan is done.
+    """
+    known_folder_mtimes = known_folder_mtimes or {}
+    result = ScanResult()
+    started = time.perf_counter()
+    for folder, mtime, records in iter_scan_library(roots, known_folder_mtimes, full, max_workers):
+        result.folder_mtimes[folder] = mtime
+        if records is not None:
+            result.changed[folder] = records
+            result.files_scanned += len(records)
+            if on_folder is not None:
+                on_folder(folder, records)
+    result.removed = set(known_folder_mtimes) - set(result.folder_mtimes)
+    result.elapsed = time.perf_counter() - started
+    logger.info(f"Scanned {len(result.changed)}/{len(result.folder_mtimes)} folders, "
+                f"{result.files_scanned} files in {result.elapsed:.2f}s "
+                f"({result.files_per_second:.0f} files/s)")
+    return result
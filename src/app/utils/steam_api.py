@@ -1,27 +1,242 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
 import requests
-from typing import Optional
-from pathlib import Path
 
 STEAM_API_URL = "https://api.steampowered.com/ISteamApps/GetAppList/v2/"
 STORE_API_URL = "https://store.steampowered.com/api/appdetails"
 
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT = 5
+# The store API allows roughly 200 requests per 5 minutes per address
+DEFAULT_RATE = 0.6  # Requests per second, sustained
+DEFAULT_BURST = 20
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5  # Seconds; doubled per attempt, then jittered
+MAX_BACKOFF = 30  # Seconds; also caps what a Retry-After header can ask for
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+logger = logging.getLogger('SteamApi')
+
+
+def create_session(pool_size: int = DEFAULT_WORKERS) -> requests.Session:
+    """A session whose connection pool can serve ``pool_size`` threads at once."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def parse_app_name(data, app_id: str) -> Optional[str]:
+    """The name in an appdetails response for one app, or None if Steam has none"""
+    entry = data.get(str(app_id)) if isinstance(data, dict) else None
+    if isinstance(entry, dict) and entry.get('success'):
+        return (entry.get('data') or {}).get('name') or None
+    return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens a second, holding at most ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available; returns seconds waited"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class LatencyStats:
+    """Per-request latency and outcome counters, safe to update from worker threads."""
+
+    def __init__(self, window: int = 1000):
+        self.lock = threading.Lock()
+        self.samples = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def record(self, seconds: float, ok: bool):
+        with self.lock:
+            self.samples.append(seconds)
+            self.requests += 1
+            if not ok:
+                self.errors += 1
+
+    def add(self, retries: int = 0, throttled: int = 0, wait_seconds: float = 0.0):
+        with self.lock:
+            self.retries += retries
+            self.throttled += throttled
+            self.wait_seconds += wait_seconds
+
+    def snapshot(self) -> Dict[str, float]:
+        with self.lock:
+            samples = sorted(self.samples)
+            snapshot = {
+                'requests': self.requests,
+                'errors': self.errors,
+                'retries': self.retries,
+                'throttled': self.throttled,
+                'rate_limit_wait': round(self.wait_seconds, 3),
+            }
+        if samples:
+            snapshot.update({
+                'p50': round(samples[len(samples) // 2], 3),
+                'p95': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+                'max': round(samples[-1], 3),
+            })
+        return snapshot
+
+
+class SteamApiClient:
+    """
+    Shared client for the Steam Web and store APIs.
+
+    One pooled session serves every request. Requests are paced by a token
+    bucket, retried with jittered exponential backoff on connection errors,
+    429 and 5xx (honouring ``Retry-After`` up to ``MAX_BACKOFF``), and timed
+    into ``stats``.
+    ``submit_*`` methods run on a bounded worker pool and return futures.
+    """
+
+    def __init__(self, store_url: str = STORE_API_URL, app_list_url: str = STEAM_API_URL,
+                 workers: int = DEFAULT_WORKERS, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 max_retries: int = MAX_RETRIES, timeout: float = DEFAULT_TIMEOUT):
+        self.store_url = store_url
+        self.app_list_url = app_list_url
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.session = create_session(workers)
+        self.bucket = TokenBucket(rate, burst)
+        self.stats = LatencyStats()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='steam-api')
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET with rate limiting and retries; raises ``requests.RequestException`` when out of attempts"""
+        kwargs.setdefault('timeout', self.timeout)
+        for attempt in range(self.max_retries + 1):
+            self.stats.add(wait_seconds=self.bucket.acquire())
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, **kwargs)
+            except requests.RequestException:
+                self.stats.record(time.perf_counter() - started, ok=False)
+                if attempt == self.max_retries:
+                    raise
+                self._back_off(attempt)
+                continue
+            ok = response.status_code not in RETRY_STATUSES
+            self.stats.record(time.perf_counter() - started, ok=ok)
+            if ok or attempt == self.max_retries:
+                return response
+            if response.status_code == 429:
+                self.stats.add(throttled=1)
+            self._back_off(attempt, response.headers.get('Retry-After'))
+            response.close()
+        raise requests.RequestException(f"Out of retries for {url}")
+
+    def _back_off(self, attempt: int, retry_after: Optional[str] = None):
+        self.stats.add(retries=1)
+        try:
+            delay = float(retry_after)
+            if not delay >= 0:  # Negative or NaN
+                raise ValueError(retry_after)
+        except (TypeError, ValueError):
+            # Full jitter keeps parallel workers from retrying in lockstep
+            delay = random.uniform(0, BACKOFF_BASE * (2 ** attempt))
+        time.sleep(min(delay, MAX_BACKOFF))
+
+    def fetch_app_name(self, app_id: str) -> Optional[str]:
+        """
+        Name of one app from the store's appdetails endpoint, or None if Steam has none.
+
+        appdetails only honours a single ID per request, so callers look
+        several apps up by submitting one ``submit_app_name`` per ID.
+        """
+        response = self.get(self.store_url, params={'appids': str(app_id)})
+        response.raise_for_status()
+        return parse_app_name(response.json(), app_id)
+
+    def submit_app_name(self, app_id: str) -> Future:
+        return self.executor.submit(self.fetch_app_name, app_id)
+
+    def fetch_app_list(self) -> dict:
+        """The complete GetAppList payload"""
+        response = self.get(self.app_list_url)
+        response.raise_for_status()
+        return response.json()
+
+    def open_app_list(self, etag: Optional[str] = None, last_modified: Optional[str] = None) -> requests.Response:
+        """
+        Streamed, conditional GetAppList request; the caller must close the response.
+
+        A 304 status means the list has not changed since ``etag`` / ``last_modified``.
+        """
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return self.get(self.app_list_url, headers=headers, stream=True)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+        logger.info(f"Steam API requests: {self.stats.snapshot()}")
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def default_client() -> SteamApiClient:
+    """Process-wide client, created on first use"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = SteamApiClient()
+        return _default_client
+
+
 def fetch_steam_app_list() -> Optional[dict]:
     """Fetch the complete Steam app list from their API."""
     try:
-        response = requests.get(STEAM_API_URL, timeout=5)
-        if response.status_code == 200:
-            return response.json()
-    except requests.RequestException as e:
-        logging.error(f"Steam API request failed: {e}")
+        return default_client().fetch_app_list()
+    except (requests.RequestException, ValueError) as e:
+        logger.error(f"Steam API request failed: {e}")
     return None
 
+
 def fetch_app_details(app_id: str) -> Optional[dict]:
     """Fetch details for a specific Steam app."""
     try:
-        url = f"{STORE_API_URL}?appids={app_id}"
-        response = requests.get(url, timeout=5)
+        client = default_client()
+        response = client.get(client.store_url, params={'appids': str(app_id)})
         if response.status_code == 200:
             return response.json()
-    except requests.RequestException as e:
-        logging.error(f"Steam Store API request failed: {e}")
-    return None 
\ No newline at end of file
+    except (requests.RequestException, ValueError) as e:
+        logger.error(f"Steam Store API request failed: {e}")
+    return None
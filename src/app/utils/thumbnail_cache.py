@@ -0,0 +1,162 @@
+"""
+Persistent, size-bounded thumbnail cache stored in the user's AppData folder.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from ..models.database import app_data_path
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+INDEX_VERSION = 1
+
+
+def default_cache_dir() -> str:
+    return app_data_path('thumbnails')
+
+
+def thumbnail_key(path: str, mtime: float, size: int) -> str:
+    """Cache key for one version of a source file; changes whenever the file does."""
+    raw = f"{os.path.normcase(os.path.abspath(path))}|{int(mtime * 1000)}|{size}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class ThumbnailCache:
+    """
+    Maps (path, mtime, size) to a small pre-scaled JPEG on disk.
+
+    Entries are kept in least-recently-used order and evicted once the total
+    size exceeds ``max_bytes``. Storing a new version of a path drops the old
+    one, so edited screenshots never show a stale thumbnail. Safe to call from
+    worker threads.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.logger = logging.getLogger('ThumbnailCache')
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.index_file = os.path.join(self.cache_dir, 'index.json')
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (source path, bytes), oldest first
+        self.path_keys = {}  # source path -> key of its current entry
+        self.total_bytes = 0
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load the LRU index written by the previous session"""
+        try:
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == INDEX_VERSION:
+                    for key, path, size in data.get('entries', []):
+                        self.entries[key] = (path, size)
+                        self.path_keys[path] = key
+                        self.total_bytes += size
+                    self.logger.debug(f"Loaded {len(self.entries)} thumbnail cache entries")
+        except Exception as e:
+            self.logger.error(f"Error loading thumbnail cache index: {e}")
+            self.entries.clear()
+            self.path_keys.clear()
+            self.total_bytes = 0
+
+    def save(self):
+        """Persist the LRU index if anything changed since the last save"""
+        with self.lock:
+            if not self.dirty:
+                return
+            data = {
+                'version': INDEX_VERSION,
+                'entries': [[key, path, size] for key, (path, size) in self.entries.items()]
+            }
+            self.dirty = False
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_file = self.index_file + '.tmp'
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.index_file)
+        except Exception as e:
+            self.logger.error(f"Error saving thumbnail cache index: {e}")
+
+    def file_for_key(self, key: str) -> str:
+        """On-disk location of a thumbnail, sharded to keep folders small"""
+        return os.path.join(self.cache_dir, key[:2], key + '.jpg')
+
+    def lookup(self, path: str, mtime: float, size: int) -> Optional[str]:
+        """Return the cached thumbnail file for this version of ``path``, or None"""
+        key = thumbnail_key(path, mtime, size)
+        with self.lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+            self.dirty = True
+        thumbnail_file = self.file_for_key(key)
+        if os.path.exists(thumbnail_file):
+            return thumbnail_file
+        # Deleted behind our back
+        with self.lock:
+            self._discard(key)
+        return None
+
+    def reserve(self, path: str, mtime: float, size: int) -> str:
+        """Return the file a new thumbnail for ``path`` should be written to"""
+        thumbnail_file = self.file_for_key(thumbnail_key(path, mtime, size))
+        os.makedirs(os.path.dirname(thumbnail_file), exist_ok=True)
+        return thumbnail_file
+
+    def add(self, path: str, mtime: float, size: int):
+        """Record a thumbnail written to ``reserve()``'s file and evict to the budget"""
+        key = thumbnail_key(path, mtime, size)
+        try:
+            file_size = os.path.getsize(self.file_for_key(key))
+        except OSError:
+            return
+        with self.lock:
+            old_key = self.path_keys.get(path)
+            if old_key is not None and old_key != key:
+                self._discard(old_key)
+            self._discard(key, delete_file=False)
+            self.entries[key] = (path, file_size)
+            self.path_keys[path] = key
+            self.total_bytes += file_size
+            self.dirty = True
+            self._evict()
+
+    def invalidate(self, path: str):
+        """Drop any thumbnail for ``path``, e.g. after it was deleted or renamed"""
+        with self.lock:
+            key = self.path_keys.get(path)
+            if key is not None:
+                self._discard(key)
+
+    def set_max_bytes(self, max_bytes: int):
+        with self.lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and self.entries:
+            self._discard(next(iter(self.entries)))
+
+    def _discard(self, key, delete_file=True):
+        # Caller holds the lock
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        path, size = entry
+        self.total_bytes -= size
+        if self.path_keys.get(path) == key:
+            del self.path_keys[path]
+        self.dirty = True
+        if delete_file:
+            try:
+                os.remove(self.file_for_key(key))
+            except OSError:
+                pass
@@ -0,0 +1,81 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+from src.app.models.game_name_store import FETCHED, GameNameStore  # noqa: E402
+from src.app.utils.app_list_import import ETAG_KEY, iter_apps, update_app_list  # noqa: E402
+from src.app.utils.steam_api import SteamApiClient  # noqa: E402
+
+APPS = [{"appid": 10, "name": "Counter-Strike"}, {"appid": 440, "name": "Team Fortress 2"},
+        {"appid": 570, "name": "Dota 2"}, {"appid": 7, "name": ""}]
+BODY = json.dumps({"applist": {"apps": APPS}}).encode()
+ETAG = '"v1"'
+
+
+class AppListHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append(self.headers.get('If-None-Match'))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', ETAG)
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        # Small chunks, so app objects and keys are split across them
+        for i in range(0, len(BODY), 7):
+            chunk = BODY[i:i + 7]
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+        self.wfile.write(b'0\r\n\r\n')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), AppListHandler)
+    AppListHandler.requests_seen = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_iter_apps_handles_split_chunks():
+    chunks = [BODY[i:i + 3] for i in range(0, len(BODY), 3)]
+    assert list(iter_apps(chunks)) == [("10", "Counter-Strike"), ("440", "Team Fortress 2"), ("570", "Dota 2")]
+
+
+def test_iter_apps_rejects_truncated_payload():
+    with pytest.raises(ValueError):
+        list(iter_apps([BODY[:len(BODY) // 2]]))
+
+
+def test_update_app_list_against_stub_server(server):
+    client = SteamApiClient(app_list_url=server, rate=100, max_retries=0)
+    store = GameNameStore(':memory:')
+    try:
+        result = update_app_list(client, store)
+        assert (result.seen, result.written) == (3, 3)
+        assert store.get_layer(FETCHED, "440") == "Team Fortress 2"
+        assert store.get_meta(ETAG_KEY) == ETAG
+
+        # The recorded ETag turns the next import into a 304
+        assert update_app_list(client, store).not_modified
+        assert AppListHandler.requests_seen == [None, ETAG]
+    finally:
+        store.close()
+        client.close()
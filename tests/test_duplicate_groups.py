@@ -0,0 +1,49 @@
+import random
+
+from src.app.utils.duplicate_groups import BKTree, group_duplicates, hamming
+
+
+def test_hamming():
+    assert hamming(0, 0) == 0
+    assert hamming(0b1011, 0b0001) == 2
+    assert hamming(0, (1 << 64) - 1) == 64
+
+
+def test_bk_tree_search_matches_brute_force():
+    rng = random.Random(7)
+    base = [rng.getrandbits(64) for _ in range(20)]
+    # Clusters of near neighbours, so most radii find something
+    values = [value ^ (1 << rng.randrange(64)) ^ (1 << rng.randrange(64)) for value in base for _ in range(10)]
+    tree = BKTree()
+    for item, value in enumerate(values):
+        tree.add(value, item)
+    assert len(tree) == len(values)
+    for query in base:
+        for radius in (0, 2, 4, 12):
+            expected = sorted((hamming(query, value), item) for item, value in enumerate(values)
+                              if hamming(query, value) <= radius)
+            assert sorted(tree.search(query, radius)) == expected
+
+
+def test_group_duplicates_chains_near_matches():
+    far = 0xFFFF_FFFF_0000_0000
+    hashes = {
+        # a~b and b~c are within the threshold, a and c are not: one group through b
+        "a.jpg": (0, 0),
+        "b.jpg": (0, 0b111111),
+        "c.jpg": (0, 0b111111111111),
+        "copy1.jpg": (far, far),
+        "copy2.jpg": (far, far),
+        "alone.jpg": (0x0F0F_0F0F_0F0F_0F0F, 0x0F0F_0F0F_0F0F_0F0F),
+        # Close pHash, but a dHash that disagrees: not a duplicate of "a"
+        "lookalike.jpg": ((1 << 64) - 1, 0b1),
+    }
+    groups = group_duplicates(hashes, phash_threshold=8, dhash_threshold=8)
+    assert [(group.paths, group.identical) for group in groups] == [
+        (["a.jpg", "b.jpg", "c.jpg"], False),
+        (["copy1.jpg", "copy2.jpg"], True),
+    ]
+
+
+def test_group_duplicates_without_matches():
+    assert group_duplicates({"a.jpg": (0, 0), "b.jpg": ((1 << 64) - 1, (1 << 64) - 1)}) == []
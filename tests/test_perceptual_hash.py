@@ -0,0 +1,45 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from src.app.utils.duplicate_groups import hamming  # noqa: E402
+from src.app.utils.perceptual_hash import dhash_batch, hash_files, phash_batch  # noqa: E402
+
+
+def gradient(width, height):
+    """Dark on the left, bright on the right"""
+    return np.tile(np.linspace(0, 255, width, dtype=np.float32), (height, 1))
+
+
+def test_dhash_sets_a_bit_where_the_right_pixel_is_brighter():
+    rising = gradient(9, 8).astype(np.int16)
+    assert dhash_batch(np.stack([rising, rising[:, ::-1]])) == [(1 << 64) - 1, 0]
+
+
+def test_phash_ignores_brightness_but_not_structure():
+    rng = np.random.default_rng(3)
+    pattern = rng.uniform(0, 200, (32, 32)).astype(np.float32)
+    brighter = pattern + 40  # Only moves the DC term
+    other = rng.uniform(0, 200, (32, 32)).astype(np.float32)
+    same, shifted, different = phash_batch(np.stack([pattern, brighter, other]))
+    assert same == shifted
+    assert hamming(same, different) > 10
+
+
+def test_hash_files_prefers_the_thumbnail_and_reports_unreadable_files(tmp_path):
+    screenshot = tmp_path / "shot.png"
+    thumbnail = tmp_path / "thumb.png"
+    Image.fromarray(gradient(64, 48).astype(np.uint8)).save(screenshot)
+    Image.fromarray(gradient(64, 48)[:, ::-1].astype(np.uint8)).save(thumbnail)
+    broken = tmp_path / "broken.jpg"
+    broken.write_bytes(b"not an image")
+
+    results = {path: (dhash, phash) for path, dhash, phash in hash_files([
+        (str(screenshot), None), (str(screenshot) + "#thumb", str(thumbnail)),
+        (str(broken), None), (str(tmp_path / "gone.jpg"), str(tmp_path / "gone_thumb.jpg")),
+    ])}
+    assert results[str(broken)] == (None, None)
+    assert results[str(tmp_path / "gone.jpg")] == (None, None)
+    plain, from_thumbnail = results[str(screenshot)], results[str(screenshot) + "#thumb"]
+    assert plain[0] == (1 << 64) - 1 and from_thumbnail[0] == 0
@@ -0,0 +1,110 @@
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from src.app.gui.screenshot_model import PATH_ROLE, ScreenshotModel, ScreenshotProxyModel  # noqa: E402
+from src.app.models.screenshot_filter import ScreenshotFilter  # noqa: E402
+from src.app.models.screenshot_index import ScreenshotIndex, ScreenshotRecord  # noqa: E402
+
+
+class FakeThumbnailLoader(QtCore.QObject):
+    thumbnail_ready = QtCore.pyqtSignal(str, object)
+
+    def request(self, path, thumbnail=None):
+        pass
+
+
+@pytest.fixture
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def make_proxy(row_filter):
+    model = ScreenshotModel(ScreenshotIndex(), FakeThumbnailLoader(), None)
+    model.add_records([
+        ScreenshotRecord(f"shots/{name}.jpg", "440", mtime=mtime, size=size)
+        for name, mtime, size in [("alpha", 3, 300), ("bravo", 1, 100), ("charlie", 2, 200), ("delta", 4, 400)]
+    ])
+    proxy = ScreenshotProxyModel(model, game_id="440", row_filter=row_filter)
+    proxy.sort_by("A to Z")
+    return model, proxy
+
+
+def proxy_paths(proxy):
+    return [proxy.index(row, 0).data(PATH_ROLE) for row in range(proxy.rowCount())]
+
+
+def test_sorting_a_stale_proxy_keeps_its_rows(app):
+    row_filter = ScreenshotFilter()
+    row_filter.set_size_range(200, None)
+    model, proxy = make_proxy(row_filter)
+    assert proxy_paths(proxy) == ["shots/alpha.jpg", "shots/charlie.jpg", "shots/delta.jpg"]
+    held = QtCore.QPersistentModelIndex(proxy.index(0, 0))
+
+    # The filter changes while the tab is hidden, then the sort changes
+    row_filter.set_size_range(None, 250)
+    proxy.filter_stale = True
+    proxy.sort_by("Largest")
+
+    assert proxy_paths(proxy) == ["shots/delta.jpg", "shots/alpha.jpg", "shots/charlie.jpg"]
+    assert held.isValid() and held.data(PATH_ROLE) == "shots/alpha.jpg"
+
+    proxy.refilter()
+    assert proxy_paths(proxy) == ["shots/charlie.jpg", "shots/bravo.jpg"]
+    assert not proxy.filter_stale
+
+
+def test_sorting_after_the_filter_changed_refilters(app):
+    row_filter = ScreenshotFilter()
+    model, proxy = make_proxy(row_filter)
+    held = QtCore.QPersistentModelIndex(proxy.index(1, 0))
+    assert held.data(PATH_ROLE) == "shots/bravo.jpg"
+
+    # The filter changes but the proxy is not told before the next sort
+    row_filter.set_date_range(2, 3)
+    proxy.sort_by("Newest")
+
+    assert proxy_paths(proxy) == ["shots/alpha.jpg", "shots/charlie.jpg"]
+    assert not held.isValid()
+
+
+def test_sorting_after_a_shown_row_left_the_date_range(app):
+    row_filter = ScreenshotFilter()
+    row_filter.set_date_range(2, 3)
+    model, proxy = make_proxy(row_filter)
+    held = QtCore.QPersistentModelIndex(proxy.index(0, 0))
+    assert held.data(PATH_ROLE) == "shots/alpha.jpg"
+
+    model.update_records([ScreenshotRecord("shots/alpha.jpg", "440", mtime=40, size=300)])
+    proxy.sort_by("Newest")
+
+    assert proxy_paths(proxy) == ["shots/charlie.jpg"]
+    assert not held.isValid()
+
+
+def test_restat_moves_rows_across_the_date_range(app):
+    row_filter = ScreenshotFilter()
+    row_filter.set_date_range(2, 3)
+    model, proxy = make_proxy(row_filter)
+    assert proxy_paths(proxy) == ["shots/alpha.jpg", "shots/charlie.jpg"]
+
+    model.update_records([ScreenshotRecord("shots/alpha.jpg", "440", mtime=40, size=300)])
+    assert proxy_paths(proxy) == ["shots/charlie.jpg"]
+
+    model.update_records([ScreenshotRecord("shots/bravo.jpg", "440", mtime=2.5, size=100)])
+    model.update_records([ScreenshotRecord("shots/delta.jpg", "440", mtime=3, size=400)])
+    assert proxy_paths(proxy) == ["shots/bravo.jpg", "shots/charlie.jpg", "shots/delta.jpg"]
+
+
+def test_rename_out_of_the_search_query(app):
+    row_filter = ScreenshotFilter()
+    row_filter.set_query("a")
+    model, proxy = make_proxy(row_filter)
+    held = QtCore.QPersistentModelIndex(proxy.index(0, 0))
+    assert held.data(PATH_ROLE) == "shots/alpha.jpg"
+
+    model.rename_path("shots/alpha.jpg", "shots/echo.jpg")
+    assert "shots/echo.jpg" not in proxy_paths(proxy)
+    assert not held.isValid()
+    proxy.sort_by("Newest")
+    assert proxy_paths(proxy) == ["shots/delta.jpg", "shots/charlie.jpg", "shots/bravo.jpg"]
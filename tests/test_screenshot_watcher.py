@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from src.app.gui.screenshot_watcher import ScreenshotWatcher  # noqa: E402
+from src.app.models.screenshot_index import ScreenshotIndex, ScreenshotRecord  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def write(path, size):
+    with open(path, 'wb') as f:
+        f.write(b'\0' * size)
+    return ScreenshotRecord.from_stat(path, "440", os.stat(path))
+
+
+def watch(folder, records):
+    index = ScreenshotIndex()
+    index.append(records)
+    watcher = ScreenshotWatcher(record_lookup=index.get)
+    watcher.sync({folder: "440"}, {folder: [record.path for record in records]})
+    events = []
+    watcher.screenshots_added.connect(lambda records: events.append(('added', [r.path for r in records])))
+    watcher.screenshots_removed.connect(lambda paths: events.append(('removed', paths)))
+    watcher.screenshots_renamed.connect(
+        lambda pairs: events.append(('renamed', [(old, record.path) for old, record in pairs])))
+    return watcher, events
+
+
+def test_rename_keeps_size_and_mtime(app, tmp_path):
+    folder = str(tmp_path)
+    old = write(os.path.join(folder, "a.jpg"), 10)
+    watcher, events = watch(folder, [old])
+    new_path = os.path.join(folder, "b.jpg")
+    os.rename(old.path, new_path)
+    watcher.dirty.add(folder)
+    watcher.flush()
+    assert events == [('renamed', [(old.path, new_path)])]
+
+
+def test_delete_and_new_screenshot_is_not_a_rename(app, tmp_path):
+    folder = str(tmp_path)
+    old = write(os.path.join(folder, "a.jpg"), 10)
+    watcher, events = watch(folder, [old])
+    os.remove(old.path)
+    new = write(os.path.join(folder, "b.jpg"), 20)
+    watcher.dirty.add(folder)
+    watcher.flush()
+    assert events == [('removed', [old.path]), ('added', [new.path])]
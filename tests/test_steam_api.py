@@ -0,0 +1,115 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+from src.app.utils import steam_api  # noqa: E402
+from src.app.utils.steam_api import MAX_BACKOFF, SteamApiClient, TokenBucket  # noqa: E402
+
+
+class FakeClock:
+    """Stands in for the ``time`` module: sleeping just advances the clock"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(steam_api, 'time', clock)
+    return clock
+
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    """Answers 429 with ``retry_after`` until ``throttle`` requests have been refused"""
+    protocol_version = 'HTTP/1.1'
+    throttle = 0
+    retry_after = '2'
+    seen = 0
+
+    def do_GET(self):
+        cls = type(self)
+        cls.seen += 1
+        if cls.seen <= cls.throttle:
+            self.send_response(429)
+            self.send_header('Retry-After', cls.retry_after)
+            body = b''
+        else:
+            self.send_response(200)
+            body = b'{"440": {"success": true, "data": {"name": "Team Fortress 2"}}}'
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), ThrottlingHandler)
+    ThrottlingHandler.seen = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/api/appdetails"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_token_bucket_allows_a_burst_then_paces(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquire() == pytest.approx(0.5)
+    clock.now += 10  # Refills, but never past capacity
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() > 0
+
+
+def test_retries_429_honouring_retry_after(clock, server, monkeypatch):
+    monkeypatch.setattr(ThrottlingHandler, 'throttle', 2)
+    monkeypatch.setattr(ThrottlingHandler, 'retry_after', '2')
+    client = SteamApiClient(store_url=server, rate=1000, burst=10, max_retries=3)
+    try:
+        assert client.fetch_app_name("440") == "Team Fortress 2"
+        assert clock.sleeps == [2.0, 2.0]
+        stats = client.stats.snapshot()
+        assert (stats['requests'], stats['retries'], stats['throttled']) == (3, 2, 2)
+    finally:
+        client.close()
+
+
+def test_retry_after_is_capped(clock, server, monkeypatch):
+    monkeypatch.setattr(ThrottlingHandler, 'throttle', 1)
+    monkeypatch.setattr(ThrottlingHandler, 'retry_after', '86400')
+    client = SteamApiClient(store_url=server, rate=1000, burst=10, max_retries=1)
+    try:
+        assert client.fetch_app_name("440") == "Team Fortress 2"
+        assert clock.sleeps == [MAX_BACKOFF]
+    finally:
+        client.close()
+
+
+def test_gives_up_after_max_retries(clock, server, monkeypatch):
+    monkeypatch.setattr(ThrottlingHandler, 'throttle', 10)
+    client = SteamApiClient(store_url=server, rate=1000, burst=10, max_retries=2)
+    try:
+        response = client.get(server)
+        assert response.status_code == 429
+        assert ThrottlingHandler.seen == 3
+    finally:
+        client.close()